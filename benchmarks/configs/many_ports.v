@@ -0,0 +1,68 @@
+// Placeholder module for the many_csr_ports benchmark, only its interface matters.
+module many_ports #(parameter DEPTH = 4) (
+    input  clk,
+    input  rst,
+    input  [7:0] ctl2,
+    output sts3,
+    input  [3:0] ctl4,
+    output [15:0] sts5,
+    input  [7:0] ctl6,
+    output [3:0] sts7,
+    input  [31:0] ctl8,
+    output sts9,
+    input  [3:0] ctl10,
+    output [7:0] sts11,
+    input  [3:0] ctl12,
+    output sts13,
+    input  ctl14,
+    output sts15,
+    input  [31:0] ctl16,
+    output sts17,
+    input  [15:0] ctl18,
+    output [31:0] sts19,
+    input  ctl20,
+    output sts21,
+    input  [7:0] ctl22,
+    output sts23,
+    input  [7:0] ctl24,
+    output [3:0] sts25,
+    input  ctl26,
+    output [15:0] sts27,
+    input  [3:0] ctl28,
+    output sts29,
+    input  [7:0] ctl30,
+    output sts31,
+    input  ctl32,
+    output [7:0] sts33,
+    input  [3:0] ctl34,
+    output sts35,
+    input  [31:0] ctl36,
+    output sts37,
+    input  ctl38,
+    output [3:0] sts39,
+    input  [3:0] ctl40,
+    output sts41,
+    input  [15:0] ctl42,
+    output sts43,
+    input  [31:0] ctl44,
+    output [7:0] sts45,
+    input  [7:0] ctl46,
+    output [31:0] sts47,
+    input  [31:0] ctl48,
+    output sts49,
+    input  ctl50,
+    output [15:0] sts51,
+    input  ctl52,
+    output [7:0] sts53,
+    input  [3:0] ctl54,
+    output [7:0] sts55,
+    input  [31:0] ctl56,
+    output [3:0] sts57,
+    input  ctl58,
+    output [31:0] sts59,
+    input  ctl60,
+    output sts61,
+    input  [3:0] ctl62,
+    output [15:0] sts63
+);
+endmodule
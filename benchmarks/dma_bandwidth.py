@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import itertools
+import argparse
+import json
+import time
+import sys
+import os
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR  = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from migen import *
+from migen.sim import run_simulation
+from litex.soc.interconnect import wishbone
+
+from generator_aux_DMA import WishboneDmaBench
+
+""" DMA bandwidth sweep for WishboneDmaBench (generator_aux_DMA.py)
+
+    Simulates the benchmark path with Migen's simulator: WishboneDmaBench, its two Wishbone
+    masters, and two wishbone.SRAMs as source and destination memory, connected by the same
+    interconnect LiteX builds for the SoC (bus_interconnect: "shared" or "crossbar").
+    No CPU and no SoC are involved; the CSRs are written directly from the testbench,
+    in the same order the firmware would use (see WishboneDmaBench).
+
+    For every combination of interconnect, data_width, fifo_depth, burst length and transfer
+    size, a block is copied from the source to the destination memory, the copy is checked,
+    and the counters of DMABenchCore are reported as a table:
+        $ python3 benchmarks/dma_bandwidth.py
+        $ python3 benchmarks/dma_bandwidth.py --data-width 8 32 --fifo-depth 16 256 --size 256 4096
+        $ python3 benchmarks/dma_bandwidth.py --data-width 32 --burst-length 0 8 32
+        $ python3 benchmarks/dma_bandwidth.py --interconnect shared crossbar
+        $ python3 benchmarks/dma_bandwidth.py --bus-width 32 128 --data-width 128
+    bytes/cycle is the transfer size over the total transfer cycles. Per master, the testbench
+    counts the acknowledged beats and the cycles it waited for the bus (rd/wr wait), and
+    DMABenchCore counts the cycles the master was active (first cyc to last ack, rd/wr active):
+    rd/wr B/cycle are the bytes of a master over its own active cycles. On the shared
+    interconnect, the reader and the writer take turns; with the crossbar, they only wait for
+    each other if they access the same memory. With more than one interconnect, a second table
+    shows them side by side.
+"""
+
+BUS_DATA_WIDTHS = [32]
+
+INTERCONNECTS = {
+    "shared"   : wishbone.InterconnectShared,
+    "crossbar" : wishbone.Crossbar,
+}
+
+class BenchSystem(Module):
+    def __init__(self, data_width, fifo_depth, burst_length, mem_size, interconnect="shared", bus_width=32):
+        self.submodules.dut = dut = WishboneDmaBench(
+            data_width      = data_width,
+            fifo_depth      = fifo_depth,
+            burst_length    = burst_length,
+            bus_data_width  = bus_width,
+        )
+        self.bus_width = bus_width
+        words = mem_size//2//(bus_width//8)
+        #the same 32-bit pattern as before, several of them per word on wider buses
+        init = [sum(((0x01020304*(n + 1)) & 0xffffffff) << 32*k for k, n in enumerate(range(i*bus_width//32, (i + 1)*bus_width//32)))
+            for i in range(words)]
+        #source in the first half of the address space, destination in the second one. Both
+        #memories are mem_size large, so the destination is addressed the same way as before.
+        slaves = []
+        for name, match in [("src", lambda a: a < words), ("dst", lambda a: a >= words)]:
+            #like the integrated RAMs with bus_bursting: "True" if bursts are used
+            bus = wishbone.Interface(data_width=bus_width, address_width=32, addressing="word",
+                bursting=burst_length is not None)
+            setattr(self.submodules, name, wishbone.SRAM(mem_size, init=init if name == "src" else None, bus=bus))
+            slaves.append((match, bus))
+        self.submodules.interconnect = INTERCONNECTS[interconnect](
+            masters = [dut.read_bus, dut.write_bus],
+            slaves  = slaves,
+        )
+        self.init = init
+
+def bench(system, size, data_width, result, timeout):
+    dut = system.dut
+    reader = dut.mem2x.dma
+    writer = dut.x2mem.dma
+    words = size*8//data_width
+    yield from writer._base.write(size)
+    yield from writer._length.write(size)
+    yield from writer._enable.write(1)
+    yield from reader._base.write(0)
+    yield from reader._length.write(size)
+    yield from dut.core.length.write(words)
+    yield from dut.core.start.write(1)
+    yield from reader._enable.write(1)
+    #acknowledged beats and wait cycles per master
+    masters = {"rd": dut.read_bus, "wr": dut.write_bus}
+    beats = {name: 0 for name in masters}
+    waits = {name: 0 for name in masters}
+    for _ in range(timeout):
+        if (yield dut.core.done.status) and (yield writer._done.status):
+            break
+        for name, bus in masters.items():
+            if (yield bus.cyc) and (yield bus.stb):
+                if (yield bus.ack):
+                    beats[name] += 1
+                else:
+                    waits[name] += 1
+        yield
+    else:
+        raise RuntimeError(f"DMA benchmark timed out after {timeout} cycles")
+    for counter in ["latency", "cycles", "sink_stalls", "source_stalls"]:
+        result[counter] = (yield getattr(dut.core, counter).status)
+    result["rd_active"] = (yield dut.core.read_active.status)
+    result["wr_active"] = (yield dut.core.write_active.status)
+    for name in masters:
+        result[f"{name}_bytes"] = beats[name]*system.bus_width//8
+        result[f"{name}_wait"] = waits[name]
+    copied = []
+    words = size//(system.bus_width//8)
+    for i in range(words):
+        copied.append((yield system.dst.mem[words + i]))
+    result["ok"] = copied == system.init[:len(copied)]
+
+def run_point(interconnect, bus_width, data_width, fifo_depth, burst_length, size):
+    system = BenchSystem(data_width, fifo_depth, burst_length, mem_size=2*size, interconnect=interconnect,
+        bus_width=bus_width)
+    result = {"interconnect": interconnect, "bus_width": bus_width, "data_width": data_width, "fifo_depth": fifo_depth,
+        "burst_length": burst_length, "size": size}
+    start = time.perf_counter()
+    run_simulation(system, bench(system, size, data_width, result, timeout=64*size + 1000))
+    result["bytes_per_cycle"] = size/result["cycles"]
+    for name in ["rd", "wr"]:
+        result[f"{name}_bytes_per_cycle"] = result[f"{name}_bytes"]/max(1, result[f"{name}_active"])
+    result["sim_s"] = time.perf_counter() - start
+    return result
+
+def print_table(results):
+    header = f"{'interconnect':>12} {'bus':>4} {'data_width':>10} {'fifo_depth':>10} {'burst':>6} {'size':>8} {'latency':>8} " \
+             f"{'cycles':>8} {'sink_st':>8} {'src_st':>8} {'B/cycle':>8} {'rd act':>8} {'wr act':>8} " \
+             f"{'rd B/c':>7} {'wr B/c':>7} {'rd wait':>8} {'wr wait':>8} {'check':>6}"
+    print(header)
+    print("-"*len(header))
+    for r in results:
+        print(f"{r['interconnect']:>12} {r['bus_width']:>4} {r['data_width']:>10} {r['fifo_depth']:>10} {r['burst_length'] or '-':>6} "
+              f"{r['size']:>8} {r['latency']:>8} {r['cycles']:>8} {r['sink_stalls']:>8} {r['source_stalls']:>8} "
+              f"{r['bytes_per_cycle']:>8.3f} {r['rd_active']:>8} {r['wr_active']:>8} "
+              f"{r['rd_bytes_per_cycle']:>7.3f} {r['wr_bytes_per_cycle']:>7.3f} "
+              f"{r['rd_wait']:>8} {r['wr_wait']:>8} {'ok' if r['ok'] else 'FAIL':>6}")
+
+def print_comparison(results):
+    #one row per point, B/cycle (total, rd, wr) of every interconnect next to each other
+    interconnects = list(dict.fromkeys(r["interconnect"] for r in results))
+    if len(interconnects) < 2:
+        return
+    points = {}
+    for r in results:
+        key = (r["bus_width"], r["data_width"], r["fifo_depth"], r["burst_length"], r["size"])
+        points.setdefault(key, {})[r["interconnect"]] = r
+    header = f"{'bus':>4} {'data_width':>10} {'fifo_depth':>10} {'burst':>6} {'size':>8}" + \
+        "".join(f" | {i + ' B/c':>14} {'rd':>7} {'wr':>7}" for i in interconnects)
+    print()
+    print(header)
+    print("-"*len(header))
+    for (bus_width, data_width, fifo_depth, burst_length, size), by_interconnect in points.items():
+        line = f"{bus_width:>4} {data_width:>10} {fifo_depth:>10} {burst_length or '-':>6} {size:>8}"
+        for i in interconnects:
+            r = by_interconnect.get(i)
+            if r is None:
+                line += f" | {'-':>14} {'-':>7} {'-':>7}"
+            else:
+                line += f" | {r['bytes_per_cycle']:>14.3f} {r['rd_bytes_per_cycle']:>7.3f} {r['wr_bytes_per_cycle']:>7.3f}"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated DMA bandwidth sweep.")
+    parser.add_argument("--interconnect", nargs="+", default=list(INTERCONNECTS), choices=list(INTERCONNECTS),
+        help="Interconnects between the DMA masters and the memories.")
+    parser.add_argument("--bus-width", type=int, nargs="+", default=BUS_DATA_WIDTHS,
+        help="Data widths of the Wishbone bus (bus_data_width).")
+    parser.add_argument("--data-width", type=int, nargs="+", default=[8, 32], help="Stream data widths.")
+    parser.add_argument("--fifo-depth", type=int, nargs="+", default=[16, 256], help="FIFO depths.")
+    parser.add_argument("--burst-length", type=int, nargs="+", default=[0],
+        help="Burst lengths of the DMA engines, 0 for LiteX's single-beat engines.")
+    parser.add_argument("--size", type=int, nargs="+", default=[128, 1024], help="Transfer sizes in bytes.")
+    parser.add_argument("--output", default=None, help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    results = []
+    sweep = itertools.product(args.interconnect, args.bus_width, args.data_width, args.fifo_depth,
+        args.burst_length, args.size)
+    for interconnect, bus_width, data_width, fifo_depth, burst_length, size in sweep:
+        if (size*8) % max(data_width, bus_width):
+            raise SystemExit(f"Transfer size {size} is not a multiple of the data/bus width.")
+        results.append(run_point(interconnect, bus_width, data_width, fifo_depth, burst_length or None, size))
+    print_table(results)
+    print_comparison(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=1)
+    sys.exit(0 if all(r["ok"] for r in results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import subprocess
+import statistics
+import argparse
+import tempfile
+import time
+import json
+import sys
+import os
+
+""" Generation benchmark suite with regression thresholds
+
+    Runs every config in benchmarks/configs through litex_generator.generate() and measures:
+        -latency_s      wall time of generate() (imports excluded, see cold_start_s)
+        -cold_start_s   wall time of the whole process, including LiteX/Migen imports
+        -peak_rss_kb    peak resident set size of the generating process
+        -verilog_bytes  size of the emitted top-level Verilog
+        -csr_count      number of CSR registers in csr.json
+    Every run happens in a fresh process, so memory and cold start numbers are comparable.
+    Latency is the minimum over --repeat runs, the other metrics are deterministic.
+
+    The results are compared against baseline.json; a metric that grows by more than its
+    threshold (fraction of the baseline value) counts as a regression and makes the script
+    exit with 1. --update-baseline stores the current results instead. Nothing here needs
+    network access, so it runs in the generator container as-is:
+        $ python3 benchmarks/run_benchmarks.py
+        $ python3 benchmarks/run_benchmarks.py --threshold latency_s=0.5 --repeat 5
+"""
+
+BENCH_DIR     = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR      = os.path.dirname(BENCH_DIR)
+CONFIG_DIR    = os.path.join(BENCH_DIR, "configs")
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+
+#timing is noisy, sizes and counts are not
+DEFAULT_THRESHOLDS = {
+    "latency_s"     : 0.25,
+    "cold_start_s"  : 0.25,
+    "peak_rss_kb"   : 0.15,
+    "verilog_bytes" : 0.05,
+    "csr_count"     : 0.0,
+}
+
+# Worker (one generation in a fresh process) ------------------------------------------------------
+
+def run_worker(config_file, output_dir):
+    sys.path.insert(0, REPO_DIR)
+    import litex_generator
+
+    #relative paths in the config (external module sources) are relative to the config
+    os.chdir(os.path.dirname(os.path.abspath(config_file)))
+    args = litex_generator.read_config_file(config_file)
+    args["output_dir"] = output_dir
+    args["profile"] = False
+    profiler = litex_generator.GenerationProfiler()
+    dirs = litex_generator.generate(args, profiler)
+    report = profiler.report()
+
+    with open(os.path.join(dirs["output_dir"], "csr.json")) as f:
+        csr = json.load(f)
+    result = {
+        "latency_s"     : report["total"]["wall_s"],
+        "peak_rss_kb"   : report["total"]["peak_rss_kb"],
+        "verilog_bytes" : os.path.getsize(os.path.join(dirs["gateware_dir"], f"{args['name']}.v")),
+        "csr_count"     : len(csr.get("csr_registers", {})),
+    }
+    print("BENCHMARK_RESULT " + json.dumps(result))
+
+def run_config(config_file, repeat):
+    runs = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as output_dir:
+            cmd = [sys.executable, os.path.abspath(__file__), "--worker", config_file, output_dir]
+            start = time.perf_counter()
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+            cold_start = time.perf_counter() - start
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stdout[-2000:] + proc.stderr[-4000:])
+            raise RuntimeError(f"Generation failed for {config_file}")
+        line = [l for l in proc.stdout.splitlines() if l.startswith("BENCHMARK_RESULT ")][-1]
+        result = json.loads(line[len("BENCHMARK_RESULT "):])
+        result["cold_start_s"] = cold_start
+        runs.append(result)
+    metrics = dict(runs[-1])
+    metrics["latency_s"]    = min(r["latency_s"] for r in runs)
+    metrics["cold_start_s"] = min(r["cold_start_s"] for r in runs)
+    metrics["peak_rss_kb"]  = statistics.median(r["peak_rss_kb"] for r in runs)
+    return metrics
+
+# Comparison --------------------------------------------------------------------------------------
+
+def compare(results, baseline, thresholds):
+    regressions = []
+    for name, metrics in results.items():
+        if name not in baseline:
+            print(f"{name}: no baseline")
+            continue
+        for metric, value in metrics.items():
+            base = baseline[name].get(metric)
+            if base is None:
+                continue
+            limit = base * (1 + thresholds.get(metric, 0.0))
+            change = (value - base) / base if base else 0.0
+            status = "REGRESSION" if value > limit else "ok"
+            print(f"{name:24} {metric:14} {value:14.4f} (baseline {base:14.4f}, {change:+7.1%}) {status}")
+            if value > limit:
+                regressions.append((name, metric, value, base))
+    return regressions
+
+def parse_thresholds(items):
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for item in items or []:
+        if "=" in item:
+            metric, value = item.split("=", 1)
+            if metric not in thresholds:
+                raise SystemExit(f"Unknown metric '{metric}', expected one of {list(thresholds)}")
+            thresholds[metric] = float(value)
+        else: #a plain number applies to all metrics
+            thresholds = {metric: float(item) for metric in thresholds}
+    return thresholds
+
+def main():
+    parser = argparse.ArgumentParser(description="SystemBuilder generation benchmarks.")
+    parser.add_argument("configs", nargs="*", help="Configs to run (default: all in benchmarks/configs).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per config, latency is the minimum.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store results as the new baseline.")
+    parser.add_argument("--threshold", action="append", help="METRIC=FRACTION or FRACTION for all metrics.")
+    parser.add_argument("--output", default=None, help="Also write the results to this JSON file.")
+    parser.add_argument("--worker", nargs=2, metavar=("CONFIG", "OUTPUT_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(*args.worker)
+        return
+
+    configs = args.configs or sorted(
+        os.path.join(CONFIG_DIR, f) for f in os.listdir(CONFIG_DIR) if f.endswith(".yaml"))
+    results = {}
+    for config_file in configs:
+        name = os.path.splitext(os.path.basename(config_file))[0]
+        print(f"Running {name}...", flush=True)
+        results[name] = run_config(os.path.abspath(config_file), args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=1)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline first.")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, parse_thresholds(args.threshold))
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond threshold.")
+        sys.exit(1)
+    print("No regressions.")
+
+if __name__ == "__main__":
+    main()
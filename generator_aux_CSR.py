@@ -1,150 +1,378 @@
-#!/usr/bin/env python3
-
-#
-# This file is not part of LiteX.
-# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de> 
-#
-# SPDX-License-Identifier: BSD-2-Clause
-
-import pdb  #TODO:      REMOVE when no longer necessary!
-import shutil
-import yaml
-import sys
-import os
-
-from litex.soc.interconnect.csr import * 
-
-#TODO: Add check to prevent issue due to duplicated port names?
-#That should not happen, but it would be nice opportunity to alert users to design errors...
-class GenericCSR (Module, AutoCSR):
-    """
-    I would like to support more dynamic interfaces anyway and a good generic interface generation
-    combined with some additional tool/component, might be a nice way to do it. I don't have to
-    use litex for everything after all.
-    Having implemented this, I could potentially develop a workflow based on Verilog wrappers. These
-    could potentially be automatically generated.
-    """
-    def __init__(self, ports, parameters):
-        for k in ports:
-            #"in" and "out" refers to the ports at the Verilog Module
-            #so "in" means data is written from CPU to Module
-            reg_name = ports[k]['name']
-            connector = "con_"+ reg_name
-            direction = ports[k]['direction']
-            reg_width = ports[k]['size']
-            #if reg_name in ["clk", "clock"]:
-                #TODO: Add special handling of clock ports?
-            if direction == "in":
-                setattr(self, reg_name, CSRStorage(reg_width, name=reg_name))
-                setattr(self, connector, Signal(reg_width, name=connector))
-                self.comb += getattr(self, connector).eq(getattr(self, reg_name).storage)
-            elif direction == "out":
-                setattr(self, reg_name, CSRStatus(reg_width, name=reg_name))
-                setattr(self, connector, Signal(reg_width, name=connector))
-                self.sync += getattr(self, reg_name).status.eq(getattr(self, connector)) 
-            else:
-                print("Missing directions for external ports!")
-
-class GenericVlogModuleCSR (Module, AutoCSR):
-    def __init__(self, parameters, ports, platform, module_name, instance_name, vlog_src):
-        modports = dict()
-        if parameters is not None:
-            modparams = parameters.items() #make list of key value pairs
-            for k in modparams: #read parameters and prepare argument for instance class
-                param_name ="p_"+k[0]
-                modports[param_name] = k[1]
-        for k in ports:
-            reg_name = ports[k]['name']
-            direction = ports[k]['direction']
-            reg_width = ports[k]['size']
-
-            csr_name = "csr_of_"+ reg_name
-            #check direction of every port, create appropriate CSR and prefixed name for instance class
-            if direction == "in":
-                if reg_name == "clk" or reg_name == "clock": #this is quite rudimentary, but good enough for now
-                    setattr(self, reg_name, ClockSignal())
-                    inst_port_name = "i_"+reg_name
-                    modports[inst_port_name] = getattr(self, reg_name)
-                elif reg_name == "rst" or reg_name == "reset":
-                    setattr(self, reg_name, ResetSignal())
-                    inst_port_name = "i_"+reg_name
-                    modports[inst_port_name] = getattr(self, reg_name)
-                else:
-                    setattr(self, reg_name, CSRStorage(reg_width, name=csr_name)) 
-                    inst_port_name = "i_"+reg_name
-                    modports[inst_port_name] = getattr(self, reg_name).storage
-            elif direction == "out":
-                setattr(self, reg_name, CSRStatus(reg_width, name=csr_name))
-                inst_port_name = "o_"+reg_name
-                modports[inst_port_name] = getattr(self, reg_name).status
-            else:
-                print("ERROR IN THE CSR INTERFACE GENERATION!")
-
-        # Instantiate the Verilog module        
-        self.specials += Instance(module_name,
-            name = instance_name,
-            **modports
-        )
-
-"""
-Old method.
-#"Parser" mehtod for port sizes.
-#TODO: Update this method to be able to handle more complex expressions!
-     
-def parse_port_size (ports, parameters):
-    if parameters is not None:
-        modparams = parameters.items() #make list of key value pairs
-    for k in ports:
-        port_width = ports[k]['size']
-        if not isinstance(port_width, str):
-            raise TypeError('Port size must be string! Should look like: "size" : "1" in config file.')
-        #Simple handling for size 1 ports
-        if port_width == "1":
-            port_width = int(port_width); 
-            ports[k]['size'] = port_width
-        else:
-        #For larger ports, split string at ':' and remove brackets
-            if port_width.startswith('[') and port_width.endswith(']'):
-                #remove brackets and split
-                port_width = port_width.lstrip('[')   
-                port_width = port_width.rstrip(']')
-                parts = port_width.rsplit(':')
-                #remove leading and trailing spaces
-                parts[0] = parts[0].strip()
-                parts[1] = parts[1].strip()
-                #Check if left side is number only. If so, convert to int.
-                if parts[0].isdigit():      
-                    parts[0] = int(parts[0])
-                    #handle tedious case of parameterized size (usually PARAM-1, but not always)
-                    #For now, - and + shall be supported, anything beyond that is witchcraft anyway ;-)
-                else:
-                    for i in parts[0]:
-                        if i == '-':
-                            subparts = parts[0].rsplit('-')
-                            subparts[0]=subparts[0].strip() #remove spaces
-                            subparts[1]=subparts[1].strip()
-                            for i in modparams:
-                                if subparts[0] == i[0]:
-                                    subparts[0] = i[1]
-                                    parts[0] = int(subparts[0]) - int(subparts[1])
-                                    break
-                        if i == '+':
-                            subparts = parts[0].rsplit('+')
-                            subparts[0]=subparts[0].strip() #remove spaces
-                            subparts[1]=subparts[1].strip()
-                            for i in modparams:
-                                if subparts[0] == i[0]:
-                                    subparts[0] = i[1]
-                                    parts[0] = int(subparts[0]) + int(subparts[1])
-                                    break                                
-                #Now we get to the other side of the separator
-                #This assumes that there is always just a number after the ':'.
-                #TODO: Add support for parameters here? Does anyone need that? 
-                parts[1] = int(parts[1])
-                port_width = parts[0] + 1 - parts[1];
-                #write port size as integer into collection
-                ports[k]['size'] = port_width
-            else:
-                raise ValueError("Port size should be formatted '[x:y]' or '1'")
-    return ports
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de> 
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import pdb  #TODO:      REMOVE when no longer necessary!
+import shutil
+import json
+import yaml
+import sys
+import os
+
+from litex.build.generic_platform import Pins
+from litex.soc.interconnect.csr import * 
+from litex.soc.interconnect.csr_eventmanager import *
+from litex.soc.interconnect import wishbone, axi
+from litex.soc.integration.soc import SoCRegion
+from migen.genlib.cdc import BusSynchronizer
+
+from generator_aux_DMA import StreamPortDMA
+
+#"stream" ports (type: stream in the config) are AXI-Stream like: <name>_tdata/_tvalid/_tready/_tlast
+#and <name>_aclk if they have their own clock (async: True). Each gets a DMA channel (StreamPortDMA),
+#named like the port, and an interrupt (ev.<name>) when a descriptor asks for one.
+#"out" ports can have an interrupt as well (irq: edge/level/change in the config).
+def make_stream_port(soc, instance_name, port, burst_length=None, clock_domain="sys"):
+    if soc is None:
+        raise ValueError(f"Stream port {port['name']} of {instance_name} needs a SoC for its DMA channel.")
+    return StreamPortDMA(soc, name=instance_name + "_" + port['name'], direction=port['direction'],
+        data_width   = port['size'],
+        fifo_depth   = port.get('fifo_depth', 16),
+        async_fifo   = port.get('async', False),
+        burst_length = burst_length,
+        clock_domain = clock_domain,
+    )
+
+#Clock domains (clock_domain: <name> in the config): the CSRs stay in sys, the ports of the module are
+#in its own domain. Every CSR value crosses with a BusSynchronizer (all bits of a value arrive together),
+#stream ports cross in the AsyncFIFO of their DMA channel.
+def cross(module, signal, idomain, odomain):
+    """Returns signal (driven in idomain) as seen in odomain."""
+    if idomain == odomain:
+        return signal
+    synchronizer = BusSynchronizer(len(signal), idomain, odomain)
+    module.submodules += synchronizer
+    module.comb += synchronizer.i.eq(signal)
+    return synchronizer.o
+
+def add_event_sources(module, events):
+    """One EventManager for all interrupts of a wrapper; events is name -> (mode, signal):
+        -pulse   signal is a one cycle pulse already (DMA channels)
+        -edge    any bit of signal rises
+        -change  signal changes
+        -level   signal is not 0, pending as long as that holds
+    """
+    if not events:
+        return
+    module.submodules.ev = EventManager()
+    for name, (mode, signal) in events.items():
+        if mode == "level":
+            source = EventSourceLevel(name=name)
+            module.comb += source.trigger.eq(signal != 0)
+        elif mode == "pulse":
+            source = EventSourcePulse(name=name)
+            module.comb += source.trigger.eq(signal)
+        else:
+            source = EventSourcePulse(name=name)
+            previous = Signal.like(signal)
+            module.sync += previous.eq(signal)
+            if mode == "edge":
+                module.comb += source.trigger.eq((signal & ~previous) != 0)
+            else:
+                module.comb += source.trigger.eq(signal != previous)
+        setattr(module.ev, name, source)
+    module.ev.finalize()
+
+#CSR packing (pack_csr: True in the config): narrow ports of the same direction share CSR words,
+#every port is a CSRField of its word (in_word<n>/out_word<n>), so the bitfields show up in csr.h
+#and, via add_csr_fields(), in csr.json. "in" values only reach the module when the commit
+#register is written, so writes spread over several words take effect in the same cycle.
+def pack_ports(ports, word_width):
+    #first fit in config order, ports wider than a word get words of their own
+    words = []
+    for port in ports:
+        for word in words:
+            if sum(p['size'] for p in word) + port['size'] <= word_width:
+                word.append(port)
+                break
+        else:
+            words.append([port])
+    return words
+
+def add_packed_csrs(module, ports, word_width=32):
+    """Returns the signal of every port by name: "in" ports are driven by it, "out" ports drive it."""
+    signals = {}
+    if any(p['direction'] == "in" for p in ports):
+        module.commit = CSR(name="commit")
+    for direction in ["in", "out"]:
+        words = pack_ports([p for p in ports if p['direction'] == direction], word_width)
+        for n, word in enumerate(words):
+            fields = [CSRField(p['name'], size=p['size'], description=f"Port {p['name']}.") for p in word]
+            if direction == "in":
+                csr = CSRStorage(fields=fields, name=f"in_word{n}")
+                value = Signal(csr.size, name=f"in_word{n}_value")
+                module.sync += If(module.commit.re, value.eq(csr.storage))
+                for field in csr.fields.fields:
+                    signals[field.name] = value[field.offset:field.offset + field.size]
+            else:
+                csr = CSRStatus(fields=fields, name=f"out_word{n}")
+                for p in word:
+                    signals[p['name']] = Signal(p['size'], name=p['name'])
+                    #CSRStatus registers its fields itself
+                    module.comb += getattr(csr.fields, p['name']).eq(signals[p['name']])
+            setattr(module, f"{direction}_word{n}", csr)
+    return signals
+
+def add_csr_fields(csr_json, soc):
+    """LiteX doesn't export CSRFields to csr.json, add them to the registers that have fields."""
+    with open(csr_json) as f:
+        d = json.load(f)
+    for name, region in soc.csr.regions.items():
+        if not isinstance(region.obj, list):
+            continue
+        for csr in region.obj:
+            entry = d["csr_registers"].get(name + "_" + csr.name)
+            if entry is not None and hasattr(csr, "fields"):
+                entry["fields"] = {f.name: {"offset": f.offset, "size": f.size} for f in csr.fields.fields}
+    with open(csr_json, "w") as f:
+        json.dump(d, f, indent=4)
+
+#Register window mode (bus_interface: wishbone/axi-lite in the config): the instantiated module gets a
+#slave interface of the system bus width on its own bus region, so the CPU and DMA access it directly
+#instead of going through the CSR bridge. The signals are named like LiteX names them for pads
+#(get_ios): s_wb_adr, s_wb_dat_w, ... and s_axil_awvalid, s_axil_awaddr, ... The address is the
+#offset into the window: a word address for Wishbone, a byte address for AXI-Lite.
+def bus_window_ports(bus, window_size):
+    modports = {}
+    if isinstance(bus, wishbone.Interface):
+        for name, _, direction in wishbone._layout:
+            signal = getattr(bus, name)
+            if name == "adr":
+                signal = signal[:log2_int(window_size//(bus.data_width//8))]
+            modports[("i_s_wb_" if direction == DIR_M_TO_S else "o_s_wb_") + name] = signal
+    else:
+        for channel in ["aw", "w", "b", "ar", "r"]:
+            to_slave = channel in ["aw", "w", "ar"]
+            endpoint = getattr(bus, channel)
+            signals = [("valid", endpoint.valid, to_slave), ("ready", endpoint.ready, not to_slave)]
+            for name, _ in endpoint.description.payload_layout:
+                signal = getattr(endpoint, name)
+                if name == "addr":
+                    signal = signal[:log2_int(window_size)]
+                signals.append((name, signal, to_slave))
+            for name, signal, is_input in signals:
+                modports[("i_s_axil_" if is_input else "o_s_axil_") + channel + name] = signal
+    return modports
+
+def add_bus_window(soc, name, standard, origin=None, size=0x1000):
+    bus = {
+        "wishbone" : wishbone.Interface(data_width=soc.bus.data_width, adr_width=soc.bus.get_address_width(standard="wishbone")),
+        "axi-lite" : axi.AXILiteInterface(data_width=soc.bus.data_width, address_width=soc.bus.address_width),
+    }[standard]
+    soc.bus.add_slave(name=name, slave=bus, region=SoCRegion(origin=origin, size=size, cached=False))
+    return bus
+
+#TODO: Add check to prevent issue due to duplicated port names?
+#That should not happen, but it would be nice opportunity to alert users to design errors...
+class GenericCSR (Module, AutoCSR):
+    """
+    I would like to support more dynamic interfaces anyway and a good generic interface generation
+    combined with some additional tool/component, might be a nice way to do it. I don't have to
+    use litex for everything after all.
+    Having implemented this, I could potentially develop a workflow based on Verilog wrappers. These
+    could potentially be automatically generated.
+    """
+    def __init__(self, ports, parameters, soc=None, instance_name="", burst_length=None, pack=False,
+        clock_domain="sys"):
+        events = {}
+        packed = []
+        outputs = {} #"out" ports as seen in sys, for the interrupts
+        for k in ports:
+            #"in" and "out" refers to the ports at the Verilog Module
+            #so "in" means data is written from CPU to Module
+            reg_name = ports[k]['name']
+            connector = "con_"+ reg_name
+            direction = ports[k]['direction']
+            reg_width = ports[k]['size']
+            #if reg_name in ["clk", "clock"]:
+                #TODO: Add special handling of clock ports?
+            if ports[k].get('type') == "stream":
+                #the connector is the stream endpoint, the top-level connects it to the pads
+                channel = make_stream_port(soc, instance_name, ports[k], burst_length, clock_domain)
+                setattr(self.submodules, reg_name, channel)
+                setattr(self, connector, channel.endpoint)
+                events[reg_name] = ("pulse", channel.irq)
+            elif pack:
+                packed.append(ports[k])
+            elif direction == "in":
+                setattr(self, reg_name, CSRStorage(reg_width, name=reg_name))
+                setattr(self, connector, Signal(reg_width, name=connector))
+                self.comb += getattr(self, connector).eq(cross(self, getattr(self, reg_name).storage, "sys", clock_domain))
+            elif direction == "out":
+                setattr(self, reg_name, CSRStatus(reg_width, name=reg_name))
+                setattr(self, connector, Signal(reg_width, name=connector))
+                outputs[reg_name] = cross(self, getattr(self, connector), clock_domain, "sys")
+                self.sync += getattr(self, reg_name).status.eq(outputs[reg_name]) 
+            else:
+                print("Missing directions for external ports!")
+        if packed:
+            signals = add_packed_csrs(self, packed, soc.csr.data_width if soc is not None else 32)
+            for port in packed:
+                name = port['name']
+                if port['direction'] == "in":
+                    setattr(self, "con_" + name, cross(self, signals[name], "sys", clock_domain))
+                elif clock_domain == "sys":
+                    setattr(self, "con_" + name, signals[name])
+                    outputs[name] = signals[name]
+                else:
+                    setattr(self, "con_" + name, Signal(port['size'], name="con_" + name))
+                    self.comb += signals[name].eq(cross(self, getattr(self, "con_" + name), clock_domain, "sys"))
+                    outputs[name] = signals[name]
+        for port in ports.values():
+            if port.get('irq'):
+                events[port['name']] = (port['irq'], outputs[port['name']])
+        add_event_sources(self, events)
+
+class GenericVlogModuleCSR (Module, AutoCSR):
+    def __init__(self, parameters, ports, platform, module_name, instance_name, vlog_src, soc=None, burst_length=None, pack=False,
+        bus_interface=None, bus_origin=None, bus_size=0x1000, clock_domain="sys"):
+        events = {}
+        packed = []
+        modports = dict()
+        if parameters is not None:
+            modparams = parameters.items() #make list of key value pairs
+            for k in modparams: #read parameters and prepare argument for instance class
+                param_name ="p_"+k[0]
+                modports[param_name] = k[1]
+        for k in ports:
+            reg_name = ports[k]['name']
+            direction = ports[k]['direction']
+            reg_width = ports[k]['size']
+
+            csr_name = "csr_of_"+ reg_name
+            #check direction of every port, create appropriate CSR and prefixed name for instance class
+            if ports[k].get('type') == "stream":
+                channel = make_stream_port(soc, instance_name, ports[k], burst_length, clock_domain)
+                setattr(self.submodules, reg_name, channel)
+                events[reg_name] = ("pulse", channel.irq)
+                ep = channel.endpoint
+                i, o = ("i_", "o_") if direction == "in" else ("o_", "i_")
+                modports[i + reg_name + "_tdata"]  = ep.data
+                modports[i + reg_name + "_tvalid"] = ep.valid
+                modports[i + reg_name + "_tlast"]  = ep.last
+                modports[o + reg_name + "_tready"] = ep.ready
+                if ports[k].get('async'):
+                    #the stream clock comes from outside, like the system clock
+                    aclk_name = instance_name + "_" + reg_name + "_aclk"
+                    platform.add_extension([(aclk_name, 0, Pins(1))])
+                    aclk = platform.request(aclk_name)
+                    self.comb += channel.cd.clk.eq(aclk)
+                    modports["i_" + reg_name + "_aclk"] = aclk
+            elif pack and reg_name not in ["clk", "clock", "rst", "reset"]:
+                packed.append(ports[k])
+            elif direction == "in":
+                if reg_name == "clk" or reg_name == "clock": #this is quite rudimentary, but good enough for now
+                    setattr(self, reg_name, ClockSignal(clock_domain))
+                    inst_port_name = "i_"+reg_name
+                    modports[inst_port_name] = getattr(self, reg_name)
+                elif reg_name == "rst" or reg_name == "reset":
+                    setattr(self, reg_name, ResetSignal(clock_domain))
+                    inst_port_name = "i_"+reg_name
+                    modports[inst_port_name] = getattr(self, reg_name)
+                else:
+                    setattr(self, reg_name, CSRStorage(reg_width, name=csr_name)) 
+                    inst_port_name = "i_"+reg_name
+                    modports[inst_port_name] = cross(self, getattr(self, reg_name).storage, "sys", clock_domain)
+            elif direction == "out":
+                setattr(self, reg_name, CSRStatus(reg_width, name=csr_name))
+                inst_port_name = "o_"+reg_name
+                if clock_domain == "sys":
+                    modports[inst_port_name] = getattr(self, reg_name).status
+                else:
+                    modports[inst_port_name] = Signal(reg_width, name=reg_name)
+                    self.comb += getattr(self, reg_name).status.eq(cross(self, modports[inst_port_name], clock_domain, "sys"))
+                if ports[k].get('irq'):
+                    events[reg_name] = (ports[k]['irq'], getattr(self, reg_name).status)
+            else:
+                print("ERROR IN THE CSR INTERFACE GENERATION!")
+
+        if packed:
+            signals = add_packed_csrs(self, packed, soc.csr.data_width if soc is not None else 32)
+            for port in packed:
+                if port['direction'] == "in":
+                    modports["i_" + port['name']] = cross(self, signals[port['name']], "sys", clock_domain)
+                elif clock_domain == "sys":
+                    modports["o_" + port['name']] = signals[port['name']]
+                else:
+                    modports["o_" + port['name']] = Signal(port['size'], name=port['name'])
+                    self.comb += signals[port['name']].eq(cross(self, modports["o_" + port['name']], clock_domain, "sys"))
+                if port.get('irq'):
+                    events[port['name']] = (port['irq'], signals[port['name']])
+
+        if bus_interface is not None:
+            self.bus = add_bus_window(soc, instance_name, bus_interface, bus_origin, bus_size)
+            modports.update(bus_window_ports(self.bus, bus_size))
+
+        # Instantiate the Verilog module        
+        self.specials += Instance(module_name,
+            name = instance_name,
+            **modports
+        )
+        add_event_sources(self, events)
+
+"""
+Old method.
+#"Parser" mehtod for port sizes.
+#TODO: Update this method to be able to handle more complex expressions!
+     
+def parse_port_size (ports, parameters):
+    if parameters is not None:
+        modparams = parameters.items() #make list of key value pairs
+    for k in ports:
+        port_width = ports[k]['size']
+        if not isinstance(port_width, str):
+            raise TypeError('Port size must be string! Should look like: "size" : "1" in config file.')
+        #Simple handling for size 1 ports
+        if port_width == "1":
+            port_width = int(port_width); 
+            ports[k]['size'] = port_width
+        else:
+        #For larger ports, split string at ':' and remove brackets
+            if port_width.startswith('[') and port_width.endswith(']'):
+                #remove brackets and split
+                port_width = port_width.lstrip('[')   
+                port_width = port_width.rstrip(']')
+                parts = port_width.rsplit(':')
+                #remove leading and trailing spaces
+                parts[0] = parts[0].strip()
+                parts[1] = parts[1].strip()
+                #Check if left side is number only. If so, convert to int.
+                if parts[0].isdigit():      
+                    parts[0] = int(parts[0])
+                    #handle tedious case of parameterized size (usually PARAM-1, but not always)
+                    #For now, - and + shall be supported, anything beyond that is witchcraft anyway ;-)
+                else:
+                    for i in parts[0]:
+                        if i == '-':
+                            subparts = parts[0].rsplit('-')
+                            subparts[0]=subparts[0].strip() #remove spaces
+                            subparts[1]=subparts[1].strip()
+                            for i in modparams:
+                                if subparts[0] == i[0]:
+                                    subparts[0] = i[1]
+                                    parts[0] = int(subparts[0]) - int(subparts[1])
+                                    break
+                        if i == '+':
+                            subparts = parts[0].rsplit('+')
+                            subparts[0]=subparts[0].strip() #remove spaces
+                            subparts[1]=subparts[1].strip()
+                            for i in modparams:
+                                if subparts[0] == i[0]:
+                                    subparts[0] = i[1]
+                                    parts[0] = int(subparts[0]) + int(subparts[1])
+                                    break                                
+                #Now we get to the other side of the separator
+                #This assumes that there is always just a number after the ':'.
+                #TODO: Add support for parameters here? Does anyone need that? 
+                parts[1] = int(parts[1])
+                port_width = parts[0] + 1 - parts[1];
+                #write port size as integer into collection
+                ports[k]['size'] = port_width
+            else:
+                raise ValueError("Port size should be formatted '[x:y]' or '1'")
+    return ports
 """
\ No newline at end of file
@@ -1,307 +1,857 @@
-#!/usr/bin/env python3
-
-#
-# This file is not part of LiteX.
-# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de> 
-#
-# SPDX-License-Identifier: BSD-2-Clause
-
-import shutil
-import yaml
-import sys
-import os
-
-from litex.soc.interconnect import *
-from litex.soc.interconnect.csr_eventmanager import *
-from litex.gen import LiteXModule 
-#from litex.soc.interconnect import stream
-from litex.soc.cores.dma import WishboneDMAReader, WishboneDMAWriter
-
-""" This file contains classes related to DMA for use with litex_generator.py
-
-    NOTE: All of this here is still work in progress and may contain some bad designs!
-
-    This comment is used for general information on what's here as well as how LiteX's
-    stream interfaces work. It is supposed to serve as documentation of how this aspect
-    of the System Builder works. If you have anything to add or correct, feel free to 
-    reach out and submit your notes.    
-
-    Top-Level:
-        1. WishboneDmaTestSimple (Testsystem: Write from mem to FIFO and back to mem)
-        2. WishboneDmaTest       (Like DmaTestSimple, but with arbitrary FIFO width)
-    Sub-classes:    
-        1. WishboneDmaMemToX
-        2. WishboneDmaXToMem
-    Controls/"Cores":
-        1. DMATestCore
-    
-    Some important observations reagrding the stream classes:
-        -The "stream" classes are a flexible way to implement dma and other data
-         streams and can be adapted to work with different interfaces
-        -The standard interface is not very transparent and it's not really obvious how
-         signals will behave when they aren't deliberately controlled in the design
-            -E.g. signals like "first" and "last" will have to be set somewhere in the
-             chain of "Endpoints". If they are not set explicitly, it is assumed that
-             they will come form the previous link in the chain. If no link sets the 
-             signals, they will always be 0.
-        -It seems that there aren't many "hard" rules on how to use the stream classes
-         and the "correct" way depends on the application. LiteX will not stop
-         you from creating nonsense designs, so that must be taken into account.
-    """
-
-####Top-Level------------------------------------------------------------------------------
-#   These classes can be instantiated directly in the litex_generator.py
-#   They instantiate sub-classes defined below or imported from liteX
-
-class WishboneDmaTestSimple(LiteXModule):
-    def __init__(self, soc, name="generic_dma", mode="read+write", fifo_depth=256):
-        #check if directionality mode input is valid
-        assert mode in ["read", "write", "read+write"]
-        
-        #"Core" handles the high-level control and contains the dummy target fifo
-        self.core = core = DMATestCore(bus.data_width)
-        
-        bus = wishbone.Interface(
-                data_width  = soc.bus.data_width,
-                adr_width   = soc.bus.get_address_width(standard="wishbone"),
-                adressing   = "word",   #address by word, other option is "byte"
-                mode = "w", #writes to bus
-        )        
-        self.x2mem_dma = x2mem_dma = WishboneDMAWriter(bus=bus, endianness=soc.cpu.endianness, with_csr=True)
-        self.comb += core.source.connect(x2mem_dma.sink)
-        #haven't entirely figured out the significance of this
-        dma_bus = getattr(soc, "dma_bus", soc.bus)
-        dma_bus.add_master(master=bus)
-        bus = wishbone.Interface(
-            data_width  = soc.bus.data_width,
-            adr_width   = soc.bus.get_address_width(standard="wishbone"),
-            adressing   = "word",
-            mode = "r", #reads from bus
-        )
-        self.mem2x_dma = mem2x_dma = WishboneDMAReader(bus=bus,fifo_depth=fifo_depth, endianness=soc.cpu.endianness, with_csr=True)
-        self.comb += mem2x_dma.source.connect(core.sink)
-        #see above comment on dma_bus
-        dma_bus = getattr(soc, "dma_bus", soc.bus)
-        dma_bus.add_master(master=bus)
-        
-        #here comes some eventhandler stuff I do not properly understand yet
-        self.ev = ev = EventManager()    #instantiate eventmanager (interrupt handler?) 
-        if "read" in mode:
-            ev.x2mem_dma = EventSourcePulse(description="Block2Mem DMA terminated.")
-        if "write" in mode:
-            ev.mem2x_dma = EventSourcePulse(description="Mem2Block DMA terminated.") 
-  
-class WishboneDmaTest(LiteXModule):
-    def __init__(self, soc, name="generic_dma", mode="read+write", data_width=32, fifo_depth=256):
-        #check if directionality mode input is valid
-        assert mode in ["read", "write", "read+write"]
-        
-        #"Core" handles the high-level control and contains the dummy target fifo
-        self.core = core = DMATestCore(data_width)
-        
-        """Initial version modeled after LiteSDCard
-           here an interface to the wishbone bus is created for the "read" side
-           "read" means read from X, write to Mem
-        """
-        if "read" in mode:
-            bus = wishbone.Interface(
-                data_width  = soc.bus.data_width,
-                adr_width   = soc.bus.get_address_width(standard="wishbone"),
-                adressing   = "word",   #address by word, other option is "byte"
-                mode = "w", #writes to bus
-            )
-            self.x2mem = x2mem = WishboneDmaXToMem (bus=bus, endianness=soc.cpu.endianness, data_width=data_width)
-            self.comb += core.source.connect(x2mem.sink)
-            #I'm not entirely sure what the "dma_bus" is about
-            dma_bus = getattr(soc, "dma_bus", soc.bus)
-            dma_bus.add_master(master=bus)
-            
-        if "write" in mode:
-            bus = wishbone.Interface(
-                data_width  = soc.bus.data_width,
-                adr_width   = soc.bus.get_address_width(standard="wishbone"),
-                adressing   = "word",
-                mode = "r", #reads from bus
-            )
-            self.mem2x = mem2x = WishboneDmaMemToX(bus=bus, endianness=soc.cpu.endianness, data_width=data_width)
-            self.comb += mem2x.source.connect(core.sink)
-            #see above comment on dma_bus
-            dma_bus = getattr(soc, "dma_bus", soc.bus)
-            dma_bus.add_master(master=bus)
-            
-        #here comes some eventhandler stuff I don't really undrstand yet...
-        self.ev = ev = EventManager()    #instantiate eventmanager (interrupt handler?) 
-        if "read" in mode:
-            ev.x2mem_dma = EventSourcePulse(description="Block2Mem DMA terminated.")
-        if "write" in mode:
-            ev.mem2x_dma = EventSourcePulse(description="Mem2Block DMA terminated.")
-
-
-####Sub-Classes-----------------------------------------------------------------------------
-#   These classes are meant to be used with a wrapper (see WishboneDmaTest)
-#   They contain additional adjustable FIFOs and data width converters
-#   WishboneDmaXToMem, WishboneDmaMemToX modeled after LiteSDCard's block2mem, mem2block
- 
-class WishboneDmaMemToX(LiteXModule):
-    
-    def __init__(self, bus, endianness, fifo_depth=32, data_width=8):
-        self.bus = bus
-        self.source = stream.Endpoint([("data", data_width)]) #I think "data" is endpoint name, 8 is data width?
-        self.irq = Signal() #maybe this exercise can also teach me a thing or two about interrupts in liteX
-     
-        #initialize dma reader module
-        self.dma = WishboneDMAReader(bus, fifo_depth=16, with_csr=True, endianness=endianness)
-        #the converter handles the transition from bus_width to data_width
-        converter = stream.Converter(bus.data_width, data_width, reverse = True)
-        fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True)
-        self.submodules += converter, fifo
-        
-        #here some wiring stuff
-        #this uses the "stream" classes of litex. 
-        #I still haven't quite wrapped my head around how the source/sink terminology works
-        self.comb+= [
-            self.dma.source.connect(converter.sink),
-            converter.source.connect(fifo.sink),
-            fifo.source.connect(self.source),
-        ]
-        
-        #This &s previous value of dma._done csr with current one
-        #This way the rising edge is detected
-        done_d = Signal()
-        self.sync += done_d.eq(self.dma._done.status)   #I think the signal is tied to the CSR here
-        self.sync += self.irq.eq(self.dma._done.status & ~done_d)
-
-class WishboneDmaXToMem(LiteXModule):
-    
-    def __init__(self, bus, endianness, fifo_depth=512, data_width=8):
-        self.bus = bus
-        self.sink = stream.Endpoint([("data", data_width)]) 
-        self.irq = Signal()
-        
-        fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered = True)
-        converter = stream.Converter(data_width, bus.data_width, reverse=True)
-        self.submodules += fifo, converter
-        self.dma = WishboneDMAWriter(bus, endianness=endianness, with_csr=True)
-        
-        #here Signals are defined and tied to the endpoint and dma classes
-        start = Signal()
-        connect= Signal()
-        #"start" is set to be valid&&first signals from sink (stream.Endoint())
-        self.comb += start.eq(self.sink.valid & self.sink.first)
-        #"connect" is set 1 when dma._enable.storage (CSR) && start
-        #only reset to 0 if dma._enable.storage goes 0
-        self.sync += [
-            If(~self.dma._enable.storage,
-                connect.eq(0)
-            ).Elif(start, 
-                connect.eq(1)
-            )
-        ]
-        #Here the stream Endpoint "sink" is connected to fifo.sink if
-        #dma._enable.storage AND (start OR connect) are set
-        #Otherwise the Endpoints "ready" signal is set to 1
-        self.comb += [
-            If(self.dma._enable.storage & (start | connect),
-                self.sink.connect(fifo.sink)
-            ).Else(
-                self.sink.ready.eq(1)
-            ),
-            #FIFO gives input to converter, converter gives input to dma
-            fifo.source.connect(converter.sink),
-            converter.source.connect(self.dma.sink),
-        ]
-        
-        # IRQ / Generate IRQ on DMA done rising edge
-        done_d = Signal()
-        self.sync += done_d.eq(self.dma._done.status)
-        self.sync += self.irq.eq(self.dma._done.status & ~done_d)
-
-####Controls / "Cores"---------------------------------------------------------------------
-#   This section contains classes for high-level control of the data flow
-#   DMATestCore is part of WishboneDmaTest and WishboneDmaTestSimple
- 
-class DMATestCore(LiteXModule):    
-    from litex.soc.interconnect import stream
-    def __init__(self, data_width):
-        self.sink   = stream.Endpoint([("data", data_width)])
-        self.source   = stream.Endpoint([("data", data_width)])
-        #This is the "high level" control logic
-        self.start      = CSRStorage(description="Run the test")
-        self.wr_done    = CSRStatus(description="Writing complete")
-        self.rd_done    = CSRStatus(description="Reading complete")
-        
-        #some additional CSRs for debugging and understanding what's going on
-        self.state = CSRStatus(size=3, description="Current State")
-        self.count = CSRStatus(size=8, description="Counter for data read and stuff")
-        
-         #set up fifo to temporarily store values
-        self.fifo = fifo = stream.SyncFIFO([("data", data_width)], 512, buffered = True)
-        
-        #Like most of this, this is based on the LiteSDCard construct
-        #I think this is just assigning variables or cleaner code?
-        #maabe the methods from Migen need it idk
-        start = self.start.re   #this way the signal should be usable as a "pulse"
-        wr_done = self.wr_done.status
-        rd_done = self.rd_done.status
-    
-        data_count = Signal(8)  #8-bit count should be enough
-        
-        #in analogy to the block delimiter in SDCore, limit data to 32 words
-        """
-        When using the "last" signals for flow control, this setup wiht the counter
-        imposes a hard limit on the length of transmissions. Set up the way it is
-        any transmission will be stopped after 32 words.
-        """
-        self.sync += [
-            If(self.sink.valid & self.sink.ready, #under this condition,   
-                data_count.eq(data_count + 1),    #a word will be transmitted with each clock cycle 
-                If(self.sink.last, data_count.eq(0)) #reset counter on transmission of last word
-            )
-        ]
-        self.comb += If(data_count == 31, 
-            self.sink.last.eq(1) #set sink.last, when 31 of 32 words sent
-            ).Elif(data_count == 0,
-                self.sink.first.eq(1)   #set sink.first for reception of first data
-            )
-        
-        #I will probably need some kind of state machine for control flow
-    
-        #Control FSM
-        self.fsm = fsm = FSM()
-        fsm.act("IDLE",
-            #initial setup
-            NextValue(wr_done, 0),
-            NextValue(rd_done, 0),
-            NextValue(data_count, 0),
-            NextValue(self.state.status, 0),
-            If(start,
-                NextValue(wr_done, 0),
-                NextValue(rd_done, 0),
-                NextState("DATA-WRITE")
-            )
-        )
-        fsm.act("DATA-WRITE",
-            self.sink.connect(fifo.sink),
-            NextValue(self.state.status, 1),
-            If(fifo.sink.valid & fifo.sink.ready & fifo.sink.last,
-                #When last word is sent, set wr_done and go to next state
-                NextValue(wr_done, 1),
-                NextState("WAIT")  
-            )
-        )
-        fsm.act("WAIT",
-            NextValue(self.state.status, 2),
-            If(start,
-                NextState("DATA-READ")
-            )
-        )
-        fsm.act("DATA-READ",
-            NextValue(self.state.status, 3),
-            fifo.source.connect(self.source),
-            If(fifo.source.last & fifo.source.ready,
-               #fifo.source.connect(self.source),
-               NextValue(self.state.status, 4),                
-               NextValue(rd_done, 1),   #on last word, set rd_done
-               NextState("IDLE")       #and proceed to IDLE state
-            )
-        )
\ No newline at end of file
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de> 
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import shutil
+import yaml
+import sys
+import os
+
+from litex.soc.interconnect import *
+from litex.soc.interconnect.csr_eventmanager import *
+from litex.gen import LiteXModule 
+from migen.genlib.cdc import MultiReg
+#from litex.soc.interconnect import stream
+from litex.soc.cores.dma import WishboneDMAReader, WishboneDMAWriter, format_bytes
+
+""" This file contains classes related to DMA for use with litex_generator.py
+
+    NOTE: All of this here is still work in progress and may contain some bad designs!
+
+    This comment is used for general information on what's here as well as how LiteX's
+    stream interfaces work. It is supposed to serve as documentation of how this aspect
+    of the System Builder works. If you have anything to add or correct, feel free to 
+    reach out and submit your notes.    
+
+    Top-Level:
+        1. WishboneDmaTestSimple (Testsystem: Write from mem to FIFO and back to mem)
+        2. WishboneDmaTest       (Like DmaTestSimple, but with arbitrary FIFO width)
+        3. WishboneDmaBench      (Bandwidth benchmark: mem -> FIFO -> mem with cycle counters)
+        4. WishboneSGDmaTest     (Scatter-gather copy: mem -> FIFO -> mem, one descriptor ring per side)
+        5. StreamPortDMA         (DMA channel for "stream" ports of external_modules)
+    Sub-classes:    
+        1. WishboneDmaMemToX
+        2. WishboneDmaXToMem
+    DMA Engines (burst-capable replacements for LiteX's WishboneDMAReader/Writer):
+        1. WishboneBurstDMAReader
+        2. WishboneBurstDMAWriter
+        3. WishboneSGDMA         (Scatter-gather: walks a descriptor ring, uses one of the above)
+    Controls/"Cores":
+        1. DMATestCore
+        2. DMABenchCore
+    
+    Some important observations reagrding the stream classes:
+        -The "stream" classes are a flexible way to implement dma and other data
+         streams and can be adapted to work with different interfaces
+        -The standard interface is not very transparent and it's not really obvious how
+         signals will behave when they aren't deliberately controlled in the design
+            -E.g. signals like "first" and "last" will have to be set somewhere in the
+             chain of "Endpoints". If they are not set explicitly, it is assumed that
+             they will come form the previous link in the chain. If no link sets the 
+             signals, they will always be 0.
+        -It seems that there aren't many "hard" rules on how to use the stream classes
+         and the "correct" way depends on the application. LiteX will not stop
+         you from creating nonsense designs, so that must be taken into account.
+    """
+
+####Top-Level------------------------------------------------------------------------------
+#   These classes can be instantiated directly in the litex_generator.py
+#   They instantiate sub-classes defined below or imported from liteX
+
+class WishboneDmaTestSimple(LiteXModule):
+    def __init__(self, soc, name="generic_dma", mode="read+write", fifo_depth=256):
+        #check if directionality mode input is valid
+        assert mode in ["read", "write", "read+write"]
+        
+        #"Core" handles the high-level control and contains the dummy target fifo
+        self.core = core = DMATestCore(bus.data_width)
+        
+        bus = wishbone.Interface(
+                data_width  = soc.bus.data_width,
+                adr_width   = soc.bus.get_address_width(standard="wishbone"),
+                adressing   = "word",   #address by word, other option is "byte"
+                mode = "w", #writes to bus
+        )        
+        self.x2mem_dma = x2mem_dma = WishboneDMAWriter(bus=bus, endianness=soc.cpu.endianness, with_csr=True)
+        self.comb += core.source.connect(x2mem_dma.sink)
+        #haven't entirely figured out the significance of this
+        dma_bus = getattr(soc, "dma_bus", soc.bus)
+        dma_bus.add_master(master=bus)
+        bus = wishbone.Interface(
+            data_width  = soc.bus.data_width,
+            adr_width   = soc.bus.get_address_width(standard="wishbone"),
+            adressing   = "word",
+            mode = "r", #reads from bus
+        )
+        self.mem2x_dma = mem2x_dma = WishboneDMAReader(bus=bus,fifo_depth=fifo_depth, endianness=soc.cpu.endianness, with_csr=True)
+        self.comb += mem2x_dma.source.connect(core.sink)
+        #see above comment on dma_bus
+        dma_bus = getattr(soc, "dma_bus", soc.bus)
+        dma_bus.add_master(master=bus)
+        
+        #here comes some eventhandler stuff I do not properly understand yet
+        self.ev = ev = EventManager()    #instantiate eventmanager (interrupt handler?) 
+        if "read" in mode:
+            ev.x2mem_dma = EventSourcePulse(description="Block2Mem DMA terminated.")
+        if "write" in mode:
+            ev.mem2x_dma = EventSourcePulse(description="Mem2Block DMA terminated.") 
+  
+class WishboneDmaTest(LiteXModule):
+    #fifo_depth=None keeps the defaults of the sub-classes, burst_length selects the burst engines
+    def __init__(self, soc, name="generic_dma", mode="read+write", data_width=32, fifo_depth=None, burst_length=None):
+        #check if directionality mode input is valid
+        assert mode in ["read", "write", "read+write"]
+        
+        #"Core" handles the high-level control and contains the dummy target fifo
+        self.core = core = DMATestCore(data_width)
+        
+        """Initial version modeled after LiteSDCard
+           here an interface to the wishbone bus is created for the "read" side
+           "read" means read from X, write to Mem
+        """
+        if "read" in mode:
+            bus = wishbone.Interface(
+                data_width  = soc.bus.data_width,
+                adr_width   = soc.bus.get_address_width(standard="wishbone"),
+                adressing   = "word",   #address by word, other option is "byte"
+                mode = "w", #writes to bus
+                bursting    = burst_length is not None,
+            )
+            self.x2mem = x2mem = WishboneDmaXToMem (bus=bus, endianness=soc.cpu.endianness, data_width=data_width,
+                burst_length=burst_length, **({} if fifo_depth is None else {"fifo_depth": fifo_depth}))
+            self.comb += core.source.connect(x2mem.sink)
+            #I'm not entirely sure what the "dma_bus" is about
+            dma_bus = getattr(soc, "dma_bus", soc.bus)
+            dma_bus.add_master(name=f"{name}_x2mem", master=bus)
+            
+        if "write" in mode:
+            bus = wishbone.Interface(
+                data_width  = soc.bus.data_width,
+                adr_width   = soc.bus.get_address_width(standard="wishbone"),
+                adressing   = "word",
+                mode = "r", #reads from bus
+                bursting    = burst_length is not None,
+            )
+            self.mem2x = mem2x = WishboneDmaMemToX(bus=bus, endianness=soc.cpu.endianness, data_width=data_width,
+                burst_length=burst_length, **({} if fifo_depth is None else {"fifo_depth": fifo_depth}))
+            self.comb += mem2x.source.connect(core.sink)
+            #see above comment on dma_bus
+            dma_bus = getattr(soc, "dma_bus", soc.bus)
+            dma_bus.add_master(name=f"{name}_mem2x", master=bus)
+            
+        #here comes some eventhandler stuff I don't really undrstand yet...
+        self.ev = ev = EventManager()    #instantiate eventmanager (interrupt handler?) 
+        if "read" in mode:
+            ev.x2mem_dma = EventSourcePulse(description="Block2Mem DMA terminated.")
+        if "write" in mode:
+            ev.mem2x_dma = EventSourcePulse(description="Mem2Block DMA terminated.")
+
+
+class WishboneDmaBench(LiteXModule):
+    """
+    Bandwidth benchmark version of WishboneDmaTest. Data is streamed from memory through
+    the FIFOs back into memory (mem2x and x2mem DMAs run at the same time) while
+    DMABenchCore counts the cycles. fifo_depth is used for all FIFOs in the path.
+    Sequence for the firmware:
+        1. program x2mem_dma base/length and enable it, same for mem2x_dma but don't enable yet
+        2. core_length = number of data_width words, write core_start
+        3. enable mem2x_dma, wait for core_done, read the counters
+    Without a soc (see benchmarks/dma_bandwidth.py) the bus parameters are used as given
+    and read_bus/write_bus are left for the caller to connect.
+    """
+    def __init__(self, soc=None, name="generic_dma", data_width=32, fifo_depth=256, burst_length=None,
+                 bus_data_width=32, adr_width=30, endianness="little"):
+        if soc is not None:
+            bus_data_width = soc.bus.data_width
+            adr_width = soc.bus.get_address_width(standard="wishbone")
+            endianness = soc.cpu.endianness
+        bursting = burst_length is not None
+        self.read_bus = wishbone.Interface(data_width=bus_data_width, adr_width=adr_width, addressing="word", bursting=bursting)
+        self.write_bus = wishbone.Interface(data_width=bus_data_width, adr_width=adr_width, addressing="word", bursting=bursting)
+
+        self.core = core = DMABenchCore(data_width, fifo_depth=fifo_depth,
+            masters={"read": self.read_bus, "write": self.write_bus})
+        self.mem2x = mem2x = WishboneDmaMemToX(bus=self.read_bus, endianness=endianness,
+            fifo_depth=fifo_depth, data_width=data_width, burst_length=burst_length)
+        self.x2mem = x2mem = WishboneDmaXToMem(bus=self.write_bus, endianness=endianness,
+            fifo_depth=fifo_depth, data_width=data_width, burst_length=burst_length)
+        self.comb += [
+            mem2x.source.connect(core.sink),
+            core.source.connect(x2mem.sink),
+        ]
+        if soc is not None:
+            dma_bus = getattr(soc, "dma_bus", soc.bus)
+            dma_bus.add_master(name=f"{name}_read", master=self.read_bus)
+            dma_bus.add_master(name=f"{name}_write", master=self.write_bus)
+
+        #unlike in WishboneDmaTest, the event is actually triggered
+        self.ev = ev = EventManager()
+        ev.done = EventSourcePulse(description="DMA benchmark transfer complete.")
+        ev.finalize()
+        self.comb += ev.done.trigger.eq(core.done_pulse)
+
+
+class WishboneSGDmaTest(LiteXModule):
+    """
+    Scatter-gather version of the test system: mem2x (WishboneSGDMA, mode "read") feeds a
+    FIFO that is drained by x2mem (WishboneSGDMA, mode "write"), each with its own
+    descriptor ring. Both sides raise an event per coalesced interrupt.
+    """
+    def __init__(self, soc, name="generic_dma", fifo_depth=256, burst_length=None):
+        bus_args = dict(
+            data_width  = soc.bus.data_width,
+            adr_width   = soc.bus.get_address_width(standard="wishbone"),
+            addressing  = "word",
+            bursting    = burst_length is not None,
+        )
+        self.mem2x = mem2x = WishboneSGDMA(wishbone.Interface(**bus_args), mode="read",
+            burst_length=burst_length, fifo_depth=fifo_depth, endianness=soc.cpu.endianness)
+        self.x2mem = x2mem = WishboneSGDMA(wishbone.Interface(**bus_args), mode="write",
+            burst_length=burst_length, fifo_depth=fifo_depth, endianness=soc.cpu.endianness)
+        self.fifo = fifo = stream.SyncFIFO([("data", soc.bus.data_width)], fifo_depth, buffered=True)
+        self.comb += [
+            mem2x.source.connect(fifo.sink),
+            fifo.source.connect(x2mem.sink),
+        ]
+        dma_bus = getattr(soc, "dma_bus", soc.bus)
+        for side, engine in [("mem2x", mem2x), ("x2mem", x2mem)]:
+            dma_bus.add_master(name=f"{name}_{side}_desc", master=engine.desc_bus)
+            dma_bus.add_master(name=f"{name}_{side}", master=engine.bus)
+
+        self.ev = ev = EventManager()
+        ev.mem2x_dma = EventSourcePulse(description="Mem2X descriptors completed.")
+        ev.x2mem_dma = EventSourcePulse(description="X2Mem descriptors completed.")
+        ev.finalize()
+        self.comb += [
+            ev.mem2x_dma.trigger.eq(mem2x.irq),
+            ev.x2mem_dma.trigger.eq(x2mem.irq),
+        ]
+
+
+class StreamPortDMA(LiteXModule):
+    """
+    DMA channel behind a "stream" port of an external module (see GenericCSR). A port with
+    direction "in" (into the external module) is fed from memory, "out" is written to memory:
+        in:  mem -> WishboneSGDMA -> Converter -> FIFO -> endpoint
+        out: endpoint -> FIFO -> Converter -> WishboneSGDMA -> mem
+    The endpoint has data_width bits, valid/ready and last (end of a descriptor for "in",
+    ignored for "out" since the descriptors decide where blocks end). With async_fifo, the
+    endpoint is in its own clock domain (self.cd, clock to be connected by the caller) and
+    the FIFO is an AsyncFIFO; the domain's reset follows the system reset (synchronized).
+    Without async_fifo, the endpoint is in clock_domain, also through an AsyncFIFO if that
+    isn't "sys".
+    The descriptor ring is programmed as for WishboneSGDMA (CSRs of the "dma" submodule).
+    """
+    def __init__(self, soc, name, direction, data_width, fifo_depth=16, async_fifo=False, burst_length=None,
+        clock_domain="sys"):
+        assert direction in ["in", "out"]
+        bus_data_width = soc.bus.data_width
+        bus = wishbone.Interface(
+            data_width  = bus_data_width,
+            adr_width   = soc.bus.get_address_width(standard="wishbone"),
+            addressing  = "word",
+            bursting    = burst_length is not None,
+        )
+        self.dma = dma = WishboneSGDMA(bus, mode="read" if direction == "in" else "write",
+            burst_length=burst_length, fifo_depth=max(fifo_depth, 16), endianness=soc.cpu.endianness)
+        dma_bus = getattr(soc, "dma_bus", soc.bus)
+        dma_bus.add_master(name=f"{name}_desc", master=dma.desc_bus)
+        dma_bus.add_master(name=f"{name}_dma", master=dma.bus)
+        self.irq = dma.irq
+        self.endpoint = stream.Endpoint([("data", data_width)])
+
+        if async_fifo:
+            clock_domain = name
+            self.cd = ClockDomain(name)
+            self.clock_domains += self.cd
+            #synchronous release, AsyncResetSynchronizer needs vendor primitives the generic platform doesn't have
+            self.specials += MultiReg(ResetSignal("sys"), self.cd.rst, odomain=name, n=2, reset=1)
+        if clock_domain != "sys":
+            cdc = {"in": {"write": "sys", "read": clock_domain}, "out": {"write": clock_domain, "read": "sys"}}[direction]
+            fifo = ClockDomainsRenamer(cdc)(stream.AsyncFIFO([("data", data_width)], max(fifo_depth, 4), buffered=True))
+        else:
+            fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True)
+        #same byte order as WishboneDmaMemToX/WishboneDmaXToMem
+        if direction == "in":
+            converter = stream.Converter(bus_data_width, data_width, reverse=True)
+            self.comb += [
+                dma.source.connect(converter.sink),
+                converter.source.connect(fifo.sink),
+                fifo.source.connect(self.endpoint),
+            ]
+        else:
+            converter = stream.Converter(data_width, bus_data_width, reverse=True)
+            self.comb += [
+                self.endpoint.connect(fifo.sink),
+                fifo.source.connect(converter.sink),
+                converter.source.connect(dma.sink),
+            ]
+        self.fifo = fifo
+        self.converter = converter
+
+
+####Sub-Classes-----------------------------------------------------------------------------
+#   These classes are meant to be used with a wrapper (see WishboneDmaTest)
+#   They contain additional adjustable FIFOs and data width converters
+#   WishboneDmaXToMem, WishboneDmaMemToX modeled after LiteSDCard's block2mem, mem2block
+ 
+class WishboneDmaMemToX(LiteXModule):
+    
+    def __init__(self, bus, endianness, fifo_depth=32, data_width=8, burst_length=None):
+        self.bus = bus
+        self.source = stream.Endpoint([("data", data_width)]) #I think "data" is endpoint name, 8 is data width?
+        self.irq = Signal() #maybe this exercise can also teach me a thing or two about interrupts in liteX
+     
+        #initialize dma reader module, the burst engine has room for two bursts in its FIFO
+        if burst_length is None:
+            self.dma = WishboneDMAReader(bus, fifo_depth=fifo_depth, with_csr=True, endianness=endianness)
+        else:
+            self.dma = WishboneBurstDMAReader(bus, burst_length=burst_length,
+                fifo_depth=max(fifo_depth, 2*burst_length), endianness=endianness)
+        #the converter handles the transition from bus_width to data_width
+        converter = stream.Converter(bus.data_width, data_width, reverse = True)
+        fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True)
+        self.submodules += converter, fifo
+        
+        #here some wiring stuff
+        #this uses the "stream" classes of litex. 
+        #I still haven't quite wrapped my head around how the source/sink terminology works
+        self.comb+= [
+            self.dma.source.connect(converter.sink),
+            converter.source.connect(fifo.sink),
+            fifo.source.connect(self.source),
+        ]
+        
+        #This &s previous value of dma._done csr with current one
+        #This way the rising edge is detected
+        done_d = Signal()
+        self.sync += done_d.eq(self.dma._done.status)   #I think the signal is tied to the CSR here
+        self.sync += self.irq.eq(self.dma._done.status & ~done_d)
+
+class WishboneDmaXToMem(LiteXModule):
+    
+    def __init__(self, bus, endianness, fifo_depth=512, data_width=8, burst_length=None):
+        self.bus = bus
+        self.sink = stream.Endpoint([("data", data_width)]) 
+        self.irq = Signal()
+        
+        fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered = True)
+        converter = stream.Converter(data_width, bus.data_width, reverse=True)
+        self.submodules += fifo, converter
+        if burst_length is None:
+            self.dma = WishboneDMAWriter(bus, endianness=endianness, with_csr=True)
+        else:
+            self.dma = WishboneBurstDMAWriter(bus, burst_length=burst_length,
+                fifo_depth=max(fifo_depth, 2*burst_length), endianness=endianness)
+        
+        #here Signals are defined and tied to the endpoint and dma classes
+        start = Signal()
+        connect= Signal()
+        #"start" is set to be valid&&first signals from sink (stream.Endoint())
+        self.comb += start.eq(self.sink.valid & self.sink.first)
+        #"connect" is set 1 when dma._enable.storage (CSR) && start
+        #only reset to 0 if dma._enable.storage goes 0
+        self.sync += [
+            If(~self.dma._enable.storage,
+                connect.eq(0)
+            ).Elif(start, 
+                connect.eq(1)
+            )
+        ]
+        #Here the stream Endpoint "sink" is connected to fifo.sink if
+        #dma._enable.storage AND (start OR connect) are set
+        #Otherwise the Endpoints "ready" signal is set to 1
+        self.comb += [
+            If(self.dma._enable.storage & (start | connect),
+                self.sink.connect(fifo.sink)
+            ).Else(
+                self.sink.ready.eq(1)
+            ),
+            #FIFO gives input to converter, converter gives input to dma
+            fifo.source.connect(converter.sink),
+            converter.source.connect(self.dma.sink),
+        ]
+        
+        # IRQ / Generate IRQ on DMA done rising edge
+        done_d = Signal()
+        self.sync += done_d.eq(self.dma._done.status)
+        self.sync += self.irq.eq(self.dma._done.status & ~done_d)
+
+####DMA Engines---------------------------------------------------------------------------
+#   Drop-in replacements for LiteX's WishboneDMAReader/WishboneDMAWriter (same CSRs, except
+#   "loop") that use incrementing bursts (registered feedback, CTI=0b010, BTE linear).
+#   LiteX's engines issue one classic cycle per word and wait for each ack. With a slave
+#   that supports bursts (e.g. the integrated RAMs with bus_bursting: "True"), a burst
+#   transfers one word per cycle after the first. Other slaves ignore CTI and ack every
+#   other cycle as before, so the engines work everywhere.
+#   A burst is only started when the FIFO has room for (reader) or holds (writer) the whole
+#   burst, so the bus is never held with stb low. The FIFOs are sized for two bursts, so the
+#   next burst can start while the data of the previous one is still being consumed.
+
+class _BurstDMAControl(LiteXModule):
+    #control signals as in LiteX's add_ctrl(), driven by CSRs (with_csr) or by another engine
+    def add_ctrl(self):
+        self.base   = Signal(64)
+        self.length = Signal(32)    #in bytes
+        self.enable = Signal()
+        self.done   = Signal()
+        self.offset = Signal(32)
+
+    def add_csr(self):
+        self._base   = CSRStorage(64)
+        self._length = CSRStorage(32, description="Length in bytes.")
+        self._enable = CSRStorage()
+        self._done   = CSRStatus()
+        self._offset = CSRStatus(32)
+        self.comb += [
+            self.base.eq(self._base.storage),
+            self.length.eq(self._length.storage),
+            self.enable.eq(self._enable.storage),
+            self._done.status.eq(self.done),
+            self._offset.status.eq(self.offset),
+        ]
+
+class WishboneBurstDMAReader(_BurstDMAControl):
+    def __init__(self, bus, burst_length=16, fifo_depth=32, endianness="little", with_csr=True):
+        assert burst_length >= 1 and fifo_depth >= burst_length
+        self.bus    = bus
+        self.source = stream.Endpoint([("data", bus.data_width)])
+        self.add_ctrl()
+        if with_csr:
+            self.add_csr()
+
+        self.fifo = fifo = stream.SyncFIFO([("data", bus.data_width)], fifo_depth, buffered=True)
+        self.comb += fifo.source.connect(self.source)
+
+        shift   = log2_int(bus.data_width//8)
+        base    = Signal(bus.adr_width)
+        length  = Signal(bus.adr_width)
+        offset  = Signal(bus.adr_width)
+        beats   = Signal(max=burst_length + 1) #beats left in the current burst
+        self.comb += [
+            base.eq(self.base[shift:]),
+            length.eq(self.length[shift:]),
+            self.offset.eq(offset),
+        ]
+
+        self.fsm = fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += fsm.reset.eq(~self.enable)
+        fsm.act("IDLE",
+            NextValue(offset, 0),
+            NextState("WAIT"),
+        )
+        fsm.act("WAIT",
+            If(offset == length,
+                NextState("DONE")
+            ).Elif(fifo.level <= (fifo_depth - burst_length),
+                NextValue(beats, Mux(length - offset < burst_length, length - offset, burst_length)),
+                NextState("BURST")
+            )
+        )
+        fsm.act("BURST",
+            bus.cyc.eq(1),
+            bus.stb.eq(1),
+            bus.we.eq(0),
+            bus.sel.eq(2**(bus.data_width//8)-1),
+            bus.adr.eq(base + offset),
+            bus.cti.eq(Mux(beats == 1, wishbone.CTI_BURST_END, wishbone.CTI_BURST_INCREMENTING)),
+            bus.bte.eq(0),
+            fifo.sink.data.eq(format_bytes(bus.dat_r, endianness)),
+            fifo.sink.last.eq(offset == (length - 1)),
+            If(bus.ack,
+                fifo.sink.valid.eq(1),
+                NextValue(offset, offset + 1),
+                NextValue(beats, beats - 1),
+                If(beats == 1,
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("DONE", self.done.eq(1))
+
+class WishboneBurstDMAWriter(_BurstDMAControl):
+    def __init__(self, bus, burst_length=16, fifo_depth=32, endianness="little", with_csr=True):
+        assert burst_length >= 1 and fifo_depth >= burst_length
+        self.bus  = bus
+        self.sink = stream.Endpoint([("data", bus.data_width)])
+        self.add_ctrl()
+        if with_csr:
+            self.add_csr()
+
+        self.fifo = fifo = stream.SyncFIFO([("data", bus.data_width)], fifo_depth, buffered=True)
+        self.comb += self.sink.connect(fifo.sink)
+
+        shift   = log2_int(bus.data_width//8)
+        base    = Signal(bus.adr_width)
+        length  = Signal(bus.adr_width)
+        offset  = Signal(bus.adr_width)
+        beats   = Signal(max=burst_length + 1)
+        count   = Signal(max=burst_length + 1) #length of the next burst
+        self.comb += [
+            base.eq(self.base[shift:]),
+            length.eq(self.length[shift:]),
+            self.offset.eq(offset),
+            count.eq(Mux(length - offset < burst_length, length - offset, burst_length)),
+        ]
+
+        self.fsm = fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += fsm.reset.eq(~self.enable)
+        fsm.act("IDLE",
+            NextValue(offset, 0),
+            NextState("WAIT"),
+        )
+        fsm.act("WAIT",
+            If(offset == length,
+                NextState("DONE")
+            ).Elif(fifo.level >= count,
+                NextValue(beats, count),
+                NextState("BURST")
+            )
+        )
+        fsm.act("BURST",
+            bus.cyc.eq(1),
+            bus.stb.eq(1),
+            bus.we.eq(1),
+            bus.sel.eq(2**(bus.data_width//8)-1),
+            bus.adr.eq(base + offset),
+            bus.cti.eq(Mux(beats == 1, wishbone.CTI_BURST_END, wishbone.CTI_BURST_INCREMENTING)),
+            bus.bte.eq(0),
+            bus.dat_w.eq(format_bytes(fifo.source.data, endianness)),
+            If(bus.ack,
+                fifo.source.ready.eq(1),
+                NextValue(offset, offset + 1),
+                NextValue(beats, beats - 1),
+                If(beats == 1,
+                    NextState("WAIT")
+                )
+            )
+        )
+        fsm.act("DONE", self.done.eq(1))
+
+class WishboneSGDMA(LiteXModule):
+    """
+    Scatter-gather DMA: walks a ring of descriptors in memory and runs the data engine
+    (mode "read": mem -> source, mode "write": sink -> mem) once per descriptor, without
+    the CPU. Descriptors are 4 32-bit words, 16 byte aligned:
+        0: address      data address in bytes
+        1: length       in bytes, multiple of the bus width
+        2: flags        bit 0: interrupt after this descriptor
+                        bit 1: stop after this descriptor (until enable is toggled)
+        3: next         address of the next descriptor
+    The engine processes descriptors from head until head == tail:
+        -base       address of the first descriptor, loaded into head while disabled
+        -tail       written by the firmware after it prepared descriptors: the "next" of
+                    the last prepared one. The engine stops there and resumes when tail moves.
+        -head       status: descriptor that is processed next
+        -coalesce   interrupt after this many completed descriptors (0: never). The count
+                    restarts with every interrupt. An interrupt is also raised when the
+                    ring is drained (head reaches tail) and for descriptors with flag bit 0.
+    So the firmware only touches the DMA once per batch: write the descriptors, move tail.
+    Descriptors are read over a separate 32-bit master (desc_bus), data goes over bus.
+    """
+    def __init__(self, bus, mode="read", burst_length=None, fifo_depth=32, endianness="little"):
+        assert mode in ["read", "write"]
+        self.bus      = bus
+        self.desc_bus = desc_bus = wishbone.Interface(data_width=32, adr_width=30, addressing="word")
+        self.irq      = Signal()    #one cycle pulse
+
+        self._enable    = CSRStorage(description="Run the engine; while 0, head is loaded from base.")
+        self._base      = CSRStorage(32, description="Address of the first descriptor.")
+        self._tail      = CSRStorage(32, description="Stop before processing this descriptor.")
+        self._head      = CSRStatus(32,  description="Address of the next descriptor.")
+        self._coalesce  = CSRStorage(16, reset=1, description="Interrupt every N completed descriptors.")
+        self._completed = CSRStatus(32,  description="Completed descriptors since enable.")
+        self._busy      = CSRStatus(description="A descriptor is being processed.")
+
+        #the data engine is controlled by this module instead of its own CSRs
+        if burst_length is None:
+            if mode == "read":
+                engine = WishboneDMAReader(bus, fifo_depth=fifo_depth, endianness=endianness)
+                engine.add_ctrl()
+            else:
+                engine = WishboneDMAWriter(bus, endianness=endianness)
+                engine.add_ctrl(ready_on_idle=0) #don't drop data between descriptors
+        else:
+            engine_cls = WishboneBurstDMAReader if mode == "read" else WishboneBurstDMAWriter
+            engine = engine_cls(bus, burst_length=burst_length, fifo_depth=max(fifo_depth, 2*burst_length),
+                endianness=endianness, with_csr=False)
+        self.engine = engine
+        if mode == "read":
+            self.source = engine.source #"last" marks the end of each descriptor
+        else:
+            #only the descriptors decide where a block ends
+            self.sink = stream.Endpoint([("data", bus.data_width)])
+            self.comb += self.sink.connect(engine.sink, omit={"first", "last"})
+
+        head      = self._head.status
+        addr      = Signal(32)
+        length    = Signal(32)
+        flags     = Signal(32)
+        next_desc = Signal(32)
+        word      = Signal(2)
+        pending   = Signal(16)  #completed descriptors since the last interrupt
+        desc      = [addr, length, flags, next_desc]
+
+        self.comb += [
+            engine.base.eq(addr),
+            engine.length.eq(length),
+        ]
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(~self._enable.storage,
+                NextValue(head, self._base.storage),
+                NextValue(self._completed.status, 0),
+                NextValue(pending, 0),
+            ).Elif(head != self._tail.storage,
+                NextValue(word, 0),
+                NextState("FETCH")
+            )
+        )
+        fsm.act("FETCH",
+            self._busy.status.eq(1),
+            desc_bus.cyc.eq(1),
+            desc_bus.stb.eq(1),
+            desc_bus.we.eq(0),
+            desc_bus.sel.eq(0b1111),
+            desc_bus.adr.eq(head[2:] + word),
+            If(desc_bus.ack,
+                Case(word, {i: NextValue(reg, desc_bus.dat_r) for i, reg in enumerate(desc)}),
+                NextValue(word, word + 1),
+                If(word == 3,
+                    NextState("RUN")
+                )
+            )
+        )
+        fsm.act("RUN",
+            self._busy.status.eq(1),
+            engine.enable.eq(1),
+            If(engine.done,
+                NextState("COMPLETE")
+            )
+        )
+        completed = pending + 1
+        drained   = next_desc == self._tail.storage
+        fsm.act("COMPLETE",
+            #the data engine is disabled for this cycle, which resets it for the next descriptor
+            self._busy.status.eq(1),
+            NextValue(head, next_desc),
+            NextValue(self._completed.status, self._completed.status + 1),
+            If(flags[0] | drained | ((self._coalesce.storage != 0) & (completed >= self._coalesce.storage)),
+                self.irq.eq(1),
+                NextValue(pending, 0),
+            ).Else(
+                NextValue(pending, completed),
+            ),
+            If(flags[1],
+                NextState("STOPPED")
+            ).Else(
+                NextState("IDLE")
+            )
+        )
+        fsm.act("STOPPED",
+            If(~self._enable.storage,
+                NextState("IDLE")
+            )
+        )
+
+####Controls / "Cores"---------------------------------------------------------------------
+#   This section contains classes for high-level control of the data flow
+#   DMATestCore is part of WishboneDmaTest and WishboneDmaTestSimple
+ 
+class DMATestCore(LiteXModule):    
+    from litex.soc.interconnect import stream
+    def __init__(self, data_width):
+        self.sink   = stream.Endpoint([("data", data_width)])
+        self.source   = stream.Endpoint([("data", data_width)])
+        #This is the "high level" control logic
+        self.start      = CSRStorage(description="Run the test")
+        self.wr_done    = CSRStatus(description="Writing complete")
+        self.rd_done    = CSRStatus(description="Reading complete")
+        
+        #some additional CSRs for debugging and understanding what's going on
+        self.state = CSRStatus(size=3, description="Current State")
+        self.count = CSRStatus(size=8, description="Counter for data read and stuff")
+        
+         #set up fifo to temporarily store values
+        self.fifo = fifo = stream.SyncFIFO([("data", data_width)], 512, buffered = True)
+        
+        #Like most of this, this is based on the LiteSDCard construct
+        #I think this is just assigning variables or cleaner code?
+        #maabe the methods from Migen need it idk
+        start = self.start.re   #this way the signal should be usable as a "pulse"
+        wr_done = self.wr_done.status
+        rd_done = self.rd_done.status
+    
+        data_count = Signal(8)  #8-bit count should be enough
+        
+        #in analogy to the block delimiter in SDCore, limit data to 32 words
+        """
+        When using the "last" signals for flow control, this setup wiht the counter
+        imposes a hard limit on the length of transmissions. Set up the way it is
+        any transmission will be stopped after 32 words.
+        """
+        self.sync += [
+            If(self.sink.valid & self.sink.ready, #under this condition,   
+                data_count.eq(data_count + 1),    #a word will be transmitted with each clock cycle 
+                If(self.sink.last, data_count.eq(0)) #reset counter on transmission of last word
+            )
+        ]
+        self.comb += If(data_count == 31, 
+            self.sink.last.eq(1) #set sink.last, when 31 of 32 words sent
+            ).Elif(data_count == 0,
+                self.sink.first.eq(1)   #set sink.first for reception of first data
+            )
+        
+        #I will probably need some kind of state machine for control flow
+    
+        #Control FSM
+        self.fsm = fsm = FSM()
+        fsm.act("IDLE",
+            #initial setup
+            NextValue(wr_done, 0),
+            NextValue(rd_done, 0),
+            NextValue(data_count, 0),
+            NextValue(self.state.status, 0),
+            If(start,
+                NextValue(wr_done, 0),
+                NextValue(rd_done, 0),
+                NextState("DATA-WRITE")
+            )
+        )
+        fsm.act("DATA-WRITE",
+            self.sink.connect(fifo.sink),
+            NextValue(self.state.status, 1),
+            If(fifo.sink.valid & fifo.sink.ready & fifo.sink.last,
+                #When last word is sent, set wr_done and go to next state
+                NextValue(wr_done, 1),
+                NextState("WAIT")  
+            )
+        )
+        fsm.act("WAIT",
+            NextValue(self.state.status, 2),
+            If(start,
+                NextState("DATA-READ")
+            )
+        )
+        fsm.act("DATA-READ",
+            NextValue(self.state.status, 3),
+            fifo.source.connect(self.source),
+            If(fifo.source.last & fifo.source.ready,
+               #fifo.source.connect(self.source),
+               NextValue(self.state.status, 4),                
+               NextValue(rd_done, 1),   #on last word, set rd_done
+               NextState("IDLE")       #and proceed to IDLE state
+            )
+        )
+
+
+class DMABenchCore(LiteXModule):
+    """
+    Streaming counterpart of DMATestCore: words go from sink through the FIFO to source
+    while they arrive, so a transfer can be much longer than the FIFO (DMATestCore stores
+    a whole block first and stops after 32 words). The length is set by CSR, in words of
+    data_width (at least 1). All counters are reset by "start" and count cycles:
+        -latency        start until the first word is accepted on sink
+        -cycles         start until the last word is accepted on source
+        -sink_stalls    sink.valid, but sink.ready low (FIFO/downstream can't keep up)
+        -source_stalls  no source.valid while words are outstanding (upstream can't keep up)
+        -<name>_active  per bus master in masters ({name: Wishbone interface}): first cyc after
+                        start until its last ack, so each master's bandwidth can be seen
+    bytes/cycle = length * data_width/8 / cycles
+    """
+    def __init__(self, data_width, fifo_depth=512, masters=None):
+        self.sink   = stream.Endpoint([("data", data_width)])
+        self.source = stream.Endpoint([("data", data_width)])
+        self.start  = CSRStorage(description="Start the transfer (any write).")
+        self.length = CSRStorage(32, reset=32, description="Transfer length in words of data_width.")
+        self.done   = CSRStatus(description="Transfer complete.")
+        self.latency        = CSRStatus(32, description="First-beat latency in cycles.")
+        self.cycles         = CSRStatus(32, description="Total transfer cycles.")
+        self.sink_stalls    = CSRStatus(32, description="Cycles with sink.valid & ~sink.ready.")
+        self.source_stalls  = CSRStatus(32, description="Cycles without source.valid during the transfer.")
+        self.done_pulse = Signal()  #for the event manager of the wrapper
+
+        self.fifo = fifo = stream.SyncFIFO([("data", data_width)], fifo_depth, buffered=True)
+
+        running   = Signal()
+        got_first = Signal()
+        words_in  = Signal(32)
+        words_out = Signal(32)
+        length    = self.length.storage
+
+        #first/last are generated here from the word counts, whatever upstream sends
+        self.comb += [
+            If(running & (words_in != length),
+                self.sink.connect(fifo.sink, omit={"first", "last"}),
+            ),
+            If(running,
+                fifo.source.connect(self.source, omit={"first", "last"}),
+                self.source.first.eq(words_out == 0),
+                self.source.last.eq(words_out == (length - 1)),
+            ),
+        ]
+
+        sink_beat   = self.sink.valid & self.sink.ready
+        source_beat = self.source.valid & self.source.ready
+        self.sync += [
+            self.done_pulse.eq(0),
+            If(self.start.re,
+                running.eq(1),
+                got_first.eq(0),
+                words_in.eq(0),
+                words_out.eq(0),
+                self.done.status.eq(0),
+                self.latency.status.eq(0),
+                self.cycles.status.eq(0),
+                self.sink_stalls.status.eq(0),
+                self.source_stalls.status.eq(0),
+            ).Elif(running,
+                self.cycles.status.eq(self.cycles.status + 1),
+                If(~got_first & ~sink_beat,
+                    self.latency.status.eq(self.latency.status + 1)
+                ),
+                If(self.sink.valid & ~self.sink.ready,
+                    self.sink_stalls.status.eq(self.sink_stalls.status + 1)
+                ),
+                If(~self.source.valid,
+                    self.source_stalls.status.eq(self.source_stalls.status + 1)
+                ),
+                If(sink_beat,
+                    got_first.eq(1),
+                    words_in.eq(words_in + 1),
+                ),
+                If(source_beat,
+                    words_out.eq(words_out + 1),
+                    If(self.source.last,
+                        running.eq(0),
+                        self.done.status.eq(1),
+                        self.done_pulse.eq(1),
+                    )
+                )
+            )
+        ]
+
+        #active cycles per master, also after done (the writer drains its FIFO afterwards)
+        for name, bus in (masters or {}).items():
+            active  = CSRStatus(32, name=f"{name}_active", description=f"Cycles from the first cyc to the last ack of the {name} master.")
+            setattr(self, f"{name}_active", active)
+            started = Signal()
+            count   = Signal(32)
+            self.sync += [
+                If(self.start.re,
+                    started.eq(0),
+                    count.eq(0),
+                    active.status.eq(0),
+                ).Elif(started | bus.cyc,
+                    started.eq(1),
+                    count.eq(count + 1),
+                    If(bus.ack,
+                        active.status.eq(count + 1)
+                    )
+                )
+            ]
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import contextlib
+import functools
+
+from migen import *
+
+from litex.gen import LiteXModule
+from litex.soc.interconnect import wishbone, axi, stream
+from litex.soc.integration.soc import SoCRegion, SoCBusHandler
+
+""" External bus interfaces for litex_generator.py
+
+    Every entry of external_bus_regions in the config is a master interface of the SoC (pads
+    <name>_*) with its own bus region:
+        external_bus_regions:
+          ext_ram:
+            origin: 0x20000000   #optional, allocated if missing (needed without a CPU)
+            size: 0x01000000     #power of two
+            cached: "True"       #default "False"
+            l2_size: 0x2000      #optional, cached regions only
+            l2_line_width: 128   #optional, default bus_data_width
+            slices: 2            #optional, register slices between pads and SoC (see below)
+    external_bus_master_interface: "True" without external_bus_regions is the uncached
+    mmap_bus_m window at 0xa0000000 (DEFAULT_REGIONS), as before.
+
+    Cached regions are cached by the CPU (LiteX allocates them outside the IO region). An L2
+    cache (LiteX's wishbone.Cache, write-back and direct-mapped) can be put in front of them:
+        SoC bus -> cache (l2_size bytes, lines of l2_line_width bits) -> external bus
+    A line is fetched/written back with one access if the line width is the bus width,
+    otherwise with several accesses through a wishbone.Converter. Since the cache is a Wishbone
+    module, AXI/AXI-Lite external buses are connected through LiteX's Wishbone -> AXI bridges.
+
+    Register slices (slices: n, external_bus_slave_slices/external_bus_master_slices for
+    mmap_bus_s/mmap_bus_m) cut the paths between the pads and the interconnect, so the SoC
+    doesn't add combinational logic to the paths of the surrounding design:
+        -AXI/AXI-Lite  a skid buffer (stream.Buffer, valid and ready piped) on every channel:
+                       +1 cycle per channel and slice, full throughput
+        -Wishbone      WishboneRegisterSlice: the request and the response are registered, one
+                       access at a time: +2 cycles per access and slice, bursts become single
+                       accesses
+    The order on a master interface is SoC bus -> L2 cache -> slices -> pads.
+
+    Converters: the main bus has bus_data_width bits. LiteX adapts every master/slave of another
+    width or standard when it is added (SoCBusHandler.add_adapter(): CPU, CSR bridge, peripherals,
+    external interfaces, ...), the DMA engines are as wide as the bus and convert to the width
+    of their stream with a stream.Converter. converter_report() lists all of them:
+        -bus     per bus master/slave: from/to standard and width, inserted modules
+        -other   every other width converter in the SoC (DMA streams, L2 lines) by its path
+"""
+
+DEFAULT_REGIONS = {
+    "mmap_bus_m": {"origin": 0xa000_0000, "size": 0x1000_0000, "cached": False, "l2_size": None, "l2_line_width": None,
+        "slices": 0},
+}
+
+# Helpers -----------------------------------------------------------------------------------------
+
+def make_bus(standard, data_width, address_width):
+    #the pads side of the external interfaces, same as before for mmap_bus_s/mmap_bus_m
+    return {
+        "wishbone" : wishbone.Interface(data_width=data_width, adr_width=address_width),
+        "axi-lite" : axi.AXILiteInterface(data_width=data_width, address_width=address_width),
+        "axi" : axi.AXIInterface(data_width=data_width, address_width=address_width), #TODO: Test if this works properly!
+    }[standard]
+
+def wishbone_to(bus, data_width, address_width):
+    """Wishbone interface (word addressed) driving bus, and the bridge module if one is needed."""
+    if isinstance(bus, wishbone.Interface):
+        return bus, None
+    wb = wishbone.Interface(data_width=data_width, adr_width=address_width - log2_int(data_width//8))
+    bridge = {
+        axi.AXILiteInterface : axi.Wishbone2AXILite,
+        axi.AXIInterface     : axi.Wishbone2AXI,
+    }[type(bus)](wb, bus)
+    return wb, bridge
+
+# Register Slices ---------------------------------------------------------------------------------
+
+def _like(bus):
+    #another interface with the same parameters
+    if isinstance(bus, wishbone.Interface):
+        return wishbone.Interface(data_width=bus.data_width, adr_width=bus.adr_width, addressing=bus.addressing)
+    if isinstance(bus, axi.AXILiteInterface):
+        return axi.AXILiteInterface(data_width=bus.data_width, address_width=bus.address_width)
+    return axi.AXIInterface(data_width=bus.data_width, address_width=bus.address_width, id_width=bus.id_width)
+
+class WishboneRegisterSlice(LiteXModule):
+    def __init__(self, master, slave):
+        busy  = Signal() #request registered, waiting for the slave
+        done  = Signal() #response to the master, for one cycle
+        ack   = Signal()
+        err   = Signal()
+        dat_r = Signal(len(master.dat_r))
+        self.sync += [
+            done.eq(0),
+            If(busy,
+                If(slave.ack | slave.err,
+                    busy.eq(0),
+                    done.eq(1),
+                    ack.eq(slave.ack),
+                    err.eq(slave.err),
+                    dat_r.eq(slave.dat_r),
+                )
+            #the master still holds stb in the cycle of the ack, that's no new access
+            ).Elif(master.cyc & master.stb & ~done,
+                busy.eq(1),
+                slave.adr.eq(master.adr),
+                slave.dat_w.eq(master.dat_w),
+                slave.sel.eq(master.sel),
+                slave.we.eq(master.we),
+            )
+        ]
+        self.comb += [
+            slave.cyc.eq(busy),
+            slave.stb.eq(busy),
+            master.ack.eq(done & ack),
+            master.err.eq(done & err),
+            master.dat_r.eq(dat_r),
+        ]
+
+class AXIRegisterSlice(LiteXModule):
+    def __init__(self, master, slave):
+        #AXI and AXI-Lite: a skid buffer per channel, b/r go from slave to master
+        for channel in ["aw", "w", "b", "ar", "r"]:
+            source, sink = getattr(master, channel), getattr(slave, channel)
+            if channel in ["b", "r"]:
+                source, sink = sink, source
+            buffer = stream.Buffer(source.description, pipe_valid=True, pipe_ready=True)
+            setattr(self.submodules, channel, buffer)
+            self.comb += [
+                source.connect(buffer.sink),
+                buffer.source.connect(sink),
+            ]
+
+class RegisterSlices(LiteXModule):
+    def __init__(self, master, slave, stages):
+        #master: the side that starts the accesses
+        assert stages >= 1
+        slice_cls = WishboneRegisterSlice if isinstance(master, wishbone.Interface) else AXIRegisterSlice
+        buses = [master] + [_like(master) for _ in range(stages - 1)] + [slave]
+        for n in range(stages):
+            setattr(self.submodules, f"slice{n}", slice_cls(buses[n], buses[n + 1]))
+
+# L2 Cache ----------------------------------------------------------------------------------------
+
+class ExternalL2Cache(LiteXModule):
+    def __init__(self, bus, size, line_width, data_width, address_width):
+        #bus: the external interface; self.bus: the Wishbone slave for the SoC bus
+        self.bus = wishbone.Interface(data_width=data_width, adr_width=address_width - log2_int(data_width//8))
+        line = wishbone.Interface(data_width=line_width, address_width=32, addressing="word")
+        #cachesize counts words of the master (the SoC bus)
+        self.cache = wishbone.Cache(cachesize=size//(data_width//8), master=self.bus, slave=line, reverse=False)
+        wb, bridge = wishbone_to(bus, data_width, address_width)
+        if bridge is not None:
+            self.bridge = bridge
+        if line_width != data_width:
+            self.converter = wishbone.Converter(line, wb)
+        else:
+            self.comb += line.connect(wb)
+
+# External Buses ----------------------------------------------------------------------------------
+
+def add_external_bus(soc, platform, name, region, standard, data_width, address_width):
+    """Add a master interface with its own region (see above), returns the external interface."""
+    bus = make_bus(standard, data_width, address_width)
+    slave = bus
+    if region.get("slices"):
+        slave = _like(bus)
+        setattr(soc.submodules, f"{name}_slices", RegisterSlices(slave, bus, region["slices"]))
+    if region.get("l2_size"):
+        l2 = ExternalL2Cache(slave, region["l2_size"], region.get("l2_line_width") or data_width,
+            data_width, address_width)
+        setattr(soc.submodules, f"{name}_l2_cache", l2)
+        slave = l2.bus
+    soc.bus.add_slave(name=name, slave=slave,
+        region=SoCRegion(origin=region.get("origin"), size=region["size"], cached=region.get("cached", False)))
+    platform.add_extension(bus.get_ios(name))
+    pads = platform.request(name)
+    soc.comb += bus.connect_to_pads(pads, mode="master")
+    return bus
+
+# Converter Report --------------------------------------------------------------------------------
+
+BUS_NAMES = {
+    wishbone.Interface   : "wishbone",
+    axi.AXILiteInterface : "axi-lite",
+    axi.AXIInterface     : "axi",
+}
+BUS_CONVERTERS = (wishbone.Converter, axi.AXILiteConverter, axi.AXIConverter)
+
+def _bus_name(interface):
+    return BUS_NAMES.get(type(interface), type(interface).__name__)
+
+def _track_adapters(add_adapter):
+    #LiteX only logs the adapters it inserts, keep them on the bus handler (bus.adapters) as well
+    @functools.wraps(add_adapter)
+    def wrapped(self, name, interface, direction="m2s"):
+        before = len(self._submodules)
+        adapted = add_adapter(self, name, interface, direction)
+        modules = [m for _, m in self._submodules[before:]]
+        if modules:
+            self.__dict__.setdefault("adapters", []).append({
+                "name"      : name,
+                "direction" : {"m2s": "master", "s2m": "slave"}[direction],
+                "from"      : f"{_bus_name(interface)} {interface.data_width}-bit",
+                "to"        : f"{_bus_name(adapted)} {adapted.data_width}-bit",
+                "modules"   : [type(m).__name__ for m in modules],
+            })
+        return adapted
+    wrapped.tracks_adapters = True
+    return wrapped
+
+@contextlib.contextmanager
+def track_adapters():
+    """Record the adapters of SoCBusHandler.add_adapter() in bus.adapters, only while the
+    block runs, so other SoCs built in the same process (server, sweep) aren't affected."""
+    original = SoCBusHandler.add_adapter
+    if getattr(original, "tracks_adapters", False):
+        yield #already tracking (nested)
+        return
+    SoCBusHandler.add_adapter = _track_adapters(original)
+    try:
+        yield
+    finally:
+        SoCBusHandler.add_adapter = original
+
+def tracking_adapters(method):
+    """Decorator for the methods that add bus masters/slaves (SoC __init__ and finalize)."""
+    @functools.wraps(method)
+    def wrapped(*args, **kwargs):
+        with track_adapters():
+            return method(*args, **kwargs)
+    return wrapped
+
+def _walk(module, path):
+    for name, submodule in module._submodules:
+        yield from _walk(submodule, path + [name]) if name is not None else _walk(submodule, path)
+    yield module, path
+
+def converter_report(soc):
+    """The width/standard converters of the (finalized) SoC, see above."""
+    others = []
+    for module, path in _walk(soc, []):
+        if path[:1] == ["bus"]:
+            continue #in bus.adapters
+        if isinstance(module, stream.Converter):
+            widths = len(module.sink.data), len(module.source.data)
+        elif isinstance(module, BUS_CONVERTERS):
+            widths = module.master.data_width, module.slave.data_width
+        else:
+            continue
+        if widths[0] != widths[1]:
+            others.append({"path": ".".join(path) or "top", "type": type(module).__name__,
+                "from": f"{widths[0]}-bit", "to": f"{widths[1]}-bit"})
+    return {
+        "bus_data_width" : soc.bus.data_width,
+        "bus"            : getattr(soc.bus, "adapters", []),
+        "other"          : others,
+    }
+
+def format_converter_report(report):
+    lines = [f"Converters ({report['bus_data_width']}-bit bus): "
+        f"{len(report['bus'])} bus adapters, {len(report['other'])} others"]
+    for a in report["bus"]:
+        lines.append(f"    {a['name']} ({a['direction']}): {a['from']} -> {a['to']} ({', '.join(a['modules'])})")
+    for c in report["other"]:
+        lines.append(f"    {c['path']}: {c['from']} -> {c['to']} ({c['type']})")
+    return "\n".join(lines)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import importlib.metadata
+import functools
+import hashlib
+import shutil
+import json
+import time
+import os
+
+from generator_aux_config import canonical_json
+
+""" Content-addressed cache for generated SoCs, used by litex_generator.generate()
+
+    The key is a hash over everything that can change the generated files:
+        -the normalized config (see litex_generator.normalize_config) and the working
+         directory, since relative output paths are resolved against it
+        -the contents of every external_modules[*].source file and of the integrated_rom_init
+         file (firmware, see generator_sim.py)
+        -the installed LiteX/Migen/pythondata versions and the generator scripts themselves
+    The cache settings (cache_dir, cache_max_size, pll_cache) are not part of the key.
+
+    An entry stores every file that a generation produced (gateware, csr.json/csv, software
+    headers, the reports in the output directory) together with its absolute destination, so a hit simply writes them back.
+    The store is bounded by cache_max_size; least recently used entries are evicted first.
+    Hit/miss counters are kept in stats.json inside the cache directory.
+"""
+
+CACHE_CONFIG_KEYS = ["cache_dir", "cache_max_size", "pll_cache"]
+DEFAULT_MAX_SIZE  = 1 << 30 #1 GiB
+
+def _hash_file(h, path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+
+@functools.lru_cache(maxsize=None)
+def _toolchain_versions():
+    #LiteX, Migen and the pythondata packages (CPU sources etc.) all end up in the output
+    versions = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"] or ""
+        if name.lower().startswith(("litex", "migen", "pythondata")):
+            versions[name.lower()] = dist.version
+    return versions
+
+def get_toolchain_versions():
+    #scanning every installed distribution takes ~45 ms, do it once per process
+    return dict(_toolchain_versions())
+
+def get_generator_digest():
+    #generator scripts live next to this file, changes to them invalidate the whole cache
+    h = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for file in sorted(os.listdir(here)):
+        if file.endswith(".py"):
+            h.update(file.encode())
+            _hash_file(h, os.path.join(here, file))
+    return h.hexdigest()
+
+class GenerationCache:
+    def __init__(self, cache_dir, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size  = int(max_size)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, args):
+        """Return a cache for the config or None if caching isn't enabled (no cache_dir)."""
+        if args.get("cache_dir") is None:
+            return None
+        return cls(args["cache_dir"], args.get("cache_max_size") or DEFAULT_MAX_SIZE)
+
+    # Keys -----------------------------------------------------------------------------------------
+
+    def key(self, args):
+        h = hashlib.sha256()
+        config = {k: v for k, v in args.items() if k not in CACHE_CONFIG_KEYS}
+        h.update(canonical_json(config).encode())
+        h.update(os.getcwd().encode())
+        for i in sorted(args.get("external_modules") or {}, key=str):
+            source = args["external_modules"][i]["source"]
+            if source in [None, "None"]:
+                continue
+            h.update(str(source).encode())
+            if os.path.isfile(source):
+                _hash_file(h, source)
+            else:
+                h.update(b"<missing>") #generation will complain about this, not the cache
+        #SoCCore reads the ROM contents from this file (or takes a list of words)
+        rom_init = args.get("integrated_rom_init")
+        if isinstance(rom_init, str) and os.path.isfile(rom_init):
+            _hash_file(h, rom_init)
+        h.update(json.dumps(get_toolchain_versions(), sort_keys=True).encode())
+        h.update(get_generator_digest().encode())
+        return h.hexdigest()
+
+    # Entries --------------------------------------------------------------------------------------
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _read_meta(self, key):
+        try:
+            with open(os.path.join(self._entry_dir(key), "meta.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, entry_dir, meta):
+        with open(os.path.join(entry_dir, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=1)
+
+    def restore(self, key, optional_outputs=()):
+        """Write the files of a cached generation back to their destinations.
+        optional_outputs are files in the output directory that only some configs produce
+        (reports); those the entry doesn't list are removed, so nothing of an earlier config
+        is left next to the restored output.
+        Returns the stored output directories on a hit, None on a miss."""
+        meta = self._read_meta(key)
+        if meta is None:
+            self._count("misses")
+            return None
+        entry_dir = self._entry_dir(key)
+        for i, destination in enumerate(meta["files"]):
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            #staged sources may be hardlinks (see generator_aux_staging.py), don't write through them
+            if os.path.lexists(destination):
+                os.remove(destination)
+            shutil.copyfile(os.path.join(entry_dir, "files", str(i)), destination)
+        for filename in optional_outputs:
+            path = os.path.join(meta["dirs"]["output_dir"], filename)
+            if path not in meta["files"] and os.path.exists(path):
+                os.remove(path)
+        meta["last_used"] = time.time()
+        self._write_meta(entry_dir, meta)
+        self._count("hits")
+        return meta["dirs"]
+
+    def store(self, key, dirs, files):
+        """Store the given (absolute) files of a finished generation under key."""
+        entry_dir = self._entry_dir(key)
+        tmp_dir = entry_dir + ".tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(os.path.join(tmp_dir, "files"))
+        size = 0
+        files = [os.path.abspath(f) for f in files if os.path.isfile(f)]
+        for i, source in enumerate(files):
+            shutil.copyfile(source, os.path.join(tmp_dir, "files", str(i)))
+            size += os.path.getsize(source)
+        self._write_meta(tmp_dir, {
+            "dirs"      : dirs,
+            "files"     : files,
+            "size"      : size,
+            "last_used" : time.time(),
+        })
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.rename(tmp_dir, entry_dir)
+        self._count("stores")
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the store fits into max_size."""
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            if key.endswith(".tmp"):
+                continue
+            meta = self._read_meta(key)
+            if meta is not None:
+                entries.append((meta["last_used"], meta["size"], key))
+        total = sum(size for _, size, _ in entries)
+        for last_used, size, key in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+            total -= size
+            self._count("evictions")
+
+    # Statistics -----------------------------------------------------------------------------------
+
+    def _read_counters(self):
+        counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        try:
+            with open(os.path.join(self.cache_dir, "stats.json")) as f:
+                counters.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return counters
+
+    def _count(self, counter):
+        counters = self._read_counters()
+        counters[counter] += 1
+        with open(os.path.join(self.cache_dir, "stats.json"), "w") as f:
+            json.dump(counters, f, indent=1)
+
+    def stats(self):
+        stats = self._read_counters()
+        entries = [self._read_meta(key) for key in os.listdir(self.cache_dir) if not key.endswith(".tmp")]
+        entries = [meta for meta in entries if meta is not None]
+        stats["entries"] = len(entries)
+        stats["size"]    = sum(meta["size"] for meta in entries)
+        return stats
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import json
+import yaml
+
+""" Config loading, validation and normalization for litex_generator.py
+
+    The config files written by the GUI use strings for a few special values ("True",
+    "False", "None") and leave the external_modules entries entirely up to the user. Before,
+    a bad entry only failed somewhere deep inside elaboration. Now the whole tree is checked
+    up front against the schema below and all problems are reported at once (ConfigError).
+
+    The schema is a table of option name -> (converter, default). A converter turns the YAML
+    value into its canonical Python type or raises ValueError with a readable reason. Options
+    that aren't in the table are passed on unchanged, as they usually are SoCCore arguments.
+
+    normalize_config() returns the canonical form:
+        -"True"/"False"/"None" strings are replaced by their Python values, everywhere
+        -all *clk_freq options are floats, sizes and widths are ints
+        -missing generator options are filled in with their defaults
+    canonical_json() turns that into a stable string for hashing (cache, output reuse).
+"""
+
+class ConfigError(ValueError):
+    def __init__(self, errors):
+        self.errors = errors
+        ValueError.__init__(self, "Invalid config:\n" + "\n".join("    " + e for e in errors))
+
+# Loading -----------------------------------------------------------------------------------------
+
+#the C implementation of the loader is a lot faster for big configs, but isn't always available
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def load_config_file(filename):
+    with open(filename) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+# Converters --------------------------------------------------------------------------------------
+
+SPECIAL_VALUES = {"False": False, "True": True, "None": None}
+
+def _special(v):
+    return SPECIAL_VALUES[v] if isinstance(v, str) and v in SPECIAL_VALUES else v
+
+def to_bool(v):
+    v = _special(v)
+    if v is None:
+        return False
+    if not isinstance(v, bool):
+        raise ValueError(f"expected True or False, got {v!r}")
+    return v
+
+def to_int(v):
+    v = _special(v)
+    if isinstance(v, bool):
+        raise ValueError(f"expected an integer, got {v!r}")
+    if isinstance(v, str):
+        try:
+            v = int(v, 0)
+        except ValueError:
+            raise ValueError(f"expected an integer, got {v!r}")
+    if not isinstance(v, int):
+        raise ValueError(f"expected an integer, got {v!r}")
+    return v
+
+def to_positive_int(v):
+    v = to_int(v)
+    if v <= 0:
+        raise ValueError(f"must be positive, got {v}")
+    return v
+
+def to_non_negative_int(v):
+    v = to_int(v)
+    if v < 0:
+        raise ValueError(f"can't be negative, got {v}")
+    return v
+
+def to_freq(v):
+    v = _special(v)
+    if v is None:
+        return None
+    try:
+        v = float(v)
+    except (TypeError, ValueError):
+        raise ValueError(f"expected a frequency in Hz, got {v!r}")
+    if v <= 0:
+        raise ValueError(f"must be positive, got {v}")
+    return v
+
+def to_str(v):
+    v = _special(v)
+    if v is None:
+        return None
+    if not isinstance(v, (str, int, float)) or isinstance(v, bool):
+        raise ValueError(f"expected a string, got {v!r}")
+    return str(v)
+
+def one_of(*choices):
+    def convert(v):
+        v = _special(v)
+        if v not in choices:
+            raise ValueError(f"expected one of {', '.join(map(str, choices))}, got {v!r}")
+        return v
+    return convert
+
+def width_of(*choices):
+    def convert(v):
+        v = to_int(v)
+        if v not in choices:
+            raise ValueError(f"expected one of {', '.join(map(str, choices))}, got {v}")
+        return v
+    return convert
+
+def to_clock_domains(v):
+    v = _special(v)
+    if v is None:
+        return {}
+    if not isinstance(v, dict):
+        raise ValueError(f"expected a mapping of domain names to frequencies, got {v!r}")
+    domains = {}
+    for name, freq in v.items():
+        if not _is_identifier(name) or name in RESERVED_DOMAINS:
+            raise ValueError(f"{name!r} can't be the name of a clock domain")
+        domains[name] = to_freq(freq)
+        if domains[name] is None:
+            raise ValueError(f"{name}: expected a frequency in Hz")
+    return domains
+
+def optional(convert):
+    def wrapped(v):
+        v = _special(v)
+        return None if v is None else convert(v)
+    return wrapped
+
+# Schema ------------------------------------------------------------------------------------------
+
+#option: (converter, default); the defaults are what the generator assumed when an option is missing
+SCHEMA = {
+    "name"                          : (optional(to_str),           None),
+    "sys_clk_freq"                  : (to_freq,                    None),
+    "uart_name"                     : (optional(to_str),           "serial"),
+    "soft_i2c"                      : (to_bool,                    False),
+    "hard_i2c"                      : (to_bool,                    False),
+    "i2c_interrupt"                 : (to_bool,                    False),
+    "hard_spi"                      : (to_bool,                    False),
+    "soft_spi"                      : (to_bool,                    False),
+    "SDcard"                        : (to_bool,                    False),
+    "bus_standard"                  : (one_of("wishbone", "axi-lite", "axi"), "wishbone"),
+    #the widths LiteX's SoCBusHandler supports
+    "bus_data_width"                : (width_of(32, 64, 128, 256, 512), 32),
+    "bus_address_width"             : (width_of(32, 64),           32),
+    "external_bus_slave_interface"  : (to_bool,                    False),
+    "external_bus_master_interface" : (to_bool,                    False),
+    "external_bus_regions"          : (optional(_special),         None),
+    "external_bus_slave_slices"     : (to_non_negative_int,        0),
+    "external_bus_master_slices"    : (to_non_negative_int,        0),
+    # Generator options (see litex_generator.generate()).
+    "cache_dir"                     : (optional(to_str),           None),
+    "cache_max_size"                : (optional(to_positive_int),  None),
+    "reuse_output"                  : (to_bool,                    False),
+    "profile"                       : (optional(to_bool),          None),
+    "profile_cprofile"              : (to_bool,                    False),
+    "resource_report"               : (to_bool,                    False),
+    "dma_test"                      : (to_bool,                    False),
+    "dma_test_data_width"           : (optional(to_positive_int),  None),
+    "dma_bench"                     : (to_bool,                    False),
+    "dma_bench_data_width"          : (optional(to_positive_int),  None),
+    "dma_bench_fifo_depth"          : (optional(to_positive_int),  None),
+    "sg_dma_test"                   : (to_bool,                    False),
+    "dma_burst_length"              : (optional(to_positive_int),  None),
+    "dma_fifo_depth"                : (optional(to_positive_int),  None),
+    "bus_bursting"                  : (to_bool,                    False),
+    "bus_interconnect"              : (one_of("shared", "crossbar"), "shared"),
+    "staging_hardlinks"             : (to_bool,                    False),
+    "hierarchical"                  : (to_bool,                    False),
+    "hierarchy_jobs"                : (optional(to_positive_int),  None),
+    # Clocking (auto_pll: a PLL for the device instead of clk/rst from outside).
+    "auto_pll"                      : (to_bool,                    False),
+    "device"                        : (optional(one_of("Gatemate", "LatticeECP5", "iCE40", "XilinxS7",
+                                        "XilinxS6", "XilinxUS", "XilinxUSP")), None),
+    "speedgrade"                    : (optional(to_int),           None),
+    "pll_cache"                     : (optional(to_str),           None),
+    "clock_domains"                 : (to_clock_domains,           {}),
+}
+
+#domains the CRGs define themselves
+RESERVED_DOMAINS = ["sys", "por", "init"]
+PORT_DIRECTIONS = ["in", "out"]
+PORT_TYPES = ["csr", "stream"]
+PORT_IRQS = ["edge", "level", "change"]
+#attributes of LiteX's EventManager, so no event source (= port with an interrupt) can have these names
+EVENT_RESERVED = ["status", "pending", "enable", "irq"]
+
+def _is_identifier(name):
+    return isinstance(name, str) and name.isidentifier()
+
+def _normalize_port(port, path, errors):
+    if not isinstance(port, dict):
+        errors.append(f"{path}: expected a mapping with name, direction and size")
+        return port
+    port = dict(port)
+    for key in ["name", "direction", "size"]:
+        if key not in port:
+            errors.append(f"{path}: missing '{key}'")
+    if "name" in port and not _is_identifier(port["name"]):
+        errors.append(f"{path}.name: {port['name']!r} is not a valid Verilog identifier")
+    if "direction" in port and port["direction"] not in PORT_DIRECTIONS:
+        errors.append(f"{path}.direction: expected one of {', '.join(PORT_DIRECTIONS)}, got {port['direction']!r}")
+    if "size" in port:
+        try:
+            port["size"] = to_positive_int(port["size"])
+        except ValueError as e:
+            errors.append(f"{path}.size: {e}")
+    port["type"] = _special(port.get("type", "csr"))
+    if port["type"] not in PORT_TYPES:
+        errors.append(f"{path}.type: expected one of {', '.join(PORT_TYPES)}, got {port['type']!r}")
+    elif port["type"] == "stream":
+        #the width converter to/from the bus needs an integer ratio
+        size = port.get("size")
+        if isinstance(size, int) and (size < 8 or size & (size - 1)):
+            errors.append(f"{path}.size: stream ports need a power of two of at least 8, got {size}")
+        for key, convert, default in [("fifo_depth", to_positive_int, 16), ("async", to_bool, False)]:
+            try:
+                port[key] = convert(port.get(key, default))
+            except ValueError as e:
+                errors.append(f"{path}.{key}: {e}")
+    port["irq"] = _special(port.get("irq"))
+    if port["irq"] is not None:
+        if port["irq"] not in PORT_IRQS:
+            errors.append(f"{path}.irq: expected one of {', '.join(PORT_IRQS)}, got {port['irq']!r}")
+        elif port.get("direction") != "out" or port["type"] != "csr":
+            errors.append(f"{path}.irq: only \"out\" CSR ports can have an interrupt")
+    if (port["irq"] is not None or port["type"] == "stream") and port.get("name") in EVENT_RESERVED:
+        errors.append(f"{path}.name: ports with an interrupt can't be named {', '.join(EVENT_RESERVED)}")
+    return port
+
+def _normalize_module(module, path, errors):
+    if not isinstance(module, dict):
+        errors.append(f"{path}: expected a mapping")
+        return module
+    module = {k: _special(v) for k, v in module.items()}
+    for key in ["module_name", "instance_name", "ports"]:
+        if key not in module:
+            errors.append(f"{path}: missing '{key}'")
+    module.setdefault("source", None)
+    module.setdefault("parameters", None)
+    #wrapper options: CSR packing, register window (GenericVlogModuleCSR only), clock domain
+    for key, convert, default in [
+        ("pack_csr",      to_bool,                                 False),
+        ("bus_interface", optional(one_of("wishbone", "axi-lite")), None),
+        ("bus_origin",    optional(to_int),                        None),
+        ("bus_size",      to_positive_int,                         0x1000),
+        ("clock_domain",  to_str,                                  "sys"),
+    ]:
+        try:
+            module[key] = convert(module.get(key, default))
+        except ValueError as e:
+            errors.append(f"{path}.{key}: {e}")
+    if module["bus_interface"] is not None:
+        if module["source"] is None:
+            errors.append(f"{path}.bus_interface: only modules with a source can have a register window")
+        if isinstance(module["bus_size"], int) and module["bus_size"] & (module["bus_size"] - 1):
+            errors.append(f"{path}.bus_size: must be a power of two, got {module['bus_size']:#x}")
+    if module["source"] is not None and not isinstance(module["source"], str):
+        errors.append(f"{path}.source: expected a file name or None, got {module['source']!r}")
+    for key in ["module_name", "instance_name"]:
+        if key in module and not _is_identifier(module[key]):
+            errors.append(f"{path}.{key}: {module[key]!r} is not a valid identifier")
+
+    parameters = module["parameters"]
+    if parameters is not None:
+        if not isinstance(parameters, dict):
+            errors.append(f"{path}.parameters: expected a mapping or None")
+        else:
+            for k, v in parameters.items():
+                if not _is_identifier(k):
+                    errors.append(f"{path}.parameters: {k!r} is not a valid parameter name")
+                if not isinstance(v, (int, float, str)):
+                    errors.append(f"{path}.parameters.{k}: expected a number or string, got {v!r}")
+
+    ports = module.get("ports")
+    if ports is None:
+        module["ports"] = {}
+    elif not isinstance(ports, dict):
+        errors.append(f"{path}.ports: expected a mapping")
+    else:
+        module["ports"] = {k: _normalize_port(p, f"{path}.ports.{k}", errors) for k, p in ports.items()}
+        names = [p.get("name") for p in module["ports"].values() if isinstance(p, dict)]
+        for name in sorted({n for n in names if names.count(n) > 1}, key=str):
+            errors.append(f"{path}.ports: port name {name!r} is used more than once")
+    return module
+
+def _normalize_region(region, path, bus_data_width, errors):
+    if not isinstance(region, dict):
+        errors.append(f"{path}: expected a mapping with size and optionally origin, cached, l2_size, l2_line_width")
+        return region
+    region = {k: _special(v) for k, v in region.items()}
+    if "size" not in region:
+        errors.append(f"{path}: missing 'size'")
+    for key, convert, default in [
+        ("origin",        optional(to_int),                                None),
+        ("size",          to_positive_int,                                 None),
+        ("cached",        to_bool,                                         False),
+        ("l2_size",       optional(to_positive_int),                       None),
+        ("l2_line_width", optional(width_of(32, 64, 128, 256, 512, 1024)), None),
+        ("slices",        to_non_negative_int,                             0),
+    ]:
+        if key not in region:
+            region[key] = default
+            continue
+        try:
+            region[key] = convert(region[key])
+        except ValueError as e:
+            errors.append(f"{path}.{key}: {e}")
+            region[key] = None
+    if isinstance(region["size"], int) and region["size"] & (region["size"] - 1):
+        errors.append(f"{path}.size: must be a power of two, got {region['size']:#x}")
+    if region["l2_line_width"] is not None and region["l2_size"] is None:
+        errors.append(f"{path}.l2_line_width: only used with l2_size")
+    if region["l2_size"] is not None:
+        #an L2 in front of an IO region would return stale register values
+        if region["cached"] is not True:
+            errors.append(f"{path}.l2_size: only cached regions can have an L2 cache")
+        line_width = region["l2_line_width"] or bus_data_width
+        if region["l2_size"] & (region["l2_size"] - 1):
+            errors.append(f"{path}.l2_size: must be a power of two, got {region['l2_size']:#x}")
+        elif isinstance(line_width, int) and region["l2_size"] < 2*line_width//8:
+            errors.append(f"{path}.l2_size: must hold at least two lines ({2*line_width//8} bytes)")
+        if isinstance(line_width, int) and isinstance(bus_data_width, int) and line_width < bus_data_width:
+            errors.append(f"{path}.l2_line_width: can't be smaller than bus_data_width ({bus_data_width})")
+    return region
+
+def normalize_config(config):
+    """Validate the whole config and return its canonical form. Raises ConfigError listing
+    every problem that was found."""
+    if not isinstance(config, dict):
+        raise ConfigError(["the config must be a mapping of options"])
+    errors = []
+    normalized = {}
+    for key, value in config.items():
+        if key in SCHEMA:
+            convert, _ = SCHEMA[key]
+        elif "clk_freq" in key:
+            convert = to_freq
+        else:
+            convert = _special
+        try:
+            normalized[key] = convert(value)
+        except ValueError as e:
+            errors.append(f"{key}: {e}")
+            normalized[key] = value
+    for key, (_, default) in SCHEMA.items():
+        normalized.setdefault(key, default)
+
+    if normalized["auto_pll"] is True:
+        for key in ["device", "ref_clk_freq"]:
+            if normalized.get(key) is None:
+                errors.append(f"{key}: needed for auto_pll")
+
+    modules = _special(config.get("external_modules"))
+    if modules is not None:
+        if not isinstance(modules, dict):
+            errors.append("external_modules: expected a mapping of modules or None")
+        else:
+            modules = {k: _normalize_module(m, f"external_modules.{k}", errors) for k, m in modules.items()}
+            domains = normalized["clock_domains"] if isinstance(normalized["clock_domains"], dict) else {}
+            for k, m in modules.items():
+                if not isinstance(m, dict) or m.get("clock_domain") in [None, "sys"]:
+                    continue
+                if m["clock_domain"] not in domains:
+                    errors.append(f"external_modules.{k}.clock_domain: {m['clock_domain']!r} is not in clock_domains")
+                if m.get("bus_interface") is not None:
+                    errors.append(f"external_modules.{k}.bus_interface: register windows only work in the sys clock domain")
+            inst_names = [m.get("instance_name") for m in modules.values() if isinstance(m, dict)]
+            for name in sorted({n for n in inst_names if inst_names.count(n) > 1}, key=str):
+                errors.append(f"external_modules: instance name {name!r} is used more than once")
+    normalized["external_modules"] = modules
+
+    regions = normalized["external_bus_regions"]
+    if regions is not None:
+        if not isinstance(regions, dict):
+            errors.append("external_bus_regions: expected a mapping of interface names to regions or None")
+        else:
+            for k in regions:
+                if not _is_identifier(k) or k == "mmap_bus_s":
+                    errors.append(f"external_bus_regions: {k!r} can't be the name of an interface")
+            normalized["external_bus_regions"] = {k: _normalize_region(r, f"external_bus_regions.{k}",
+                normalized["bus_data_width"], errors) for k, r in regions.items()}
+            #without a CPU, LiteX puts the CSR region at 0x0 when the SoC is finalized, after the
+            #regions were allocated, so an allocated region would overlap it
+            if normalized.get("cpu_type") is None:
+                for k, r in normalized["external_bus_regions"].items():
+                    if isinstance(r, dict) and r.get("origin") is None:
+                        errors.append(f"external_bus_regions.{k}.origin: needed without a CPU (cpu_type: None)")
+
+    if errors:
+        raise ConfigError(errors)
+    return normalized
+
+def canonical_json(config):
+    """Stable string representation of a normalized config, cheap to hash."""
+    return json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import concurrent.futures
+import multiprocessing
+import hashlib
+import json
+import copy
+import os
+
+from migen import *
+from migen.fhdl.structure import _ClockDomainList
+from migen.fhdl.specials import Tristate, Memory, _MemoryPort
+from migen.fhdl.conv_output import ConvOutput
+from migen.fhdl.tools import (list_signals, list_targets, list_special_ios, list_clock_domains,
+    lower_complex_slices, insert_resets, lower_basics, lower_specials)
+
+from litex.gen.context import LiteXContext
+from litex.gen.fhdl import verilog
+from litex.gen.fhdl.namer import build_signal_namespace
+
+""" Hierarchical Verilog output for litex_generator.py (hierarchical: "True" in the config)
+
+    Migen flattens the whole SoC into one Verilog module. In hierarchical mode, the direct
+    submodules of the SoC (cpu, uart, timer0, the external_modules wrappers, DMA, ...) are kept
+    out of that: LiteXSoCGenerator defers their fragments (see defer()), and after finalization
+    split() converts each of them into a Verilog module of its own. The top level only keeps
+    what is left (bus interconnect, CRG, ...) and an instance of every split module. The split
+    modules are converted in parallel, by forked worker processes (hierarchy_jobs in the config,
+    default: one per CPU), since the conversion is pure Python and doesn't gain from threads.
+    Submodules that define clock domains (the CRG, stream ports with their own clock), contain
+    tristates, share memories with other modules or have no ports at all stay in the top level.
+
+    The ports of a split module are the signals it shares with the rest of the design: outputs
+    if the module drives them, inputs otherwise, plus clock/reset of each clock domain it uses.
+    If a signal is driven from both sides, the module is merged back into the top level as well.
+
+    Every module is written to <build_name>_<submodule>.v. Its hash (SHA-256 without LiteX's date
+    lines) is in <build_name>_hierarchy.json, and unchanged files aren't rewritten, so tools
+    working per file only have to redo the modules that changed.
+
+    With reuse_output (see generator_aux_reuse.py), the external_modules wrappers aren't even
+    converted again if their fingerprint (config entry + SoC options) is the one in the manifest
+    of the previous run: only the first half of the conversion runs (lowering and signal naming,
+    which is where the port names of the instance come from) and the previous file is reused.
+    If the ports don't come out the same, the wrapper is converted after all. The top level
+    (CSR bank, decoder, ...) and the other modules are always converted.
+"""
+
+#lines of LiteX's banner/footer with the generation date in them
+DATE_PREFIXES = ("// Date", "//  Auto-Generated by LiteX on")
+
+# Helpers -----------------------------------------------------------------------------------------
+
+def _signals(f):
+    return list_signals(f) | list_special_ios(f, True, True, True)
+
+def _driven(f):
+    return list_targets(f) | list_special_ios(f, False, True, True)
+
+def eligible(fragment):
+    return not fragment.clock_domains and not any(isinstance(s, Tristate) for s in fragment.specials)
+
+def _memories(fragment):
+    return {s for s in fragment.specials if isinstance(s, Memory)}
+
+def _memories_complete(fragment):
+    #a memory and all of its ports have to end up in the same Verilog module
+    ports = {s for s in fragment.specials if isinstance(s, _MemoryPort)}
+    return ports == {p for m in _memories(fragment) for p in m.ports}
+
+def _shared_memories(top, deferred):
+    #the CSR bank adds memories of other modules (e.g. the identifier) to its own specials,
+    #so both have to stay in the top level
+    owners = {}
+    for name, f in deferred:
+        for memory in _memories(f):
+            owners.setdefault(memory, []).append(name)
+    top_memories = _memories(top)
+    return {n for memory, names in owners.items() if len(names) > 1 or memory in top_memories for n in names}
+
+def content_hash(source):
+    #the generation date is no change of the module
+    lines = [l for l in source.splitlines(keepends=True) if not l.startswith(DATE_PREFIXES)]
+    return hashlib.sha256("".join(lines).encode()).hexdigest()
+
+def _port_signals(inputs, outputs, clocks):
+    signals = sorted(inputs | outputs, key=lambda s: s.duid)
+    for cd, _ in clocks:
+        signals += [cd.clk] if cd.rst is None else [cd.clk, cd.rst]
+    return signals
+
+def _ports(names, inputs, outputs, clocks):
+    #Instance items of a split module and the width of each port (kept in the manifest)
+    items = {}
+    widths = {}
+    for prefix, signals in [("i_", inputs), ("o_", outputs)]:
+        for s in signals:
+            items[prefix + names[s]] = s
+            widths[prefix + names[s]] = len(s)
+    for cd, d in clocks:
+        items["i_" + names[cd.clk]] = ClockSignal(d)
+        widths["i_" + names[cd.clk]] = 1
+        if cd.rst is not None:
+            items["i_" + names[cd.rst]] = ResetSignal(d)
+            widths["i_" + names[cd.rst]] = 1
+    return items, widths
+
+def _name_ios(ios):
+    #what convert() does with the ports first: name them after the variable they were created as
+    for io in sorted(ios, key=lambda x: x.duid):
+        if io.name_override is None and io.backtrace[-1][0]:
+            io.name_override = io.backtrace[-1][0]
+
+def port_namespace(f, ios, platform):
+    """First half of litex.gen.fhdl.verilog.convert(): lower f and name its signals, without
+    generating the Verilog. f is left as it was, so it can still be converted afterwards."""
+    #lowering works on a copy of the fragment, but shares its specials/clock domains and
+    #rewrites the expressions of the specials in place
+    saved = [(obj, attr, getattr(obj, attr)) for special in f.specials
+        for obj, attr, _ in special.iter_expressions()]
+    lowered = copy.copy(f)
+    lowered.specials = set(f.specials)
+    lowered.clock_domains = _ClockDomainList(f.clock_domains)
+    try:
+        lowered = lower_complex_slices(lowered)
+        insert_resets(lowered)
+        lowered = lower_basics(lowered)
+        for special in lowered.specials:
+            special.platform = platform
+        lowered, _ = lower_specials(dict(), lowered)
+        lowered = lower_basics(lowered)
+        _name_ios(ios)
+        ns = build_signal_namespace(
+            signals = list_signals(lowered) | list_special_ios(lowered, True, True, True) | ios,
+            reserved_keywords = verilog._ieee_1800_2017_verilog_reserved_keywords)
+        #names get their _<n> suffix in the order they are first asked for, the conversion asks
+        #for the ports first (module header, sorted(ios, key=ns.get_name))
+        for io in ios:
+            ns.get_name(io)
+        return ns
+    finally:
+        for obj, attr, value in saved:
+            setattr(obj, attr, value)
+
+def read_manifest(build_dir, build_name):
+    """Modules of the previous run in build_dir ({module name: manifest entry})."""
+    try:
+        with open(os.path.join(build_dir, f"{build_name}_hierarchy.json")) as f:
+            return json.load(f)["modules"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+def _reuse(f, ios, platform, build_dir, entry, fingerprint, inputs, outputs, clocks):
+    #the previous conversion of the module and its port names, if it has the same fingerprint and ports
+    if entry is None or entry.get("fingerprint") != fingerprint:
+        return None
+    try:
+        with open(os.path.join(build_dir, entry["file"])) as fd:
+            source = fd.read()
+        data_files = {}
+        for filename in entry.get("data_files", []):
+            with open(os.path.join(build_dir, filename)) as fd:
+                data_files[filename] = fd.read()
+    except OSError:
+        return None
+    if content_hash(source) != entry["sha256"]:
+        return None #edited since
+    ns = port_namespace(f, ios, platform)
+    names = {s: ns.get_name(s) for s in _port_signals(inputs, outputs, clocks)}
+    if _ports(names, inputs, outputs, clocks)[1] != entry.get("ports"):
+        return None
+    conv = ConvOutput()
+    conv.set_main_source(source)
+    conv.data_files = data_files
+    conv.reused = True
+    return conv, names
+
+# Conversion --------------------------------------------------------------------------------------
+
+#jobs of the worker processes, inherited with fork (so the fragments don't have to be pickled)
+_jobs = []
+
+def _convert(f, ios, module_name, platform, signals):
+    #the hierarchy comment would put the whole SoC into every file
+    saved_top, LiteXContext.top = LiteXContext.top, None
+    try:
+        conv = verilog.convert(f, ios=ios, name=module_name, platform=platform)
+    finally:
+        LiteXContext.top = saved_top
+    return conv.main_source, conv.data_files, [conv.ns.get_name(s) for s in signals]
+
+def _convert_job(i):
+    return _convert(*_jobs[i])
+
+def convert_all(jobs, workers=None):
+    """Convert [(fragment, ios, module name, platform, port signals)], in forked worker processes
+    if there are more than one job and worker. Returns [(ConvOutput, {port signal: name})]."""
+    global _jobs
+    workers = min((os.cpu_count() or 1) if workers is None else workers, len(jobs))
+    if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        _jobs = jobs
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                mp_context=multiprocessing.get_context("fork")) as pool:
+                results = list(pool.map(_convert_job, range(len(jobs))))
+        finally:
+            _jobs = []
+    else:
+        results = [_convert(*job) for job in jobs]
+    converted = []
+    for job, (source, data_files, names) in zip(jobs, results):
+        conv = ConvOutput()
+        conv.set_main_source(source)
+        conv.data_files = data_files
+        converted.append((conv, dict(zip(job[4], names))))
+    return converted
+
+# Split -------------------------------------------------------------------------------------------
+
+def defer(subfragments, deferred):
+    """Used by LiteXSoCGenerator._collect_submodules(): move eligible named fragments to deferred."""
+    keep = []
+    for name, f in subfragments:
+        if name is not None and eligible(f):
+            deferred.append((name, f))
+        else:
+            keep.append((name, f))
+    return keep
+
+def split(soc, build_name, deferred, platform, reuse=None, workers=None):
+    """Convert the deferred fragments and instantiate them in the finalized SoC. Returns
+    {module name: ConvOutput}. reuse: {"dir": build directory of the previous run,
+    "fingerprints": {submodule name: fingerprint}} of the modules that may be reused.
+    workers: processes for the conversion (see convert_all())."""
+    fingerprints = {} if reuse is None else reuse["fingerprints"]
+    previous = {} if reuse is None else read_manifest(reuse["dir"], build_name)
+    top = soc._fragment
+    outside_signals = _signals(top) | set(platform.constraint_manager.get_io_signals())
+    outside_driven = _driven(top)
+    per_module = {name: (_signals(f), _driven(f)) for name, f in deferred}
+    top_domains = {cd.name: cd for cd in top.clock_domains}
+    shared = _shared_memories(top, deferred)
+
+    split_off = []
+    for name, f in deferred:
+        signals, driven = per_module[name]
+        others = set(outside_signals)
+        others_driven = set(outside_driven)
+        for other, (other_signals, other_driven) in per_module.items():
+            if other != name:
+                others |= other_signals
+                others_driven |= other_driven
+        ports = signals & others
+        outputs = ports & driven
+        domains = [d for d in sorted(list_clock_domains(f)) if d in top_domains]
+        #without any ports, LiteX would make all pads of the platform ports of the module
+        if (outputs & others_driven) or len(domains) != len(list_clock_domains(f)) \
+            or name in shared or not _memories_complete(f) or not (ports or domains):
+            soc._fragment += f
+            top = soc._fragment
+            #still "outside" for the modules that follow
+            outside_signals |= signals
+            outside_driven |= driven
+            del per_module[name]
+            continue
+        inputs = ports - outputs
+
+        #clock/reset of the used domains become ports as well
+        clocks = []
+        for d in domains:
+            cd = ClockDomain(d, reset_less=top_domains[d].rst is None)
+            f.clock_domains.append(cd)
+            clocks.append((cd, d))
+        ios = set(ports)
+        for cd, _ in clocks:
+            ios |= {cd.clk} if cd.rst is None else {cd.clk, cd.rst}
+
+        split_off.append((name, f"{build_name}_{name}", f, ios, inputs, outputs, clocks))
+
+    #the worker processes don't give the port names back to the signals, name them here, as
+    #the conversion would (ports shared by several modules get the same name in each of them).
+    #before the reuse checks, so their namespaces are the ones of the conversion
+    for _, _, _, ios, *_ in split_off:
+        _name_ios(ios)
+    reused = {}
+    for name, module_name, f, ios, inputs, outputs, clocks in split_off:
+        if fingerprints.get(name) is not None:
+            reused[name] = _reuse(f, ios, platform, reuse["dir"], previous.get(module_name),
+                fingerprints[name], inputs, outputs, clocks)
+    jobs = [(f, ios, module_name, platform, _port_signals(inputs, outputs, clocks))
+        for name, module_name, f, ios, inputs, outputs, clocks in split_off if reused.get(name) is None]
+    converted = iter(convert_all(jobs, workers))
+
+    modules = {}
+    for name, module_name, f, ios, inputs, outputs, clocks in split_off:
+        conv, names = next(converted) if reused.get(name) is None else reused[name]
+        items, conv.ports = _ports(names, inputs, outputs, clocks)
+        conv.fingerprint = fingerprints.get(name)
+        top.specials.add(Instance(module_name, name=name, **items))
+        modules[module_name] = conv
+    return modules
+
+# Output ------------------------------------------------------------------------------------------
+
+def write_modules(modules, build_dir, build_name):
+    """Write the split modules and the hash manifest, returns the written file names."""
+    manifest = {"top": f"{build_name}.v", "modules": {}}
+    files = []
+    for module_name, conv in sorted(modules.items()):
+        filename = f"{module_name}.v"
+        path = os.path.join(build_dir, filename)
+        digest = content_hash(conv.main_source)
+        try:
+            with open(path) as f:
+                unchanged = content_hash(f.read()) == digest
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            with open(path, "w") as f:
+                f.write(conv.main_source)
+        for data_filename, content in conv.data_files.items():
+            with open(os.path.join(build_dir, data_filename), "w") as f:
+                f.write(content)
+            files.append(data_filename)
+        manifest["modules"][module_name] = {"file": filename, "sha256": digest, "changed": not unchanged,
+            "reused": getattr(conv, "reused", False), "fingerprint": getattr(conv, "fingerprint", None),
+            "ports": getattr(conv, "ports", {}), "data_files": sorted(conv.data_files)}
+        files.append(filename)
+    manifest_name = f"{build_name}_hierarchy.json"
+    with open(os.path.join(build_dir, manifest_name), "w") as f:
+        json.dump(manifest, f, indent=1)
+    files.append(manifest_name)
+    return files
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import contextlib
+import argparse
+import json
+import time
+import sys
+
+from migen.fhdl.specials import Memory
+from litex.soc.interconnect.csr import CSRStorage, CSRStatus
+
+import litex_generator
+from generator_aux_bus import converter_report
+from generator_aux_resources import _fifos
+
+""" Dry-run "plan" mode for litex_generator.py
+
+    The GUI needs the memory map, the CSR map and a rough size estimate while the user is
+    still editing, long before anything is generated. plan() elaborates the SoC and runs
+    SoC.finalize(), which is where LiteX allocates bus regions, CSR banks and IRQs, but
+    stops there: no Verilog conversion, no Builder (software headers, csr.json, copying).
+    That is the bulk of the generation time.
+
+    The result is a JSON-serializable dict:
+        -bus            standard, data and address width, interconnect
+        -regions        bus regions (rom, sram, csr, mmap_bus_m, ...) with origin and size
+        -csr_bases      base address of every CSR bank
+        -csr_registers  every CSR register (same layout as csr.json)
+        -irqs           interrupt numbers
+        -external_modules  per external_modules instance: wrapper type, CSR base and the
+                           address, size and width of each register
+        -converters     bus adapters and other width converters (generator_aux_bus.converter_report)
+        -estimate       flip-flops in CSR registers, FIFO count/depth/bits and memory bits
+                        (FIFO storage included); counts of what was elaborated, not a
+                        synthesis result
+        -resources      flip-flops, memory/FIFO/CSR bits, multiplexers and combinational depth
+                        per submodule (generator_aux_resources.analyze)
+
+    Usage:
+        $ python3 generator_aux_plan.py configFile_demo_soc.yaml [-o plan.json]
+    The plan is also available from generator_server.py (method "plan").
+"""
+
+# Helpers -----------------------------------------------------------------------------------------
+
+def _csr_registers(region, alignment):
+    #same address calculation as litex.soc.integration.export.get_csr_json()
+    registers = {}
+    origin = region.origin
+    for csr in region.obj:
+        size = (csr.size + region.busword - 1)//region.busword
+        registers[csr.name] = {
+            "addr"  : origin,
+            "size"  : size,
+            "width" : csr.size,
+            "type"  : "ro" if isinstance(csr, CSRStatus) and not hasattr(csr, "r") else "rw",
+        }
+        if hasattr(csr, "fields"): #packed CSRs, same as generator_aux_CSR.add_csr_fields()
+            registers[csr.name]["fields"] = {f.name: {"offset": f.offset, "size": f.size} for f in csr.fields.fields}
+        origin += alignment//8*size
+    return registers
+
+def _region(region):
+    return {
+        "origin" : region.origin,
+        "size"   : region.size,
+        "mode"   : region.mode,
+        "cached" : region.cached,
+    }
+
+def estimate(soc):
+    """Count storage elements of the finalized SoC."""
+    register_bits = 0
+    registers = 0
+    for region in soc.csr.regions.values():
+        if isinstance(region.obj, Memory):
+            continue
+        for csr in region.obj:
+            registers += 1
+            if isinstance(csr, (CSRStorage, CSRStatus)): #plain CSRs have no storage of their own
+                register_bits += csr.size
+    #SyncFIFOBuffered is built around a SyncFIFO, count it once
+    fifos = list(_fifos(soc))
+    memories = [s for s in soc.get_fragment().specials if isinstance(s, Memory)]
+    return {
+        "csr_registers"     : registers,
+        "csr_register_bits" : register_bits,
+        "fifos"             : len(fifos),
+        "fifo_depth"        : sum(f.depth for f in fifos),
+        "fifo_bits"         : sum(f.depth*f.width for f in fifos),
+        "memories"          : len(memories),
+        "memory_bits"       : sum(m.depth*m.width for m in memories),
+    }
+
+# Plan --------------------------------------------------------------------------------------------
+
+def plan(args, profiler=None):
+    """Elaborate and finalize the SoC described by an already loaded config (see
+    litex_generator.read_config_file) and return its plan. Nothing is written to disk."""
+    profiler = litex_generator.NullProfiler() if profiler is None else profiler
+    start = time.perf_counter()
+    #the resource estimate is part of every plan; hierarchical mode would convert the split
+    #off modules to Verilog in finalize() (the maps don't depend on it)
+    args = dict(args, resource_report=True, hierarchical=False)
+    with profiler.stage("elaborate"):
+        soc = litex_generator.LiteXSoCGenerator(profiler=profiler, **args)
+    soc.finalize()
+
+    alignment = soc.csr.alignment
+    result = {
+        "name" : args["name"],
+        "bus"  : {
+            "standard"      : soc.bus.standard,
+            "data_width"    : soc.bus.data_width,
+            "address_width" : soc.bus.address_width,
+            "interconnect"  : soc.bus.interconnect,
+        },
+        "regions"       : {name: _region(r) for name, r in soc.bus.regions.items()},
+        "io_regions"    : {name: _region(r) for name, r in soc.bus.io_regions.items()},
+        "csr_bases"     : {name: r.origin for name, r in soc.csr.regions.items()},
+        "csr_registers" : {},
+        "irqs"          : dict(soc.irq.locs) if soc.irq.enabled else {},
+        "external_modules" : {},
+    }
+    for name, region in soc.csr.regions.items():
+        if isinstance(region.obj, Memory):
+            continue
+        for reg_name, reg in _csr_registers(region, alignment).items():
+            result["csr_registers"][name + "_" + reg_name] = reg
+
+    for entry in (args.get("external_modules") or {}).values():
+        inst_name = entry["instance_name"]
+        module = getattr(soc, inst_name)
+        region = soc.csr.regions.get(inst_name)
+        result["external_modules"][inst_name] = {
+            "type"      : type(module).__name__,
+            "csr_base"  : None if region is None else region.origin,
+            "registers" : {} if region is None else _csr_registers(region, alignment),
+        }
+
+    result["converters"] = converter_report(soc)
+    result["estimate"] = estimate(soc)
+    result["resources"] = soc.resources
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Print the address/CSR map of a SoC config without generating it.")
+    parser.add_argument("config", help="Config file.")
+    parser.add_argument("-o", "--output", default=None, help="Write the plan to this file instead of stdout.")
+    args = parser.parse_args()
+
+    try:
+        config = litex_generator.read_config_file(args.config)
+    except litex_generator.ConfigError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    #LiteX logs the finalized SoC, keep stdout for the plan itself
+    with contextlib.redirect_stdout(sys.stderr):
+        result = plan(config)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=1)
+    else:
+        print(json.dumps(result, indent=1))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import hashlib
+import json
+import os
+
+from migen import Signal
+
+from generator_aux_cache import get_toolchain_versions
+
+""" Cached PLL configurations for the auto-PLL CRGs (generator_aux_CRG.py)
+
+    LiteX's PLL classes search their divider space in compute_config() when the SoC is
+    finalized, on every generation. The result only depends on the PLL class (device family),
+    its speedgrade, the input frequency and the requested outputs (frequency, phase, margin),
+    so it is kept in a JSON file (PLLCache) and looked up before searching again:
+        cache = PLLCache(path)
+        cache.attach(soc.crg.pll)      #before the SoC is finalized
+        ...build...
+        cache.save()
+    The LiteX version is part of the key, a newer LiteX may search differently.
+    PLLs without compute_config() (GateMate, its PLL is configured by the toolchain) are
+    only reported.
+
+    report() lists the dividers of every attached PLL and the achieved output frequencies
+    with their error against the requested ones.
+"""
+
+DEFAULT_PATH = os.path.join("~", ".cache", "systembuilder", "pll_cache.json")
+
+# Helpers -----------------------------------------------------------------------------------------
+
+def _outputs(pll):
+    #(frequency, phase, margin, ...) of every requested output, without the clock signals
+    clkouts = getattr(pll, "clkouts", None)
+    if clkouts is None:
+        clkouts = getattr(pll, "_clkouts", {}) #GateMatePLL: {phase: (clk, freq)}
+        return [[p, f] for p, (_, f) in sorted(clkouts.items())]
+    return [list(v[1:]) for _, v in sorted(clkouts.items())]
+
+def _output_freq(config, n):
+    for key in [f"clkout{n}_freq", f"clko{n}_freq", "clkout_freq"]:
+        if key in config:
+            return config[key]
+    return None
+
+def pll_key(pll):
+    """Everything compute_config() depends on."""
+    key = {
+        "family"     : type(pll).__name__,
+        "speedgrade" : getattr(pll, "speedgrade", None),
+        "clkin_freq" : getattr(pll, "clkin_freq", getattr(pll, "_clkin_freq", None)),
+        "vco_margin" : getattr(pll, "vco_margin", None), #S7PLL/USMMCM/... keep the VCO away from its limits
+        "outputs"    : _outputs(pll),
+        "litex"      : get_toolchain_versions().get("litex"),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+# Cache -------------------------------------------------------------------------------------------
+
+class PLLCache:
+    def __init__(self, path=None):
+        self.path = os.path.abspath(os.path.expanduser(path or DEFAULT_PATH))
+        self.hits = 0
+        self.misses = 0
+        self.plls = [] #(name, pll, entry) of the attached PLLs, see report()
+        self.dirty = False
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            #a broken cache file is no reason to fail the generation
+            self.entries = {}
+
+    def attach(self, pll, name="pll"):
+        """Make pll look up its configuration here before searching for one."""
+        entry = {"name": name, "cached": None, "config": None}
+        self.plls.append((name, pll, entry))
+        search = getattr(pll, "compute_config", None)
+        if search is None:
+            return
+
+        def compute_config():
+            key = pll_key(pll)
+            config = self.entries.get(key)
+            if config is None:
+                self.misses += 1
+                config = search()
+                self.entries[key] = config
+                self.dirty = True
+                entry["cached"] = False
+            else:
+                self.hits += 1
+                entry["cached"] = True
+                #ECP5PLL adds a spare output for the feedback path while searching
+                if "clkfb" in config and config["clkfb"] not in pll.clkouts:
+                    pll.clkouts[pll.nclkouts] = (Signal(name="ecp5pll"), 0, 0, 0, 0)
+            entry["config"] = config
+            return dict(config)
+        pll.compute_config = compute_config
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    # Report ---------------------------------------------------------------------------------------
+
+    def report(self):
+        """Per PLL: the dividers and, per output, requested/achieved frequency and error."""
+        result = []
+        for name, pll, entry in self.plls:
+            config = entry["config"] or {}
+            outputs = []
+            if hasattr(pll, "clkouts"):
+                for n, (freq, *_) in enumerate(_outputs(pll)):
+                    if not freq:
+                        continue #feedback output of the ECP5
+                    achieved = _output_freq(config, n)
+                    outputs.append({
+                        "output"    : n,
+                        "requested" : freq,
+                        "achieved"  : achieved,
+                        "error_ppm" : None if achieved is None else (achieved - freq)/freq*1e6,
+                    })
+            else:
+                #GateMate: the toolchain picks the dividers for the requested frequency
+                outputs = [{"output": p, "requested": f, "achieved": None, "error_ppm": None}
+                    for p, f in _outputs(pll) if f]
+            result.append({
+                "name"     : name,
+                "family"   : type(pll).__name__,
+                "cached"   : entry["cached"],
+                "vco"      : config.get("vco"),
+                "dividers" : {k: v for k, v in config.items() if not any(s in k for s in ["freq", "phase", "vco"])},
+                "outputs"  : outputs,
+            })
+        return result
+
+def format_report(report):
+    lines = []
+    for pll in report:
+        source = {True: "cached", False: "searched", None: "not cached"}[pll["cached"]]
+        dividers = ", ".join(f"{k}={v}" for k, v in pll["dividers"].items())
+        lines.append(f"PLL {pll['name']} ({pll['family']}, {source}): {dividers or 'chosen by the toolchain'}")
+        for o in pll["outputs"]:
+            if o["achieved"] is None:
+                lines.append(f"    clkout{o['output']}: {o['requested']/1e6:.3f} MHz requested")
+            else:
+                lines.append(f"    clkout{o['output']}: {o['requested']/1e6:.3f} MHz requested, "
+                    f"{o['achieved']/1e6:.3f} MHz achieved ({o['error_ppm']:+.0f} ppm)")
+    return "\n".join(lines)
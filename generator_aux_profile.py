@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import contextlib
+import resource
+import cProfile
+import time
+import json
+import os
+
+from generator_aux_cache import get_toolchain_versions
+
+""" Stage-level profiling for litex_generator.generate()
+
+    Stages are opened with "with profiler.stage(name):" and may be nested; nested stages
+    are reported with their full path, e.g. "elaborate/external_modules/acc0".
+    For every stage the report holds:
+        -wall_s         wall-clock time
+        -cpu_s          CPU time of the process
+        -peak_rss_kb    peak resident set size of the process at the end of the stage
+        -rss_delta_kb   change of the current resident set size during the stage
+    Peak RSS can only grow, so the first stage where it jumps is the one to look at.
+
+    The report is written as generation_profile.json into the output directory (config
+    option "profile", on by default). With "profile_cprofile" the whole generation also
+    runs under cProfile and the stats are dumped to generation_profile.pstats, which can
+    be read with pstats or snakeviz.
+"""
+
+PROFILE_NAME  = "generation_profile.json"
+PSTATS_NAME   = "generation_profile.pstats"
+
+def _peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss #KiB on Linux
+
+def _current_rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return None
+
+class GenerationProfiler:
+    def __init__(self):
+        self.stages = []
+        self.path = []
+        self.cprofile = None
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        self.path.append(str(name))
+        entry = {"name": "/".join(self.path), "depth": len(self.path) - 1}
+        self.stages.append(entry) #append first so stages are listed in the order they started
+        rss = _current_rss_kb()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield entry
+        finally:
+            entry["wall_s"] = time.perf_counter() - wall
+            entry["cpu_s"] = time.process_time() - cpu
+            entry["peak_rss_kb"] = _peak_rss_kb()
+            current = _current_rss_kb()
+            entry["rss_delta_kb"] = None if rss is None or current is None else current - rss
+            self.path.pop()
+
+    # cProfile -------------------------------------------------------------------------------------
+
+    def enable_cprofile(self):
+        self.cprofile = cProfile.Profile()
+        self.cprofile.enable()
+
+    def disable_cprofile(self):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+
+    # Report ---------------------------------------------------------------------------------------
+
+    def report(self, **info):
+        #totals first, the toolchain lookup below isn't part of the generation
+        total = {
+            "wall_s"      : time.perf_counter() - self.start_wall,
+            "cpu_s"       : time.process_time() - self.start_cpu,
+            "peak_rss_kb" : _peak_rss_kb(),
+        }
+        report = dict(info)
+        report["toolchain"] = get_toolchain_versions()
+        report["total"] = total
+        report["stages"] = self.stages
+        return report
+
+    def write(self, output_dir, **info):
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, PROFILE_NAME), "w") as f:
+            json.dump(self.report(**info), f, indent=1)
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(os.path.join(output_dir, PSTATS_NAME))
+
+class NullProfiler:
+    #used when LiteXSoCGenerator is instantiated without a profiler
+    @contextlib.contextmanager
+    def stage(self, name):
+        yield None
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import contextlib
+import sys
+
+from migen import *
+from migen.fhdl.structure import _Assign, _Operator, _Slice, _Part, _ArrayProxy
+from migen.fhdl.specials import Memory, _MemoryPort, Instance
+from migen.fhdl.tools import list_targets
+from migen.genlib.cdc import MultiReg
+from migen.genlib.fifo import _FIFOInterface
+from migen.genlib.resetsync import AsyncResetSynchronizer
+
+from litex.soc.interconnect.csr import CSRStorage, CSRStatus
+
+""" Static resource and logic depth estimate for litex_generator.py
+
+    Whether a SoC is too big or too slow used to show up only in the vendor synthesis. analyze()
+    looks at the finalized Migen fragments instead, the same statements get_verilog() converts.
+    LiteXSoCGenerator.finalize() runs it (soc.resources), it takes a few 10 ms. Per direct
+    submodule of the SoC (cpu, uart, the external_modules wrappers, DMA, csr_bankarray, ...;
+    "top" is everything the SoC adds itself):
+        -ffs          flip-flops per clock domain: width of every signal assigned in a sync
+                      block, plus the MultiReg/AsyncResetSynchronizer stages
+        -memory_bits  width*depth of the memories (FIFO storage, CPU register files, ...)
+        -fifos        count and width*depth of the FIFOs (stream.SyncFIFO/AsyncFIFO,
+                      DMATestCore.fifo, ...), their storage is in memory_bits already
+        -csr_bits     bits in the CSRStorage/CSRStatus registers of the module; the registers
+                      themselves are in the ffs of csr_bankarray, where LiteX puts them
+        -mux_bits     a signal assigned in n places (If/Case branches, default values) needs
+                      an n:1 multiplexer, sync signals with conditions an extra input for
+                      keeping their value; (inputs - 1)*width summed up, Array indexing
+                      included. widest_mux is the one with the most inputs.
+        -depth        worst combinational depth per clock domain in levels (every operator,
+                      every If/Case nesting and every Array index is a level; slices and
+                      concatenations are wires), with the register it ends in. Paths are
+                      followed through the comb logic of all modules, so the depth of a
+                      module includes the logic in front of it.
+        -instances    black boxes (CPU cores, vendor primitives), counted by module name
+    These are counts of what was elaborated, not a synthesis result: constants aren't folded,
+    nothing is shared or optimized away and a level isn't a LUT. They are meant to compare
+    configurations and to find the module that grew or got slow.
+"""
+
+# Helpers -----------------------------------------------------------------------------------------
+
+def _flatten(statements):
+    if isinstance(statements, (list, tuple)):
+        for s in statements:
+            yield from _flatten(s)
+    elif statements is not None:
+        yield statements
+
+def _sites(statements, conds, sites):
+    #every assignment with the If/Case conditions it is nested in: (target, rhs, conds)
+    for s in _flatten(statements):
+        if isinstance(s, _Assign):
+            for target in list_targets(s):
+                sites.append((target, s.r, conds))
+        elif isinstance(s, If):
+            inner = conds + (s.cond,)
+            _sites(s.t, inner, sites)
+            _sites(s.f, inner, sites)
+        elif isinstance(s, Case):
+            inner = conds + (s.test,)
+            for body in s.cases.values():
+                _sites(body, inner, sites)
+
+def _array_proxies(node, found):
+    if isinstance(node, _ArrayProxy):
+        found.append(node)
+        for choice in node.choices:
+            _array_proxies(choice, found)
+        _array_proxies(node.key, found)
+    elif isinstance(node, _Operator):
+        for operand in node.operands:
+            _array_proxies(operand, found)
+    elif isinstance(node, (_Slice, _Part)):
+        _array_proxies(node.value, found)
+    elif isinstance(node, Cat):
+        for v in node.l:
+            _array_proxies(v, found)
+    elif isinstance(node, Replicate):
+        _array_proxies(node.v, found)
+
+def _name(signal):
+    #the name Migen starts from (signals and memories), without the prefixes of the enclosing modules
+    backtrace = getattr(signal, "backtrace", None)
+    return signal.name_override or (backtrace[-1][0] if backtrace else "sig")
+
+@contextlib.contextmanager
+def _recursion_limit(limit):
+    #long comb chains (priority encoders, wide Cats) are deeper than Python's default limit
+    saved = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(saved, limit))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(saved)
+
+# Parts -------------------------------------------------------------------------------------------
+
+class _ModulePart:
+    def __init__(self, name, module, comb, sync, specials):
+        self.name = name
+        self.module = module #None for "top"
+        self.comb = comb     #[(target, rhs, conds)]
+        self.sync = sync     #{domain: [(target, rhs, conds)]}
+        self.specials = specials
+
+def _parts(soc):
+    #the direct submodules keep their finalized fragment (_fragment) after the SoC merged it,
+    #in hierarchical mode as well (before split(), which lowers them for the conversion);
+    #"top" is what is left of the SoC's own fragment
+    parts = []
+    seen = set()
+    for name, module in soc._submodules:
+        if name is None:
+            continue #merged into the SoC's fragment, part of "top"
+        f = module._fragment
+        statements = list(_flatten(f.comb)) + [s for d in f.sync.values() for s in _flatten(d)]
+        seen |= {id(s) for s in statements}
+        parts.append((name, module, f.comb, f.sync, f.specials))
+    top = soc._fragment
+    parts.insert(0, ("top", None,
+        [s for s in _flatten(top.comb) if id(s) not in seen],
+        {d: [s for s in _flatten(l) if id(s) not in seen] for d, l in top.sync.items()},
+        top.specials - {s for _, _, _, _, specials in parts for s in specials}))
+
+    result = []
+    for name, module, comb, sync, specials in parts:
+        comb_sites = []
+        _sites(comb, (), comb_sites)
+        sync_sites = {}
+        for domain, statements in sync.items():
+            _sites(statements, (), sync_sites.setdefault(domain, []))
+        result.append(_ModulePart(name, module, comb_sites, sync_sites, specials))
+    return result
+
+# Depth -------------------------------------------------------------------------------------------
+
+class _Depth:
+    """Combinational depth of expressions/signals over the comb assignments of all parts."""
+    def __init__(self, parts):
+        self.drivers = {}      #signal: [(rhs, conds)] of the comb assignments
+        self.async_reads = {}  #dat_r of asynchronous memory ports: [adr]
+        self.memories = {}     #port: memory
+        for part in parts:
+            for target, rhs, conds in part.comb:
+                self.drivers.setdefault(target, []).append((rhs, conds))
+            for s in part.specials:
+                if isinstance(s, _MemoryPort) and s.async_read:
+                    self.async_reads.setdefault(s.dat_r, []).append(s.adr)
+                if isinstance(s, Memory):
+                    self.memories.update((p, s) for p in s.ports)
+        self.signals = {}
+        self.conds = {}
+
+    def signal(self, signal):
+        depth = self.signals.get(signal)
+        if depth is not None:
+            return depth
+        #registers, inputs and outputs of instances start a path; 0 also breaks comb loops
+        self.signals[signal] = 0
+        depth = 0
+        for rhs, conds in self.drivers.get(signal, ()):
+            depth = max(depth, self.site(rhs, conds))
+        for adr in self.async_reads.get(signal, ()):
+            depth = max(depth, self.expr(adr) + 1)
+        self.signals[signal] = depth
+        return depth
+
+    def cond(self, cond):
+        depth = self.conds.get(id(cond))
+        if depth is None:
+            depth = self.conds[id(cond)] = self.expr(cond)
+        return depth
+
+    def site(self, rhs, conds):
+        #every If/Case the assignment is nested in is a multiplexer level on the way
+        return max([self.expr(rhs)] + [self.cond(c) for c in conds]) + len(conds)
+
+    def expr(self, node):
+        if isinstance(node, Signal):
+            return self.signal(node)
+        if isinstance(node, _Operator):
+            return 1 + max(self.expr(o) for o in node.operands)
+        if isinstance(node, _Slice):
+            return self.expr(node.value)
+        if isinstance(node, _Part):
+            return 1 + max(self.expr(node.value), self.expr(node.offset))
+        if isinstance(node, Cat):
+            return max((self.expr(v) for v in node.l), default=0)
+        if isinstance(node, Replicate):
+            return self.expr(node.v)
+        if isinstance(node, _ArrayProxy):
+            return 1 + max([self.expr(node.key)] + [self.expr(c) for c in node.choices])
+        return 0 #constants, ClockSignal/ResetSignal
+
+# Analysis ----------------------------------------------------------------------------------------
+
+def _fifos(module):
+    if isinstance(module, _FIFOInterface):
+        yield module
+        return #the buffered FIFOs are built around another one
+    for _, submodule in module._submodules:
+        yield from _fifos(submodule)
+
+def _csr_bits(soc, name):
+    region = soc.csr.regions.get(name)
+    if region is None or isinstance(region.obj, Memory):
+        return 0, 0
+    csrs = list(region.obj)
+    return len(csrs), sum(c.size for c in csrs if isinstance(c, (CSRStorage, CSRStatus)))
+
+def _analyze_part(soc, part, depth, memories_seen):
+    ffs = {}
+    for domain, sites in part.sync.items():
+        targets = {target for target, _, _ in sites}
+        if targets:
+            ffs[domain] = ffs.get(domain, 0) + sum(len(t) for t in targets)
+    memories = []
+    instances = {}
+    for s in part.specials:
+        if isinstance(s, MultiReg):
+            ffs[s.odomain] = ffs.get(s.odomain, 0) + s.n*len(s.o)
+        elif isinstance(s, AsyncResetSynchronizer):
+            ffs[s.cd.name] = ffs.get(s.cd.name, 0) + 2
+        elif isinstance(s, Memory) and s not in memories_seen:
+            #the CSR bank lists memories of other modules as well, count them once
+            memories_seen.add(s)
+            memories.append(s)
+        elif isinstance(s, Instance):
+            instances[s.of] = instances.get(s.of, 0) + 1
+
+    #multiplexers: assignment sites per target (and domain), Array indexing
+    mux_bits = 0
+    widest = None
+    groups = [part.comb] + list(part.sync.values())
+    for n, sites in enumerate(groups):
+        inputs = {}
+        conditional = {}
+        proxies = []
+        for target, rhs, conds in sites:
+            inputs[target] = inputs.get(target, 0) + 1
+            conditional[target] = conditional.get(target, True) and bool(conds)
+            _array_proxies(rhs, proxies)
+        for target, count in inputs.items():
+            if n > 0 and conditional[target]:
+                count += 1 #register keeps its value
+            mux_bits += (count - 1)*len(target)
+            if count > 1 and (widest is None or count > widest["inputs"]):
+                widest = {"signal": _name(target), "inputs": count, "width": len(target)}
+        for proxy in proxies:
+            width = max((len(c) for c in proxy.choices), default=0)
+            mux_bits += (len(proxy.choices) - 1)*width
+            if widest is None or len(proxy.choices) > widest["inputs"]:
+                widest = {"signal": "Array", "inputs": len(proxy.choices), "width": width}
+
+    #depth: worst path into a register (sync assignments, synchronous memory ports)
+    worst = {}
+    def endpoint(domain, levels, signal):
+        if domain not in worst or levels > worst[domain]["levels"]:
+            worst[domain] = {"levels": levels, "endpoint": _name(signal)}
+    for domain, sites in part.sync.items():
+        for target, rhs, conds in sites:
+            endpoint(domain, depth.site(rhs, conds), target)
+    for s in part.specials:
+        if isinstance(s, _MemoryPort):
+            inputs = [s.adr] + [v for v in [s.we, s.dat_w, s.re] if v is not None]
+            if s.async_read:
+                inputs = inputs[1:] #the address goes to dat_r, not into a register
+            for v in inputs:
+                endpoint(s.clock.cd, depth.expr(v), depth.memories.get(s, s.adr))
+
+    csr_registers, csr_bits = _csr_bits(soc, part.name)
+    fifos = list(_fifos(part.module)) if part.module is not None else []
+    return {
+        "ffs"           : ffs,
+        "memories"      : len(memories),
+        "memory_bits"   : sum(m.width*m.depth for m in memories),
+        "fifos"         : len(fifos),
+        "fifo_bits"     : sum(f.width*f.depth for f in fifos),
+        "csr_registers" : csr_registers,
+        "csr_bits"      : csr_bits,
+        "mux_bits"      : mux_bits,
+        "widest_mux"    : widest,
+        "depth"         : worst,
+        "instances"     : instances,
+    }
+
+def analyze(soc):
+    """Resource/depth estimate of the finalized SoC, see above. JSON-serializable."""
+    with _recursion_limit(20000):
+        parts = _parts(soc)
+        depth = _Depth(parts)
+        memories_seen = set()
+        modules = {part.name: _analyze_part(soc, part, depth, memories_seen) for part in parts}
+
+    total = {"ffs": {}, "memory_bits": 0, "fifo_bits": 0, "csr_bits": 0, "mux_bits": 0, "depth": {}, "instances": {}}
+    for name, m in modules.items():
+        for domain, n in m["ffs"].items():
+            total["ffs"][domain] = total["ffs"].get(domain, 0) + n
+        for key in ["memory_bits", "fifo_bits", "csr_bits", "mux_bits"]:
+            total[key] += m[key]
+        for domain, d in m["depth"].items():
+            if domain not in total["depth"] or d["levels"] > total["depth"][domain]["levels"]:
+                total["depth"][domain] = dict(d, module=name)
+        for of, n in m["instances"].items():
+            total["instances"][of] = total["instances"].get(of, 0) + n
+    return {"total": total, "modules": modules}
+
+def format_report(report):
+    total = report["total"]
+    ffs = ", ".join(f"{d} {n}" for d, n in sorted(total["ffs"].items()))
+    lines = [f"Resource estimate: {sum(total['ffs'].values())} FFs ({ffs}), "
+        f"{total['memory_bits']} memory bits, {total['mux_bits']} mux bits"]
+    for domain, d in sorted(total["depth"].items()):
+        lines.append(f"    worst depth {domain}: {d['levels']} levels into {d['module']}.{d['endpoint']}")
+    if total["instances"]:
+        lines.append("    instances: " + ", ".join(f"{of} x{n}" for of, n in sorted(total["instances"].items())))
+    lines.append(f"    {'module':<24}{'FFs':>8}{'mem bits':>10}{'FIFO bits':>11}{'CSR bits':>10}"
+        f"{'mux bits':>10}{'depth':>7}")
+    for name, m in report["modules"].items():
+        levels = max((d["levels"] for d in m["depth"].values()), default=0)
+        lines.append(f"    {name:<24}{sum(m['ffs'].values()):>8}{m['memory_bits']:>10}{m['fifo_bits']:>11}"
+            f"{m['csr_bits']:>10}{m['mux_bits']:>10}{levels:>7}")
+    return "\n".join(lines)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import hashlib
+import json
+import os
+
+from generator_aux_cache import CACHE_CONFIG_KEYS, get_toolchain_versions, get_generator_digest
+from generator_aux_config import canonical_json
+
+""" Output reuse for litex_generator.generate() (config option "reuse_output")
+
+    Reuses what is still valid of the previous output in the same output directory:
+        -if nothing but the Verilog sources of external modules changed, the whole previous
+         output (GenericVlogModuleCSR only references the module by name, so its source
+         doesn't touch the SoC at all); generation is skipped entirely
+        -otherwise, in hierarchical mode (see generator_aux_hierarchy.py), the converted
+         wrapper of every external module whose entry didn't change: the SoC is elaborated
+         again, but only the changed wrappers, the top level (CSR bank, decoder, ...) and the
+         other split modules are converted to Verilog
+    Without hierarchical mode, Migen flattens the whole SoC into one netlist with one namespace,
+    so any other change regenerates everything.
+
+    Every generation leaves a fingerprint manifest (fingerprints.json) in the output directory:
+        -one hash for everything that isn't an external module (SoC options, toolchain, generator)
+        -per external_modules entry (keyed by instance name) a hash of the entry itself,
+         i.e. ports, parameters, module name and source path ("structure"), and a hash of
+         the Verilog source contents ("source")
+    The next generation into the same output directory compares against it. The fingerprint of
+    a wrapper (wrapper_fingerprints()) covers the "soc" hash as well, since the wrappers depend
+    on the SoC options (bus width, DMA settings, ...).
+"""
+
+MANIFEST_NAME = "fingerprints.json"
+REUSE_CONFIG_KEYS = ["reuse_output"]
+
+def _digest(obj):
+    return hashlib.sha256(canonical_json(obj).encode()).hexdigest()
+
+def _file_digest(path):
+    if path in [None, "None"] or not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def fingerprint_config(args):
+    modules = args.get("external_modules") or {}
+    soc_config = {
+        k: v for k, v in args.items()
+        if k not in ["external_modules"] + CACHE_CONFIG_KEYS + REUSE_CONFIG_KEYS
+    }
+    fingerprint = {
+        "soc" : _digest([soc_config, os.getcwd(), get_toolchain_versions(), get_generator_digest()]),
+        "modules" : {},
+    }
+    for i in modules:
+        entry = modules[i]
+        fingerprint["modules"][str(entry["instance_name"])] = {
+            "structure" : _digest(entry),
+            "source"    : _file_digest(entry.get("source")),
+        }
+    return fingerprint
+
+def wrapper_fingerprints(fingerprint):
+    """{instance name: fingerprint} of the external module wrappers, see generator_aux_hierarchy.split()."""
+    return {name: _digest([fingerprint["soc"], module["structure"]])
+        for name, module in fingerprint["modules"].items()}
+
+def get_output_dir(args):
+    #same default as litex.soc.integration.builder.Builder
+    name = "litex_soc" if args.get("name") is None else args["name"]
+    return os.path.abspath(args.get("output_dir") or os.path.join("build", name))
+
+def read_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_manifest(output_dir, fingerprint, dirs):
+    manifest = dict(fingerprint)
+    manifest["dirs"] = dirs
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=1)
+
+def compare(previous, current):
+    """Classify every external module as unchanged, source-only changed or structurally
+    changed (including added/removed ones). Returns a dict of lists of instance names."""
+    report = {"unchanged": [], "source": [], "structure": [], "soc": False, "first": previous is None}
+    if previous is None:
+        report["soc"] = True
+        return report
+    report["soc"] = previous.get("soc") != current["soc"]
+    old = previous.get("modules", {})
+    for name in sorted(set(old) | set(current["modules"])):
+        if name not in old or name not in current["modules"]:
+            report["structure"].append(name)
+        elif old[name]["structure"] != current["modules"][name]["structure"]:
+            report["structure"].append(name)
+        elif old[name]["source"] != current["modules"][name]["source"]:
+            report["source"].append(name)
+        else:
+            report["unchanged"].append(name)
+    return report
+
+def can_reuse(previous, report):
+    """True if the previous output is still valid for the current config."""
+    if previous is None or report["soc"] or report["structure"]:
+        return False
+    #make sure the previous output is actually still there
+    gateware_dir = previous.get("dirs", {}).get("gateware_dir")
+    if gateware_dir is None or not os.path.isdir(gateware_dir):
+        return False
+    return any(f.endswith(".v") for f in os.listdir(gateware_dir))
+
+def print_report(report, hierarchical=False):
+    if report["first"]:
+        print("Output reuse: no previous generation in this output directory, generating")
+        return
+    print(f"Output reuse: {len(report['unchanged'])} unchanged, {len(report['source'])} source-only changed, "
+          f"{len(report['structure'])} structurally changed external modules"
+          + (", SoC options changed" if report["soc"] else ""))
+    for name in report["structure"]:
+        print(f"    {name}: ports/parameters changed, " +
+              ("converting its wrapper again" if hierarchical else "regenerating the SoC"))
+    for name in report["source"]:
+        print(f"    {name}: Verilog source changed, SoC netlist unaffected")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import concurrent.futures
+import hashlib
+import shutil
+import fcntl
+import time
+import os
+
+""" Post-build staging for litex_generator.py
+
+    After Platform.build(), the sources of the SoC (CPU cores, IP from pythondata packages, ...)
+    have to end up next to the generated Verilog in gateware_dir. Before, they were copied one by
+    one on every run and everything in gateware_dir that wasn't .v/.init was deleted afterwards.
+
+    stage_sources() does this concurrently (the work is almost only I/O) and as cheap as possible
+    per file:
+        -unchanged  destination has the same content already (size, then SHA-256): nothing to do
+        -reflinked  copy-on-write clone (FICLONE), for filesystems that support it (btrfs, XFS)
+        -linked     hardlink, if enabled and source and destination are on the same filesystem
+        -copied     plain copy otherwise
+    Hardlinks share the file with the source, so editing the staged file (or a tool rewriting
+    it in place) edits the source, e.g. in the installed pythondata package. They are only
+    used with staging_hardlinks: "True" in the config.
+
+    remove_generated() only deletes files that the build created or changed (compared to a
+    snapshot() taken before the build), are no Verilog/.init files and weren't staged. Files
+    the user put into gateware_dir stay.
+"""
+
+FICLONE = 0x40049409 #from linux/fs.h
+KEEP_SUFFIXES = (".v", ".init")
+
+# Helpers -----------------------------------------------------------------------------------------
+
+def _digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.digest()
+
+def _same_content(source, destination):
+    try:
+        if os.path.getsize(source) != os.path.getsize(destination):
+            return False
+    except OSError:
+        return False
+    return _digest(source) == _digest(destination)
+
+def _reflink(source, destination):
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+# Staging -----------------------------------------------------------------------------------------
+
+def stage_file(source, destination, allow_hardlink=False):
+    """Make destination a copy of source, returns how (see above)."""
+    if os.path.exists(destination):
+        if os.path.samefile(source, destination) or _same_content(source, destination):
+            return "unchanged"
+    #write next to the destination and rename, so the destination is never half written
+    tmp = destination + ".staging"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    try:
+        _reflink(source, tmp)
+        how = "reflinked"
+    except OSError:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+        same_fs = os.stat(source).st_dev == os.stat(os.path.dirname(destination)).st_dev
+        try:
+            if not (allow_hardlink and same_fs):
+                raise OSError
+            os.link(source, tmp)
+            how = "linked"
+        except OSError:
+            shutil.copy2(source, tmp)
+            how = "copied"
+    os.replace(tmp, destination)
+    return how
+
+def stage_sources(sources, destination_dir, jobs=None, allow_hardlink=False):
+    """Stage all source files into destination_dir. Returns the staged files (destination
+    paths), what happened to them and the elapsed time."""
+    start = time.perf_counter()
+    os.makedirs(destination_dir, exist_ok=True)
+    targets = {}
+    for source in sources:
+        #first one wins, as with the copies before (later ones would overwrite it)
+        targets.setdefault(os.path.join(destination_dir, os.path.basename(source)), source)
+    result = {"files": list(targets), "unchanged": 0, "reflinked": 0, "linked": 0, "copied": 0}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(stage_file, s, d, allow_hardlink) for d, s in targets.items()]
+        for future in futures:
+            result[future.result()] += 1
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+def format_report(result):
+    return (f"Staged {len(result['files'])} sources in {result['elapsed']*1e3:.1f} ms "
+            f"({result['unchanged']} unchanged, {result['reflinked']} reflinked, "
+            f"{result['linked']} linked, {result['copied']} copied)")
+
+# Cleanup -----------------------------------------------------------------------------------------
+
+def snapshot(directory):
+    """Modification time and size of every file in directory (empty if it doesn't exist)."""
+    if not os.path.isdir(directory):
+        return {}
+    result = {}
+    for entry in os.scandir(directory):
+        if entry.is_file():
+            stat = entry.stat()
+            result[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return result
+
+def remove_generated(directory, before, keep=()):
+    """Delete files that appeared or changed since the snapshot before, except Verilog, .init
+    and the files in keep. Returns the deleted file names."""
+    keep = {os.path.abspath(f) for f in keep}
+    removed = []
+    for name, state in snapshot(directory).items():
+        path = os.path.join(directory, name)
+        if name.endswith(KEEP_SUFFIXES) or os.path.abspath(path) in keep or before.get(name) == state:
+            continue
+        os.remove(path)
+        removed.append(name)
+    return removed
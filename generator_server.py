@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import contextlib
+import traceback
+import argparse
+import socket
+import json
+import time
+import sys
+import os
+
+#importing the generator pulls in all of LiteX/Migen once for the lifetime of the server
+import litex_generator
+import generator_aux_plan
+from migen.fhdl import tracer
+
+""" Persistent generator server for use with litex_generator.py
+
+    Starting litex_generator.py for every SoC means importing LiteX/Migen and all
+    generator_aux_* modules again each time, which is most of the wall-clock time for
+    small designs. This server keeps everything imported and accepts one config per request.
+
+    Protocol: JSON-RPC 2.0, one request per line, one response per line.
+        -Without arguments the server talks over stdin/stdout. Everything LiteX prints
+         during a generation is redirected to stderr so stdout only carries responses.
+        -With --socket PATH it listens on a local Unix socket instead. Connections are
+         handled one after another; a generation is never run concurrently with another
+         one, since LiteX/Migen were not written with that in mind.
+
+    Methods:
+        generate    params: {"config": "<path to yaml>"} or {"config_data": {...}}
+                    optional: "workdir" (relative paths in the config are resolved there)
+                    result: output/gateware directories, generated files and elapsed time
+        plan        params: same as generate
+                    result: memory map, CSR map and size estimate, nothing is generated
+                    (see generator_aux_plan.py)
+        ping        result: "pong"
+        shutdown    stops the server after the response has been sent
+
+    Example:
+        {"jsonrpc": "2.0", "id": 1, "method": "generate", "params": {"config": "configFile_demo_soc.yaml"}}
+    """
+
+# JSON-RPC error codes (see JSON-RPC 2.0 spec) ----------------------------------------------------
+
+PARSE_ERROR      = -32700
+INVALID_REQUEST  = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS   = -32602
+GENERATION_ERROR = -32000
+
+class RPCError(Exception):
+    def __init__(self, code, message):
+        Exception.__init__(self, message)
+        self.code = code
+        self.message = message
+
+# Request Handling --------------------------------------------------------------------------------
+
+class GeneratorServer:
+    def __init__(self, log=sys.stderr):
+        self.log = log
+        self.running = True
+        self.methods = {
+            "generate" : self.rpc_generate,
+            "plan"     : self.rpc_plan,
+            "ping"     : self.rpc_ping,
+            "shutdown" : self.rpc_shutdown,
+        }
+
+    def rpc_ping(self, params):
+        return "pong"
+
+    def rpc_shutdown(self, params):
+        self.running = False
+        return "bye"
+
+    def read_config(self, params):
+        if "config" not in params and "config_data" not in params:
+            raise RPCError(INVALID_PARAMS, "Need either 'config' or 'config_data'.")
+        if "config" in params:
+            return litex_generator.read_config_file(params["config"])
+        return litex_generator.normalize_config(dict(params["config_data"]))
+
+    def _release_soc(self):
+        #Migen's tracer keeps every named object (name_to_idx, classname_to_objs) for the life
+        #of the process, which would keep every SoC that was ever built alive
+        tracer.classname_to_objs.clear()
+        tracer.name_to_idx.clear()
+
+    def rpc_generate(self, params):
+        #relative paths are resolved against workdir, so always come back to where we were
+        cwd = os.getcwd()
+        try:
+            workdir = params.get("workdir")
+            if workdir is not None:
+                os.chdir(workdir)
+            start = time.perf_counter()
+            profiler = litex_generator.GenerationProfiler()
+            with profiler.stage("read_config"):
+                args = self.read_config(params)
+            #keep LiteX output away from stdout, which carries the responses in stdio mode
+            with contextlib.redirect_stdout(self.log):
+                dirs = litex_generator.generate(args, profiler)
+            elapsed = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+            self._release_soc()
+        return {
+            "name"         : args["name"],
+            "output_dir"   : dirs["output_dir"],
+            "gateware_dir" : dirs["gateware_dir"],
+            "files"        : sorted(os.listdir(dirs["gateware_dir"])),
+            "elapsed"      : elapsed,
+        }
+
+    def rpc_plan(self, params):
+        #address/CSR map and size estimate without generating anything, see generator_aux_plan.py
+        cwd = os.getcwd()
+        try:
+            workdir = params.get("workdir")
+            if workdir is not None:
+                os.chdir(workdir)
+            args = self.read_config(params)
+            with contextlib.redirect_stdout(self.log):
+                return generator_aux_plan.plan(args)
+        finally:
+            os.chdir(cwd)
+            self._release_soc()
+
+    def handle(self, line):
+        """Handle a single request line and return the response line (None for notifications)."""
+        req_id = None
+        notification = False
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise RPCError(PARSE_ERROR, f"Parse error: {e}")
+            if not isinstance(request, dict) or "method" not in request:
+                raise RPCError(INVALID_REQUEST, "Request must be an object with a 'method'.")
+            req_id = request.get("id")
+            notification = "id" not in request
+            method = self.methods.get(request["method"])
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Unknown method '{request['method']}'.")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "Params must be an object.")
+            try:
+                result = method(params)
+            except RPCError:
+                raise
+            except Exception as e:
+                traceback.print_exc(file=self.log)
+                raise RPCError(GENERATION_ERROR, f"{type(e).__name__}: {e}")
+            response = {"jsonrpc": "2.0", "id": req_id, "result": result}
+        except RPCError as e:
+            response = {"jsonrpc": "2.0", "id": req_id, "error": {"code": e.code, "message": e.message}}
+        if notification:
+            return None
+        return json.dumps(response)
+
+# Transports --------------------------------------------------------------------------------------
+
+def serve_stdio(server):
+    out = sys.stdout
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response = server.handle(line)
+        if response is not None:
+            out.write(response + "\n")
+            out.flush()
+        if not server.running:
+            break
+
+def serve_unix_socket(server, path):
+    if os.path.exists(path):
+        os.remove(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    sock.listen()
+    print(f"Generator server listening on {path}", file=server.log)
+    try:
+        while server.running:
+            conn, _ = sock.accept()
+            with conn, conn.makefile("rw") as stream:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    response = server.handle(line)
+                    if response is not None:
+                        stream.write(response + "\n")
+                        stream.flush()
+                    if not server.running:
+                        break
+    finally:
+        sock.close()
+        os.remove(path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent LiteX SoC generator (JSON-RPC).")
+    parser.add_argument("--socket", default=None, help="Listen on this Unix socket instead of stdin/stdout.")
+    args = parser.parse_args()
+
+    server = GeneratorServer()
+    if args.socket is None:
+        serve_stdio(server)
+    else:
+        serve_unix_socket(server, args.socket)
+
+if __name__ == "__main__":
+    main()
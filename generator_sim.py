@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import subprocess
+import argparse
+import hashlib
+import shutil
+import re
+import json
+import time
+import sys
+import os
+
+import litex_generator
+
+""" Verilator simulation harness for SoCs generated by litex_generator.py
+
+    Generates the SoC from a config, compiles the emitted Verilog (the output of
+    Platform.build() plus the copied CPU sources and the sources of external modules)
+    with Verilator and runs it for a number of clock cycles. The testbench only drives
+    the pads every generated SoC has:
+        -clk        toggled every half cycle
+        -rst        held high for the first --reset-cycles cycles
+        -uart_rx    held idle (high)
+        -uart_tx    decoded (8N1 at the configured uart_baudrate) and printed to stdout
+    All other inputs stay at 0.
+
+    At the end, simulated cycles, host wall time and cycles per second are reported
+    and written to sim_result.json in the output directory.
+
+    Firmware is whatever is in the integrated ROM. --firmware sets "integrated_rom_init"
+    (which SoCCore reads as a binary file), so long workloads against GenericCSR peripherals
+    or the DMA test system (dma_test: "True") run without an FPGA:
+        $ python3 generator_sim.py configFile_demo_soc.yaml --firmware firmware.bin --cycles 50000000
+
+    The model is built with "verilator --threads" (default: up to 4 threads). Building takes
+    much longer than generating, so the build is skipped if the sources and Verilator
+    options are the same as for the previous build in the same output directory.
+"""
+
+SIM_DIR       = "sim"
+RESULT_NAME   = "sim_result.json"
+BINARY_NAME   = "Vsim"
+#--build (Verilator calls make itself) is the newest option used here
+MIN_VERILATOR = (4, 34)
+
+#Verilator complains a lot about the (valid) Verilog emitted by Migen and the CPU generators
+VERILATOR_FLAGS = [
+    "--cc", "--exe", "--build",
+    "-O3", "--x-assign", "fast", "--x-initial", "fast", "--noassert",
+    "-Wno-fatal", "-Wno-lint", "-Wno-style",
+    "-CFLAGS", "-O2",
+]
+
+# Testbench ---------------------------------------------------------------------------------------
+
+TESTBENCH = """\
+// Generated by generator_sim.py
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include "verilated.h"
+#include "V{top}.h"
+
+// Legacy Verilator API (no VerilatedContext), so that the Verilator of Ubuntu 22.04 (4.038)
+// builds it as well as newer ones; time is counted in half cycles.
+static unsigned long long main_time = 0;
+double sc_time_stamp() {{ return main_time; }}
+
+int main(int argc, char** argv) {{
+    Verilated::commandArgs(argc, argv);
+    if (argc < 5) {{
+        fprintf(stderr, "usage: %s CYCLES RESET_CYCLES BAUD_DIV RESULT_FILE\\n", argv[0]);
+        return 2;
+    }}
+    const unsigned long long cycles       = strtoull(argv[1], nullptr, 0);
+    const unsigned long long reset_cycles = strtoull(argv[2], nullptr, 0);
+    const unsigned long long baud_div     = strtoull(argv[3], nullptr, 0);
+
+    V{top}* top = new V{top};
+
+    // UART receiver state (decodes uart_tx, 8N1).
+    int uart_bit = -1;
+    unsigned long long uart_next = 0;
+    unsigned uart_byte = 0;
+    unsigned long long uart_bytes = 0;
+
+    top->clk = 0;
+    top->rst = 1;
+    top->uart_rx = 1;
+    top->eval();
+
+    auto start = std::chrono::steady_clock::now();
+    unsigned long long cycle = 0;
+    for (; cycle < cycles && !Verilated::gotFinish(); cycle++) {{
+        top->rst = cycle < reset_cycles;
+        top->clk = 1;
+        top->eval();
+        main_time++;
+        top->clk = 0;
+        top->eval();
+        main_time++;
+
+        if (uart_bit < 0) {{
+            if (!top->uart_tx) {{            // start bit, sample in the middle of each bit
+                uart_bit = 0;
+                uart_byte = 0;
+                uart_next = cycle + baud_div + baud_div/2;
+            }}
+        }} else if (cycle == uart_next) {{
+            if (uart_bit < 8) {{
+                uart_byte |= (unsigned)top->uart_tx << uart_bit;
+                uart_bit++;
+                uart_next += baud_div;
+            }} else {{                        // stop bit
+                putchar(uart_byte);
+                fflush(stdout);
+                uart_bytes++;
+                uart_bit = -1;
+            }}
+        }}
+    }}
+    double wall = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+    top->final();
+
+    FILE* f = fopen(argv[4], "w");
+    if (f) {{
+        fprintf(f, "{{\\"cycles\\": %llu, \\"wall_s\\": %f, \\"cycles_per_s\\": %f, \\"uart_bytes\\": %llu, \\"finished\\": %s}}\\n",
+            cycle, wall, wall > 0 ? cycle/wall : 0.0, uart_bytes, Verilated::gotFinish() ? "true" : "false");
+        fclose(f);
+    }}
+    delete top;
+    return 0;
+}}
+"""
+
+def write_testbench(sim_dir, top):
+    path = os.path.join(sim_dir, "sim_main.cpp")
+    with open(path, "w") as f:
+        f.write(TESTBENCH.format(top=top))
+    return path
+
+# Sources -----------------------------------------------------------------------------------------
+
+def collect_sources(args, dirs):
+    """Top-level Verilog first, then everything else Platform.build() and the source copy
+    left in the gateware directory, then the sources of external modules (those aren't
+    copied, GenericVlogModuleCSR only instantiates them by name)."""
+    gateware_dir = dirs["gateware_dir"]
+    top = os.path.join(gateware_dir, f"{args['name']}.v")
+    sources = [top]
+    sources += sorted(
+        os.path.join(gateware_dir, f) for f in os.listdir(gateware_dir)
+        if f.endswith(".v") and os.path.join(gateware_dir, f) != top)
+    for entry in (args.get("external_modules") or {}).values():
+        if entry["source"] is not None:
+            source = os.path.abspath(entry["source"])
+            if os.path.basename(source) not in map(os.path.basename, sources):
+                sources.append(source)
+    return sources
+
+def _build_digest(sources, flags):
+    h = hashlib.sha256()
+    h.update(json.dumps(flags).encode())
+    for source in sources:
+        with open(source, "rb") as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+# Build/Run ---------------------------------------------------------------------------------------
+
+def verilator_version():
+    """(major, minor) of the Verilator in PATH, e.g. (4, 38) for "Verilator 4.038 2020-07-11"."""
+    if shutil.which("verilator") is None:
+        raise RuntimeError("verilator not found in PATH.")
+    output = subprocess.run(["verilator", "--version"], capture_output=True, text=True, check=True).stdout
+    match = re.search(r"Verilator\s+(\d+)\.(\d+)", output)
+    if match is None:
+        raise RuntimeError(f"Unknown Verilator version: {output.strip()}")
+    return int(match.group(1)), int(match.group(2))
+
+def verilate(sim_dir, top, sources, threads, jobs):
+    """Build the simulation binary, unless the previous build in sim_dir is still valid.
+    Returns the path of the binary and the build time (0 if skipped)."""
+    version = verilator_version()
+    if version < MIN_VERILATOR:
+        raise RuntimeError(f"Verilator {version[0]}.{version[1]:03} is too old, "
+            f"{MIN_VERILATOR[0]}.{MIN_VERILATOR[1]:03} or newer is needed.")
+    os.makedirs(sim_dir, exist_ok=True)
+    testbench = write_testbench(sim_dir, top)
+    obj_dir = os.path.join(sim_dir, "obj_dir")
+    binary = os.path.join(obj_dir, BINARY_NAME)
+    flags = VERILATOR_FLAGS + ["--threads", str(threads), "-j", str(jobs)]
+    digest = _build_digest(sources + [testbench], flags)
+
+    stamp = os.path.join(sim_dir, "build.json")
+    try:
+        with open(stamp) as f:
+            if json.load(f).get("digest") == digest and os.path.isfile(binary):
+                print(f"Simulation model is up to date ({binary})")
+                return binary, 0.0
+    except (OSError, ValueError):
+        pass
+
+    cmd = ["verilator"] + flags + [
+        "--top-module", top,
+        "--Mdir", obj_dir,
+        "-o", BINARY_NAME,
+    ] + sources + [testbench]
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True)
+    build_s = time.perf_counter() - start
+    with open(stamp, "w") as f:
+        json.dump({"digest": digest, "build_s": build_s}, f, indent=1)
+    return binary, build_s
+
+def run_sim(binary, gateware_dir, cycles, reset_cycles, baud_div, result_path):
+    #$readmemh() in the generated Verilog uses paths relative to the gateware directory
+    start = time.perf_counter()
+    subprocess.run([binary, str(cycles), str(reset_cycles), str(baud_div), result_path],
+        cwd=gateware_dir, check=True)
+    host_s = time.perf_counter() - start
+    with open(result_path) as f:
+        result = json.load(f)
+    result["host_s"] = host_s
+    return result
+
+def simulate(args, cycles, reset_cycles=16, threads=None, jobs=None):
+    """Generate the SoC of an already loaded config, build the Verilator model and run it.
+    Returns the result dict (also written to sim_result.json in the output directory)."""
+    threads = threads or min(4, os.cpu_count() or 1)
+    jobs = jobs or os.cpu_count() or 1
+    dirs = litex_generator.generate(args)
+    sources = collect_sources(args, dirs)
+    sim_dir = os.path.join(dirs["output_dir"], SIM_DIR)
+
+    binary, build_s = verilate(sim_dir, args["name"], sources, threads, jobs)
+
+    sys_clk_freq = int(50e6) if args["sys_clk_freq"] is None else int(args["sys_clk_freq"])
+    baudrate = int(args.get("uart_baudrate") or 115200)
+    result_path = os.path.join(dirs["output_dir"], RESULT_NAME)
+    result = run_sim(binary, dirs["gateware_dir"], cycles, reset_cycles,
+        max(1, sys_clk_freq//baudrate), result_path)
+    result.update({
+        "name"         : args["name"],
+        "sys_clk_freq" : sys_clk_freq,
+        "threads"      : threads,
+        "build_s"      : build_s,
+        "sources"      : sources,
+    })
+    #how far the simulation is from real time
+    result["realtime_factor"] = result["cycles_per_s"] / sys_clk_freq
+    with open(result_path, "w") as f:
+        json.dump(result, f, indent=1)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a generated SoC with Verilator.")
+    parser.add_argument("config", help="Config file.")
+    parser.add_argument("--cycles", type=int, default=1_000_000, help="Clock cycles to simulate.")
+    parser.add_argument("--reset-cycles", type=int, default=16, help="Cycles to hold rst high.")
+    parser.add_argument("--firmware", default=None, help="Binary to put into the integrated ROM.")
+    parser.add_argument("--threads", type=int, default=None, help="Verilator model threads (default: up to 4).")
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel C++ compile jobs (default: CPU count).")
+    args = parser.parse_args()
+
+    try:
+        config = litex_generator.read_config_file(args.config)
+    except litex_generator.ConfigError as e:
+        print(e)
+        sys.exit(1)
+    if args.firmware is not None:
+        config["integrated_rom_init"] = os.path.abspath(args.firmware)
+    result = simulate(config, args.cycles, args.reset_cycles, args.threads, args.jobs)
+    print()
+    print(f"{result['cycles']} cycles in {result['wall_s']:.2f}s: {result['cycles_per_s']/1e3:.1f} kHz "
+          f"({result['realtime_factor']:.2e} x real time, {result['threads']} threads), "
+          f"{result['uart_bytes']} UART bytes, model build {result['build_s']:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+#
+# This file is not part of LiteX.
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de>
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import concurrent.futures
+import itertools
+import traceback
+import argparse
+import copy
+import json
+import time
+import sys
+import os
+
+from migen.fhdl import tracer
+
+import litex_generator
+
+""" Batch/sweep mode for litex_generator.py
+
+    Generates many variants of one SoC for design-space exploration. The sweep file names
+    a base config and a parameter matrix; every combination of the matrix values is one
+    variant. Variants are elaborated and emitted in a process pool, each into its own
+    output directory, and a manifest of all variants is written at the end.
+
+    Sweep file example:
+        base: configFile_demo_soc.yaml
+        output_dir: sweep_build          #optional, defaults to "sweep"
+        matrix:
+            bus_data_width: [32, 64]
+            sys_clk_freq: [50e6, 100e6]
+            cpu_type: [vexriscv, serv]
+            hard_i2c: ["True", "False"]
+            external_modules.mod0.ports.p0.size: [8, 16]   #dotted keys reach into nested entries
+
+    Every worker is a separate process and generation doesn't change the working directory
+    (see Platform.build), so variants can't interfere with each other. A failing variant is
+    recorded in the manifest and doesn't stop the others; a variant that isn't a valid config
+    is recorded as "invalid" with the config errors and not generated at all.
+"""
+
+#directory settings of the base config would make all variants write to the same place
+PER_VARIANT_DIRS = ["gateware_dir", "software_dir", "include_dir", "generated_dir", "csr_json", "csr_csv", "csr_svd", "memory_x"]
+
+def set_dotted(config, key, value):
+    *path, last = key.split(".")
+    try:
+        for p in path:
+            config = config[p]
+        config[last] = value
+    except (KeyError, IndexError, TypeError):
+        #a typo or an entry the base config doesn't have (e.g. external_modules: None)
+        raise litex_generator.ConfigError([f"{key}: doesn't resolve in the base config"])
+
+def expand_matrix(matrix):
+    """Return one dict of overrides per combination of the matrix values."""
+    keys = list(matrix.keys())
+    values = [v if isinstance(v, list) else [v] for v in matrix.values()]
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+def make_variant(base, overrides, output_dir):
+    config = copy.deepcopy(base)
+    for key, value in overrides.items():
+        set_dotted(config, key, value)
+    config["output_dir"] = output_dir
+    for key in PER_VARIANT_DIRS:
+        config[key] = None
+    #the variants run in parallel already, don't fork again for the modules of hierarchical mode
+    if config.get("hierarchy_jobs") is None:
+        config["hierarchy_jobs"] = 1
+    return litex_generator.normalize_config(config)
+
+# Worker ------------------------------------------------------------------------------------------
+
+def run_variant(index, config):
+    """Generate a single variant. Runs in a worker process, so stdout/stderr (which LiteX
+    uses heavily) can be redirected to a per-variant log at file descriptor level."""
+    os.makedirs(config["output_dir"], exist_ok=True)
+    log_path = os.path.join(config["output_dir"], "generation.log")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = os.dup(1), os.dup(2)
+    start = time.perf_counter()
+    result = {"index": index, "log": os.path.abspath(log_path)}
+    with open(log_path, "w") as log:
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            dirs = litex_generator.generate(config)
+            result["status"] = "ok"
+            result["gateware_dir"] = dirs["gateware_dir"]
+            result["files"] = {
+                f: os.path.getsize(os.path.join(dirs["gateware_dir"], f))
+                for f in sorted(os.listdir(dirs["gateware_dir"]))
+            }
+        except Exception as e:
+            traceback.print_exc()
+            result["status"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            #workers are reused; Migen's tracer would keep the names (and the SoC) of this
+            #variant and change the signal names of the next one
+            tracer.classname_to_objs.clear()
+            tracer.name_to_idx.clear()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+# Sweep -------------------------------------------------------------------------------------------
+
+def run_sweep(sweep, jobs=None):
+    base = litex_generator.load_config_file(sweep["base"])
+    output_dir = os.path.abspath(sweep.get("output_dir") or "sweep")
+    variants = expand_matrix(sweep.get("matrix") or {})
+
+    manifest = {"base": os.path.abspath(sweep["base"]), "matrix": sweep.get("matrix"), "variants": []}
+    configs = {}
+    for i, overrides in enumerate(variants):
+        variant_dir = os.path.join(output_dir, f"variant_{i:03d}")
+        manifest["variants"].append({"index": i, "overrides": overrides, "output_dir": variant_dir})
+        try:
+            configs[i] = make_variant(base, overrides, variant_dir)
+        except litex_generator.ConfigError as e:
+            manifest["variants"][i].update({"status": "invalid", "error": str(e)})
+            print(f"variant_{i:03d}: invalid")
+
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_variant, i, config) for i, config in configs.items()]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            manifest["variants"][result["index"]].update(result)
+            print(f"variant_{result['index']:03d}: {result['status']} ({result['elapsed']:.2f}s)")
+    manifest["elapsed"] = time.perf_counter() - start
+    manifest["failed"] = sum(1 for v in manifest["variants"] if v["status"] != "ok")
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "sweep_manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2, default=str)
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate many SoC variants in parallel.")
+    parser.add_argument("sweep", help="Sweep file (base config + parameter matrix).")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of worker processes (default: CPU count).")
+    args = parser.parse_args()
+
+    sweep = litex_generator.load_config_file(args.sweep)
+    manifest = run_sweep(sweep, jobs=args.jobs)
+    print(f"{len(manifest['variants'])} variants, {manifest['failed']} failed, {manifest['elapsed']:.2f}s")
+    sys.exit(1 if manifest["failed"] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,418 +1,669 @@
-#!/usr/bin/env python3
-
-#
-# This file is based on a file that is part of LiteX.
-#
-# Copyright (c) 2022 Florent Kermarrec <florent@enjoy-digital.fr>
-# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de> 
-#
-# SPDX-License-Identifier: BSD-2-Clause
-
-import pdb  #TODO:      REMOVE when no longer necessary!
-import shutil
-import yaml
-import sys
-import os
-
-#from migen import *
-
-from litex.build.generic_platform import *
-from litex.soc.integration.soc_core import *
-from litex.soc.integration.soc import SoCRegion
-from litex.soc.integration.builder import *
-
-from generator_aux_CSR import *
-from generator_aux_CRG import *
-from generator_aux_DMA import *         
-
-# IOs/Interfaces -----------------------------------------------------------------------------------
-
-def make_io(inst_name, ports):
-    _ios = []
-    for j in ports:
-        """
-        This is an older version where the naming depends on direction
-        if ports[j]['direction'] == "in":   #input of ext. module is output of SoC
-            name = "foo_"+ports[j]['name']
-        elif ports[j]['direction'] == "out":
-            name = "bar_"+ports[j]['name']
-        else:
-            print("Missing directions for external ports!")
-            return _ios
-        """
-        name = inst_name + "_" + ports[j]['name']
-        size = ports[j]['size']
-        element = (name, 0, Pins(size))
-        _ios.append(element)
-    return _ios    
-
-def get_common_ios():
-    return [
-        # Clk/Rst.
-        ("clk", 0, Pins(1)),
-        ("rst", 0, Pins(1)),
-    ]
-
-def get_uart_ios():
-    return [
-        # Serial
-        ("uart", 0,
-            Subsignal("tx",  Pins(1)),
-            Subsignal("rx", Pins(1)),
-        )
-    ]
-    
-#more dummy IO ressources for testing use of the ecosystem cores
-def get_i2c_io():
-    return [
-        ("i2cmaster", 0,
-            Subsignal("scl", Pins(1)),
-            Subsignal("sda", Pins(1)),
-        )
-    ]
-def get_spi_master_io():
-    return [
-        ("spimaster", 0,
-            Subsignal("clk", Pins(1)),
-            Subsignal("cs_n", Pins(1)),
-            Subsignal("mosi", Pins(1)),
-            Subsignal("miso", Pins(1)),
-        )
-    ] 
-
-def get_SDcard_io():
-    return [
-        ("sdcard", 0,
-            Subsignal("data", Pins(4)),
-            Subsignal("cmd", Pins(1)),
-            Subsignal("clk", Pins(1)),
-            Subsignal("cd", Pins(1)),
-        )
-    ]
-
-def get_spiSDcard_io():
-    return [
-        ("spisdcard", 0,
-            Subsignal("clk",  Pins(f"{pmod}:3")),
-            Subsignal("mosi", Pins(f"{pmod}:1"), Misc("PULLUP=true")),
-            Subsignal("cs_n", Pins(f"{pmod}:0"), Misc("PULLUP=true")),
-            Subsignal("miso", Pins(f"{pmod}:2"), Misc("PULLUP=true")),
-        )
-    ]
-
-def get_debug_ios(debug_width=8):
-    return [
-        ("debug", 0, Pins(debug_width)),
-    ]
-
-# Platform -----------------------------------------------------------------------------------------
-
-class Platform(GenericPlatform):
-    def build(self, fragment, build_dir, build_name, **kwargs):
-        os.makedirs(build_dir, exist_ok=True)
-        os.chdir(build_dir)
-        conv_output = self.get_verilog(fragment, name=build_name)
-        conv_output.write(f"{build_name}.v")
-        
-# LiteX SoC Generator ------------------------------------------------------------------------------
-#added some arguments to the SoCGenerator Class
-class LiteXSoCGenerator(SoCMini):
-    def __init__(self, **kwargs):
-        #provide default value for name and clock frequency if not available
-        name = "litex_soc" if kwargs['name'] is None else kwargs['name']   
-        sys_clk_freq = int(50e6) if kwargs['sys_clk_freq'] is None else int(kwargs['sys_clk_freq'])
-        base_io=get_common_ios()     #start with minimal io for all platforms
-        
-        # Platform and CRG ---------------------------------------------------------------------------------     
-        #Use generic platform unless specified. For now, platform only required for CRG.
-        #TODO: REMOVE THESE LINES UP TO THE COMMENT WHEN REACTIVATING AUTO_PLL STUFF!
-        platform = Platform(device="", io=base_io)
-        platform.name = name
-        #Use dummy CRG for generic platform. User must take care of clocking.
-        self.submodules.crg = CRG( 
-            clk = platform.request("clk"), 
-            rst = platform.request("rst"),
-        )
-        """
-        if kwargs['auto_pll'] is False:
-            platform = Platform(device="", io=base_io)
-            platform.name = name
-            #Use dummy CRG for generic platform. User must take care of clocking.
-            self.submodules.crg = CRG( 
-                clk = platform.request("clk"), 
-                rst = platform.request("rst"),
-            )
-        else:
-            ref_clk_freq = int(kwargs['ref_clk_freq'])
-            if kwargs['device'] is None:
-                raise ValueError(
-                    "No device selected. This shouldn't happen. Did someone edit the config by hand?")
-            else:
-                device = kwargs['device']
-                #TODO: Maybe add more specific device options; may be relevant e.g. for iCE40 devices
-                match (device):
-                    case "Altera":
-                        print("THIS IS JUST A DUMMY FOR NOW!")
-                    case "Gatemate":
-                        from litex.build.colognechip.platform import CologneChipPlatform
-                        platform = CologneChipPlatform(device="CCGM1A1", io=base_io, toolchain="peppercorn")
-                        self.crg = _CRG_CCGM(platform, sys_clk_freq, ref_clk_freq)
-                    case "LatticeECP5":
-                        from litex.build.lattice import LatticeECP5Platform
-                        platform = LatticeECP5Platform(device="DUMMY", io=base_io, toolchain="diamond")
-                        #note: I put the "diamond" toolchain so that litex shuts up
-                        #TODO: Check if that means missing some key generated files...
-                        self.crg = _CRG_LatticeECP5(platform, sys_clk_freq, ref_clk_freq)
-                    case "iCE40":
-                        from litex.build.lattice import LatticeiCE40Platform
-                        platform = LatticeiCE40Platform(device="DUMMY", io=base_io, toolchain="icestorm")
-                        self.crg = _CRGLatticeiCE40(platform, sys_clk_freq, ref_clk_freq)
-                    case "XilinxS7":
-                        from litex.build.xilinx import Xilinx7SeriesPlatform
-                        platform = Xilinx7SeriesPlatform(device="DUMMY", io=base_io, toolchain="vivado")
-                        self.crg = _CRG_Xilinx7Series(platform, sys_clk_freq, ref_clk_freq)
-                    case "XilinxS6":
-                        from litex.build.xilinx import XilinxSpartan6Platform
-                        platform = XilinxSpartan6Platform(device="DUMMY", io=base_io, toolchain="vivado")
-                        self.crg = _CRG_XilinxSpartan6(platform, sys_clk_freq, ref_clk_freq)
-                    case "XilinxUS":
-                        from litex.build.xilinx import XilinxUSPlatform
-                        platform = XilinxUSPlatform(device="DUMMY", io=base_io, toolchain="vivado")
-                        self.crg = _CRG_XilinxUltrascale(platform, sys_clk_freq, ref_clk_freq)
-                    case "XilinxUSP":
-                        from litex.build.xilinx import XilinxUSPPlatform
-                        platform = XilinxUSPPlatform(device="DUMMY", io=base_io, toolchain="vivado")
-                        self.crg = _CRG_XilinxUltrascalePlus(platform, sys_clk_freq, ref_clk_freq)
-                    case _:
-                        print("It ... it can't be. This shouldn't be possible! How did we get here without specifying a device?")
-                        raise ValueError("{} is not a recognized device type.".format(device))
-        """             
-        # SoC --------------------------------------------------------------------------------------
-        platform.add_extension(get_uart_ios())
-        
-        if kwargs["uart_name"] == "serial":
-            kwargs["uart_name"] = "uart"
-        #TODO: Check for useful UART options
-           
-        SoCCore.__init__(self, platform, clk_freq=sys_clk_freq, ident=f"LiteX standalone SoC - {name}", **kwargs)
-        
-        """ 
-        Currently the implementation is minimalistic. It may make sense to make
-        the whole thing more dynamic, however that will require more complex 
-        inputs as well.
-        For now, this serves mostly to experiment with this and give the base-SoC 
-        more functionality of its own.
-        As the designs are usually flattened into a single verilog file, it may
-        be best to limit the base-SoC functionality and keep complex parts,
-        which may require later editing in Verilog, separate.
-        """        
-        if kwargs['soft_i2c']:
-            platform.add_extension(get_i2c_io(has_interrupt=False))
-            from litex.soc.cores.bitbang import I2CMaster
-            self.add_module(name="i2c", module=I2CMaster(platform.request("i2cmaster")))
-        
-        if kwargs['hard_i2c']:
-        #TODO: Check if implementing custom name for i2c master is worthwhile
-            if kwargs['i2c_interrupt']:
-                platform.add_extension(get_i2c_io())
-                self.add_i2c_master(with_irq=True) #sends interrupt when rx_ready
-            else:
-                platform.add_extension(get_i2c_io())
-                self.add_i2c_master()
-            
-        if kwargs['hard_spi']:    
-            platform.add_extension(get_spi_master_io())
-            self.add_spi_master()
-        
-        if kwargs['soft_spi']:
-            platform.add_extension(get_spi_master_io())
-            from litex.soc.cores.bitbang import SPIMaster
-            self.spi = SPIMaster(platform.request("spimaster"))
-
-        if kwargs['SDcard']:
-            platform.add_extension(get_SDcard_io())
-            self.add_sdcard()
-
-        """
-        I'm preparing some addittional functionality here that shall be kept inactive until the
-        relevant fields are added to the GUI.  
-
-        if kwargs['spi_sdcard']:
-            platform.add_extension(get_spiSDcard_io())
-            self.add_spi_sdcard()
-        """ 
-        
-        if kwargs['external_modules']:  #check for entries in external_modules
-            for i in kwargs['external_modules']:
-                vlog_src = kwargs['external_modules'][i]['source']
-                mod_name = kwargs['external_modules'][i]['module_name']     #see above
-                inst_name = kwargs['external_modules'][i]['instance_name']  #using this for now
-                ports = kwargs['external_modules'][i]['ports']
-                params = kwargs['external_modules'][i]['parameters']
-                
-                #check if vlog_src is given (currently used to distignuish internal and external)
-                if vlog_src == "None":
-                    CSRwrap = GenericCSR(ports, params)
-                    platform.add_extension(make_io(inst_name, ports))
-                    self.add_module(name=inst_name, module=CSRwrap)
-                    for k in ports:
-                        connector = "con_" + ports[k]['name'];
-                        io_portname = inst_name + "_" + ports[k]['name'] #name of the generated external io
-                        if ports[k]['direction'] == "in":  #input of external module means output of SoC
-                            self.comb += platform.request(io_portname).eq(
-                                getattr(getattr(self, inst_name), connector))
-                        elif ports[k]['direction'] == "out":
-                            self.comb += getattr(getattr(self, inst_name), connector).eq(
-                                platform.request(io_portname))
-                        #TODO: Check if support for "inout" is worthwhile
-                        #elif ports[k]['direction'] == "inout": 
-                        else:
-                            print("Missing directions for external ports!")
-                
-                else:   #NOTE: for now I assume that configs will always be valid
-                    CSRwrap = GenericVlogModuleCSR(params, ports, platform, mod_name, inst_name, vlog_src)
-                    self.add_module(name=inst_name, module=CSRwrap)                    
-                """
-                On the CSR interface: The way this is designed now, there are two distinct ways of connecting
-                an external (Verilog) Module to the system:
-                1. GenericCSR: This creates top-level ports connecting them to CSRs according to the data
-                               direction. This is primarily designed for such cases where only some of a 
-                               modules ports need to be connected to a CSR.
-                #TODO: Rework method to be more flexible?
-                2. GenericVlogModule: This creates an instance of the external Module within the BaseSoC.
-                                      This is intended for modules that are entirely contained within the
-                                      BaseSoC with no direct connection to the outside world.
-                #TODO: Investigate suitability for LiteX-Cores or possible alternatives
-                       The idea is to add any additional periphery as submodules in the Verilog. So far I
-                       have the impression that Migen/FHDL doesn't do that for Migen/FHDL modules.
-                       Perhaps this can be circumvented by generating the Verilog before adding the thing
-                       here but I'm unsure if that is a good idea...
-                """
-                
-        #Unless an external bus interface is used, these do nothing 
-        bus_width = kwargs['bus_data_width']
-        bus_addr_width = kwargs['bus_address_width']
-        
-        # MMAP Slave Interface ---------------------------------------------------------------------
-        if kwargs['external_bus_slave_interface']:   
-            s_bus = {
-                "wishbone" : wishbone.Interface(data_width=bus_width, adr_width=bus_addr_width),
-                "axi-lite" : axi.AXILiteInterface(data_width=bus_width, address_width=bus_addr_width),
-                "axi" : axi.AXIInterface(data_width=bus_width, address_width=bus_addr_width), #TODO: Test if this works properly! 
-            }[kwargs["bus_standard"]]
-            self.bus.add_master(name="mmap_bus_s", master=s_bus)
-            platform.add_extension(s_bus.get_ios("mmap_bus_s"))
-            wb_pads = platform.request("mmap_bus_s")
-            self.comb += s_bus.connect_to_pads(wb_pads, mode="slave")
-        
-        # MMAP Master Interface --------------------------------------------------------------------
-        # FIXME: Allow Region configuration.
-        if kwargs['external_bus_master_interface']: 
-            m_bus = {
-                "wishbone" : wishbone.Interface(data_width=bus_width, adr_width=bus_addr_width),
-                "axi-lite" : axi.AXILiteInterface(data_width=bus_width, address_width=bus_addr_width),
-                "axi" : axi.AXIInterface(data_width=bus_width, address_width=bus_addr_width), #TODO: Test if this works properly!
-            }[kwargs["bus_standard"]]
-            wb_region = SoCRegion(origin=0xa000_0000, size=0x1000_0000, cached=False) # FIXME.
-            self.bus.add_slave(name="mmap_bus_m", slave=m_bus, region=wb_region)
-            platform.add_extension(m_bus.get_ios("mmap_bus_m"))
-            wb_pads = platform.request("mmap_bus_m")
-            self.comb += m_bus.connect_to_pads(wb_pads, mode="master")
-        
-        # Debug ------------------------------------------------------------------------------------
-        platform.add_extension(get_debug_ios())
-        debug_pads = platform.request("debug")
-        self.comb += [
-            # Export Signal(s) for debug.
-            debug_pads[0].eq(0), # 0.
-            debug_pads[1].eq(1), # 1.
-            # Etc...
-        ]
-
-# Build --------------------------------------------------------------------------------------------
-def main():
-    #TODO: Implement option for arbitrary file name? 'configFile_output.yaml'
-    args = read_config_file('configFile_demo_soc.yaml')
-    #args = read_config_file('soc_test_new.yaml')
-    # SoC.
-    soc = LiteXSoCGenerator(
-        **args
-    )
-    
-    # Build
-    builder = Builder(soc, **builder_arg_filter(**args))
-    #TODO: Check if this is the best setting here...
-    #builder.build(build_name=args['name'], run=args['build'])
-    builder.build(build_name=args['name'], run=False)
-    
-    #Copy source of e.g. CPU hardware to output directory
-    for filepath, language, library, *copy in builder.soc.platform.sources:
-        source = filepath
-        destination = builder.gateware_dir
-        #make sure to only copy files that aren't already at destination
-        if os.path.isdir(destination):
-            destination = os.path.join(destination, os.path.basename(source))
-        if not shutil._samefile(source, destination):
-            make = shutil.copy(source, destination)
-      
-    """TODO: Think of how to handle the generated gateware build-scripts
-       Litex will auto-generate build scripts if I give the platfrom and toolchain for
-       the automated CRG functionality. These likely will not work properly, as I have
-       done nothing to ensure they do, while using Litex in an unconventional way.
-       
-       The simplest way to deal with this is to just delete them, but that is inelegant
-       and inefficient. Maybe they could be kept as part of some sort of "advanced mode"
-       that can be activated in the GUI.
-    """
-    #For now: Clear build scripts from gateware_dir to avoid confusion 
-    for file in os.listdir(builder.gateware_dir):
-        if not (file.endswith(".v") or file.endswith(".init")):
-            path = os.path.join(builder.gateware_dir, file)
-            os.remove(path)
-            
-#Auxiliary Methods ------------------------------------------------------------------------------
-def read_config_file(filename):     
-    soc_config = yaml.load(open(filename).read(), Loader=yaml.Loader)
-    
-    # Convert YAML elements to Python/LiteX --------------------------------------------------------
-    for k, v in soc_config.items():
-        replaces = {"False": False, "True": True, "None": None}
-        for r in replaces.keys():
-            if v == r:
-                soc_config[k] = replaces[r]
-        if "clk_freq" in k:
-            soc_config[k] = float(soc_config[k])
-#This is taken from gen.py in liteDRAM and adapted-------------------------------------------------------
-
-    return soc_config
-
-def builder_arg_filter(**kwargs):
-    #Set of arguments must be reduced to relevant options for builder
-    valid_keys = [
-        #Directories
-        "output_dir", "gateware_dir", "software_dir", "include_dir",
-        "generated_dir",
-        #Compilation
-        "compile_software", "compile_gateware", "build_backend",
-        #Exports
-        "csr_json", "csr_csv", "csr_svd", "memory_x",
-        #BIOS
-        "bios_lto", "bios_format", "bios_console",
-        #Documentation
-        "generate_doc"
-    ]
-    valid_args = {}
-    for arg_key in kwargs.keys():
-        for v_key in valid_keys:
-            if v_key == arg_key:
-                valid_args.update({v_key: kwargs[v_key]})
-    #TODO: Add option for compile software?
-    #valid_args.update({"compile_software" : True})
-    valid_args.update({"compile_gateware" : False})
-    
-    return valid_args     
-
-  
-    
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+
+#
+# This file is based on a file that is part of LiteX.
+#
+# Copyright (c) 2022 Florent Kermarrec <florent@enjoy-digital.fr>
+# Copyright (?) 2025 Sven Krause <sven.krause@fh-dortmund.de> 
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import pdb  #TODO:      REMOVE when no longer necessary!
+import json
+import sys
+import os
+
+#from migen import *
+
+from litex.build.generic_platform import *
+from litex.soc.integration.soc_core import *
+from litex.soc.integration.builder import *
+
+from generator_aux_CSR import *
+from generator_aux_CRG import *
+from generator_aux_CRG import (_CRG_CCGM, _CRG_LatticeECP5, _CRGLatticeiCE40, _CRG_Xilinx7Series,
+    _CRG_XilinxSpartan6, _CRG_XilinxUltrascale, _CRG_XilinxUltrascalePlus)
+from generator_aux_DMA import *         
+from generator_aux_bus import (DEFAULT_REGIONS, make_bus, add_external_bus, RegisterSlices,
+    converter_report, format_converter_report, tracking_adapters)
+from generator_aux_cache import GenerationCache
+import generator_aux_reuse as reuse
+import generator_aux_staging as staging
+import generator_aux_hierarchy as hierarchy
+from generator_aux_pll import PLLCache, format_report as format_pll_report
+import generator_aux_resources as resources
+from generator_aux_profile import GenerationProfiler, NullProfiler
+from generator_aux_config import load_config_file, normalize_config, ConfigError
+
+# IOs/Interfaces -----------------------------------------------------------------------------------
+
+def make_io(inst_name, ports):
+    _ios = []
+    for j in ports:
+        """
+        This is an older version where the naming depends on direction
+        if ports[j]['direction'] == "in":   #input of ext. module is output of SoC
+            name = "foo_"+ports[j]['name']
+        elif ports[j]['direction'] == "out":
+            name = "bar_"+ports[j]['name']
+        else:
+            print("Missing directions for external ports!")
+            return _ios
+        """
+        name = inst_name + "_" + ports[j]['name']
+        size = ports[j]['size']
+        if ports[j].get('type') == "stream":
+            #one pad group per stream, the top-level ports are named <name>_tdata etc.
+            subsignals = [
+                Subsignal("tdata",  Pins(size)),
+                Subsignal("tvalid", Pins(1)),
+                Subsignal("tready", Pins(1)),
+                Subsignal("tlast",  Pins(1)),
+            ]
+            if ports[j].get('async'):
+                subsignals.append(Subsignal("aclk", Pins(1)))
+            element = (name, 0, *subsignals)
+        else:
+            element = (name, 0, Pins(size))
+        _ios.append(element)
+    return _ios    
+
+def get_common_ios():
+    return [
+        # Clk/Rst.
+        ("clk", 0, Pins(1)),
+        ("rst", 0, Pins(1)),
+    ]
+
+def get_uart_ios():
+    return [
+        # Serial
+        ("uart", 0,
+            Subsignal("tx",  Pins(1)),
+            Subsignal("rx", Pins(1)),
+        )
+    ]
+    
+#more dummy IO ressources for testing use of the ecosystem cores
+def get_i2c_io():
+    return [
+        ("i2cmaster", 0,
+            Subsignal("scl", Pins(1)),
+            Subsignal("sda", Pins(1)),
+        )
+    ]
+def get_spi_master_io():
+    return [
+        ("spimaster", 0,
+            Subsignal("clk", Pins(1)),
+            Subsignal("cs_n", Pins(1)),
+            Subsignal("mosi", Pins(1)),
+            Subsignal("miso", Pins(1)),
+        )
+    ] 
+
+def get_SDcard_io():
+    return [
+        ("sdcard", 0,
+            Subsignal("data", Pins(4)),
+            Subsignal("cmd", Pins(1)),
+            Subsignal("clk", Pins(1)),
+            Subsignal("cd", Pins(1)),
+        )
+    ]
+
+def get_spiSDcard_io():
+    return [
+        ("spisdcard", 0,
+            Subsignal("clk",  Pins(f"{pmod}:3")),
+            Subsignal("mosi", Pins(f"{pmod}:1"), Misc("PULLUP=true")),
+            Subsignal("cs_n", Pins(f"{pmod}:0"), Misc("PULLUP=true")),
+            Subsignal("miso", Pins(f"{pmod}:2"), Misc("PULLUP=true")),
+        )
+    ]
+
+def get_debug_ios(debug_width=8):
+    return [
+        ("debug", 0, Pins(debug_width)),
+    ]
+
+# Platform -----------------------------------------------------------------------------------------
+
+class Platform(GenericPlatform):
+    def build(self, fragment, build_dir, build_name, **kwargs):
+        profiler = getattr(self, "profiler", NullProfiler())
+        os.makedirs(build_dir, exist_ok=True)
+        with profiler.stage("get_verilog"):
+            conv_output = self.get_verilog(fragment, name=build_name)
+        with profiler.stage("write_verilog"):
+            write_conv_output(conv_output, build_dir, build_name)
+            #hierarchical mode: the submodules split off in LiteXSoCGenerator.finalize()
+            self.output_files = hierarchy.write_modules(fragment.hierarchy, build_dir, build_name) \
+                if getattr(fragment, "hierarchy", None) else []
+
+def vendor_platform(base, **kwargs):
+    #the build() above (Verilog only, no toolchain scripts) on top of a vendor platform,
+    #which is still needed to lower the vendor specials (AsyncResetSynchronizer etc.) of the CRG
+    return type(base.__name__, (Platform, base), {})(**kwargs)
+
+def write_conv_output(conv_output, build_dir, build_name):
+    #Same as conv_output.write(), but without having to os.chdir() into build_dir first.
+    #That would change the cwd for the whole process, which breaks generating several SoCs
+    #in one process (generator_server.py, generator_sweep.py).
+    with open(os.path.join(build_dir, f"{build_name}.v"), "w") as f:
+        f.write(conv_output.main_source)
+    for filename, content in conv_output.data_files.items():
+        with open(os.path.join(build_dir, filename), "w") as f:
+            f.write(content)
+        
+# LiteX SoC Generator ------------------------------------------------------------------------------
+#added some arguments to the SoCGenerator Class
+class LiteXSoCGenerator(SoCMini):
+    #the bus adapters LiteX inserts are recorded for converter_report(), see generator_aux_bus.py
+    @tracking_adapters
+    def __init__(self, profiler=None, **kwargs):
+        #stages of the elaboration are recorded if a profiler is given (see generator_aux_profile.py)
+        self.profiler = profiler = NullProfiler() if profiler is None else profiler
+        #hierarchical Verilog output, see generator_aux_hierarchy.py
+        self.hierarchical = kwargs.get('hierarchical', False)
+        self.hierarchy_deferred = []
+        self.hierarchy = {}
+        #wrappers of the previous run that may be reused, set by run_generation()
+        self.hierarchy_reuse = None
+        self.hierarchy_jobs = kwargs.get('hierarchy_jobs')
+        #static resource/depth estimate, only on request (see generator_aux_resources.py)
+        self.resource_report = kwargs.get('resource_report', False)
+        self.resources = None
+        #provide default value for name and clock frequency if not available
+        name = "litex_soc" if kwargs['name'] is None else kwargs['name']   
+        sys_clk_freq = int(50e6) if kwargs['sys_clk_freq'] is None else int(kwargs['sys_clk_freq'])
+        base_io=get_common_ios()     #start with minimal io for all platforms
+        
+        # Platform and CRG ---------------------------------------------------------------------------------     
+        #Use generic platform unless specified. For now, platform only required for CRG.
+        if not kwargs.get('auto_pll'):
+            platform = Platform(device="", io=base_io)
+            #Use dummy CRG for generic platform. User must take care of clocking.
+            self.submodules.crg = CRG( 
+                clk = platform.request("clk"), 
+                rst = platform.request("rst"),
+            )
+        else:
+            ref_clk_freq = int(kwargs['ref_clk_freq'])
+            if kwargs['device'] is None:
+                raise ValueError(
+                    "No device selected. This shouldn't happen. Did someone edit the config by hand?")
+            else:
+                device = kwargs['device']
+                #the Xilinx CRGs have their own default speedgrade
+                xilinx = {} if kwargs.get('speedgrade') is None else {"speedgrade": kwargs['speedgrade']}
+                #TODO: Maybe add more specific device options; may be relevant e.g. for iCE40 devices
+                match (device):
+                    case "Gatemate":
+                        from litex.build.colognechip.platform import CologneChipPlatform
+                        platform = vendor_platform(CologneChipPlatform, device="CCGM1A1", io=base_io, toolchain="peppercorn")
+                        self.crg = _CRG_CCGM(platform, sys_clk_freq, ref_clk_freq)
+                    case "LatticeECP5":
+                        from litex.build.lattice import LatticeECP5Platform
+                        platform = vendor_platform(LatticeECP5Platform, device="DUMMY", io=base_io, toolchain="diamond")
+                        #note: I put the "diamond" toolchain so that litex shuts up
+                        self.crg = _CRG_LatticeECP5(platform, sys_clk_freq, ref_clk_freq)
+                    case "iCE40":
+                        from litex.build.lattice import LatticeiCE40Platform
+                        platform = vendor_platform(LatticeiCE40Platform, device="DUMMY", io=base_io, toolchain="icestorm")
+                        self.crg = _CRGLatticeiCE40(platform, sys_clk_freq, ref_clk_freq)
+                    case "XilinxS7":
+                        from litex.build.xilinx import Xilinx7SeriesPlatform
+                        platform = vendor_platform(Xilinx7SeriesPlatform, device="DUMMY", io=base_io, toolchain="vivado")
+                        self.crg = _CRG_Xilinx7Series(platform, sys_clk_freq, ref_clk_freq, **xilinx)
+                    case "XilinxS6":
+                        from litex.build.xilinx import XilinxSpartan6Platform
+                        platform = vendor_platform(XilinxSpartan6Platform, device="DUMMY", io=base_io, toolchain="vivado")
+                        self.crg = _CRG_XilinxSpartan6(platform, sys_clk_freq, ref_clk_freq, **xilinx)
+                    case "XilinxUS":
+                        from litex.build.xilinx import XilinxUSPlatform
+                        platform = vendor_platform(XilinxUSPlatform, device="DUMMY", io=base_io, toolchain="vivado")
+                        self.crg = _CRG_XilinxUltrascale(platform, sys_clk_freq, ref_clk_freq, **xilinx)
+                    case "XilinxUSP":
+                        from litex.build.xilinx import XilinxUSPPlatform
+                        platform = vendor_platform(XilinxUSPPlatform, device="DUMMY", io=base_io, toolchain="vivado")
+                        self.crg = _CRG_XilinxUltrascalePlus(platform, sys_clk_freq, ref_clk_freq, **xilinx)
+                    case _:
+                        print("It ... it can't be. This shouldn't be possible! How did we get here without specifying a device?")
+                        raise ValueError("{} is not a recognized device type.".format(device))
+            #solved PLL configurations are reused across generations, see generator_aux_pll.py
+            self.pll_cache = PLLCache(kwargs.get('pll_cache'))
+            self.pll_cache.attach(self.crg.pll, name="crg")
+        platform.name = name
+        platform.profiler = profiler
+        #more clock domains for external modules, from the PLL or from outside (see ExtraClockDomains)
+        if kwargs.get('clock_domains'):
+            self.crg_extra = ExtraClockDomains(platform, kwargs['clock_domains'],
+                pll = self.crg.pll if kwargs.get('auto_pll') else None)
+        # SoC --------------------------------------------------------------------------------------
+        platform.add_extension(get_uart_ios())
+        
+        if kwargs["uart_name"] == "serial":
+            kwargs["uart_name"] = "uart"
+        #TODO: Check for useful UART options
+           
+        with profiler.stage("soc_core"):
+            SoCCore.__init__(self, platform, clk_freq=sys_clk_freq, ident=f"LiteX standalone SoC - {name}", **kwargs)
+        
+        """ 
+        Currently the implementation is minimalistic. It may make sense to make
+        the whole thing more dynamic, however that will require more complex 
+        inputs as well.
+        For now, this serves mostly to experiment with this and give the base-SoC 
+        more functionality of its own.
+        As the designs are usually flattened into a single verilog file, it may
+        be best to limit the base-SoC functionality and keep complex parts,
+        which may require later editing in Verilog, separate.
+        """        
+        if kwargs['soft_i2c']:
+            with profiler.stage("peripherals/soft_i2c"):
+                platform.add_extension(get_i2c_io())
+                from litex.soc.cores.bitbang import I2CMaster
+                self.add_module(name="i2c", module=I2CMaster(platform.request("i2cmaster")))
+        
+        if kwargs['hard_i2c']:
+        #TODO: Check if implementing custom name for i2c master is worthwhile
+            with profiler.stage("peripherals/hard_i2c"):
+                if kwargs['i2c_interrupt']:
+                    platform.add_extension(get_i2c_io())
+                    self.add_i2c_master(with_irq=True) #sends interrupt when rx_ready
+                else:
+                    platform.add_extension(get_i2c_io())
+                    self.add_i2c_master()
+            
+        if kwargs['hard_spi']:    
+            with profiler.stage("peripherals/hard_spi"):
+                platform.add_extension(get_spi_master_io())
+                self.add_spi_master()
+        
+        if kwargs['soft_spi']:
+            with profiler.stage("peripherals/soft_spi"):
+                platform.add_extension(get_spi_master_io())
+                from litex.soc.cores.bitbang import SPIMaster
+                self.spi = SPIMaster(platform.request("spimaster"))
+
+        if kwargs['SDcard']:
+            with profiler.stage("peripherals/SDcard"):
+                platform.add_extension(get_SDcard_io())
+                self.add_sdcard()
+
+        """
+        I'm preparing some addittional functionality here that shall be kept inactive until the
+        relevant fields are added to the GUI.  
+
+        if kwargs['spi_sdcard']:
+            platform.add_extension(get_spiSDcard_io())
+            self.add_spi_sdcard()
+        """ 
+        
+        if kwargs['external_modules']:  #check for entries in external_modules
+            for i in kwargs['external_modules']:
+                vlog_src = kwargs['external_modules'][i]['source']
+                mod_name = kwargs['external_modules'][i]['module_name']     #see above
+                inst_name = kwargs['external_modules'][i]['instance_name']  #using this for now
+                ports = kwargs['external_modules'][i]['ports']
+                params = kwargs['external_modules'][i]['parameters']
+                pack = kwargs['external_modules'][i].get('pack_csr', False)
+                window = {k: kwargs['external_modules'][i].get(k) for k in ["bus_interface", "bus_origin", "bus_size"]}
+                clock_domain = kwargs['external_modules'][i].get('clock_domain') or "sys"
+                
+                with profiler.stage(f"external_modules/{inst_name}"):
+                    #check if vlog_src is given (currently used to distignuish internal and external)
+                    if vlog_src is None:    #"None" in the config file, see normalize_config
+                        CSRwrap = GenericCSR(ports, params, soc=self, instance_name=inst_name,
+                            burst_length=kwargs.get('dma_burst_length'), pack=pack, clock_domain=clock_domain)
+                        platform.add_extension(make_io(inst_name, ports))
+                        self.add_module(name=inst_name, module=CSRwrap)
+                        if clock_domain != "sys":
+                            #the ports change with this clock, whatever is connected to them needs it
+                            platform.add_extension([(inst_name + "_clk", 0, Pins(1))])
+                            self.comb += platform.request(inst_name + "_clk").eq(ClockSignal(clock_domain))
+                        for k in ports:
+                            connector = "con_" + ports[k]['name'];
+                            io_portname = inst_name + "_" + ports[k]['name'] #name of the generated external io
+                            if ports[k].get('type') == "stream":
+                                pads = platform.request(io_portname)
+                                ep = getattr(CSRwrap, connector)
+                                if ports[k]['direction'] == "in":
+                                    self.comb += [pads.tdata.eq(ep.data), pads.tvalid.eq(ep.valid),
+                                        pads.tlast.eq(ep.last), ep.ready.eq(pads.tready)]
+                                else:
+                                    self.comb += [ep.data.eq(pads.tdata), ep.valid.eq(pads.tvalid),
+                                        ep.last.eq(pads.tlast), pads.tready.eq(ep.ready)]
+                                if ports[k].get('async'):
+                                    self.comb += getattr(CSRwrap, ports[k]['name']).cd.clk.eq(pads.aclk)
+                            elif ports[k]['direction'] == "in":  #input of external module means output of SoC
+                                self.comb += platform.request(io_portname).eq(
+                                    getattr(getattr(self, inst_name), connector))
+                            elif ports[k]['direction'] == "out":
+                                self.comb += getattr(getattr(self, inst_name), connector).eq(
+                                    platform.request(io_portname))
+                            #TODO: Check if support for "inout" is worthwhile
+                            #elif ports[k]['direction'] == "inout": 
+                            else:
+                                print("Missing directions for external ports!")
+                
+                    else:   #NOTE: for now I assume that configs will always be valid
+                        CSRwrap = GenericVlogModuleCSR(params, ports, platform, mod_name, inst_name, vlog_src,
+                            soc=self, burst_length=kwargs.get('dma_burst_length'), pack=pack, clock_domain=clock_domain, **window)
+                        self.add_module(name=inst_name, module=CSRwrap)                    
+                    #stream ports and "out" ports with irq come with an interrupt (EventManager "ev")
+                    if hasattr(CSRwrap, "ev") and self.irq.enabled:
+                        self.irq.add(inst_name, use_loc_if_exists=True)
+                """
+                On the CSR interface: The way this is designed now, there are two distinct ways of connecting
+                an external (Verilog) Module to the system:
+                1. GenericCSR: This creates top-level ports connecting them to CSRs according to the data
+                               direction. This is primarily designed for such cases where only some of a 
+                               modules ports need to be connected to a CSR.
+                #TODO: Rework method to be more flexible?
+                2. GenericVlogModule: This creates an instance of the external Module within the BaseSoC.
+                                      This is intended for modules that are entirely contained within the
+                                      BaseSoC with no direct connection to the outside world.
+                #TODO: Investigate suitability for LiteX-Cores or possible alternatives
+                       The idea is to add any additional periphery as submodules in the Verilog. So far I
+                       have the impression that Migen/FHDL doesn't do that for Migen/FHDL modules.
+                       Perhaps this can be circumvented by generating the Verilog before adding the thing
+                       here but I'm unsure if that is a good idea...
+                """
+                
+        # DMA Test System --------------------------------------------------------------------------
+        #Memory -> FIFO -> memory test system from generator_aux_DMA.py
+        #dma_burst_length selects the burst engines (use with bus_bursting for burst-capable RAMs)
+        if kwargs.get('dma_test'):
+            with profiler.stage("peripherals/dma_test"):
+                dma_data_width = kwargs.get('dma_test_data_width') or 32
+                self.add_module(name="dma_test", module=WishboneDmaTest(self, name="dma_test", data_width=dma_data_width,
+                    fifo_depth   = kwargs.get('dma_fifo_depth'),
+                    burst_length = kwargs.get('dma_burst_length'),
+                ))
+                if self.irq.enabled:
+                    self.irq.add("dma_test", use_loc_if_exists=True)
+
+        # DMA Bandwidth Benchmark ------------------------------------------------------------------
+        #Memory -> FIFO -> memory with cycle counters, see benchmarks/dma_bandwidth.py
+        if kwargs.get('dma_bench'):
+            with profiler.stage("peripherals/dma_bench"):
+                self.add_module(name="dma_bench", module=WishboneDmaBench(self, name="dma_bench",
+                    data_width   = kwargs.get('dma_bench_data_width') or 32,
+                    fifo_depth   = kwargs.get('dma_bench_fifo_depth') or kwargs.get('dma_fifo_depth') or 256,
+                    burst_length = kwargs.get('dma_burst_length'),
+                ))
+                if self.irq.enabled:
+                    self.irq.add("dma_bench", use_loc_if_exists=True)
+
+        # Scatter-Gather DMA Test System -------------------------------------------------------
+        #Memory -> FIFO -> memory, driven by descriptor rings (WishboneSGDMA)
+        if kwargs.get('sg_dma_test'):
+            with profiler.stage("peripherals/sg_dma_test"):
+                self.add_module(name="sg_dma_test", module=WishboneSGDmaTest(self, name="sg_dma_test",
+                    fifo_depth   = kwargs.get('dma_fifo_depth') or 256,
+                    burst_length = kwargs.get('dma_burst_length'),
+                ))
+                if self.irq.enabled:
+                    self.irq.add("sg_dma_test", use_loc_if_exists=True)
+
+        #Unless an external bus interface is used, these do nothing 
+        bus_width = kwargs['bus_data_width']
+        bus_addr_width = kwargs['bus_address_width']
+        
+        # MMAP Slave Interface ---------------------------------------------------------------------
+        if kwargs['external_bus_slave_interface']:   
+            s_bus = make_bus(kwargs["bus_standard"], bus_width, bus_addr_width)
+            master = s_bus
+            #register slices between the pads and the interconnect, see generator_aux_bus.py
+            if kwargs.get('external_bus_slave_slices'):
+                master = make_bus(kwargs["bus_standard"], bus_width, bus_addr_width)
+                self.mmap_bus_s_slices = RegisterSlices(s_bus, master, kwargs['external_bus_slave_slices'])
+            self.bus.add_master(name="mmap_bus_s", master=master)
+            platform.add_extension(s_bus.get_ios("mmap_bus_s"))
+            wb_pads = platform.request("mmap_bus_s")
+            self.comb += s_bus.connect_to_pads(wb_pads, mode="slave")
+        
+        # MMAP Master Interfaces -------------------------------------------------------------------
+        #one interface per region, see generator_aux_bus.py
+        regions = kwargs.get('external_bus_regions')
+        if not regions and kwargs['external_bus_master_interface']:
+            regions = {k: dict(r, slices=kwargs.get('external_bus_master_slices') or 0)
+                for k, r in DEFAULT_REGIONS.items()}
+        for bus_name, region in (regions or {}).items():
+            add_external_bus(self, platform, bus_name, region, kwargs["bus_standard"], bus_width, bus_addr_width)
+        
+        # Debug ------------------------------------------------------------------------------------
+        platform.add_extension(get_debug_ios())
+        debug_pads = platform.request("debug")
+        self.comb += [
+            # Export Signal(s) for debug.
+            debug_pads[0].eq(0), # 0.
+            debug_pads[1].eq(1), # 1.
+            # Etc...
+        ]
+
+    @tracking_adapters
+    def finalize(self):
+        #CSR bank/bus/IRQ allocation happens here, profile it as its own stage
+        if self.finalized:
+            return
+        with self.profiler.stage("finalize"):
+            SoCCore.finalize(self)
+        #static resource/depth estimate, before split() lowers the fragments of hierarchical mode
+        if self.resource_report:
+            with self.profiler.stage("resources"):
+                self.resources = resources.analyze(self)
+        if self.hierarchical:
+            with self.profiler.stage("hierarchy"):
+                self.hierarchy = hierarchy.split(self, self.platform.name, self.hierarchy_deferred, self.platform,
+                    reuse=self.hierarchy_reuse, workers=self.hierarchy_jobs)
+
+    def _collect_submodules(self):
+        subfragments = SoCCore._collect_submodules(self)
+        if getattr(self, "hierarchical", False):
+            subfragments = hierarchy.defer(subfragments, self.hierarchy_deferred)
+        return subfragments
+
+# Build --------------------------------------------------------------------------------------------
+#reports in output_dir that only some configs produce (resource_report, auto_pll)
+OPTIONAL_REPORTS = ["resources.json", "pll_report.json"]
+
+def generate(args, profiler=None):
+    """
+    Elaborate and emit a single SoC from an already loaded config (see read_config_file).
+    This is what main() does for the config file, but it is kept separate so that a 
+    long-running process (see generator_server.py) can call it once per request without
+    paying for the LiteX/Migen imports again. Returns the output directories.
+    Unless "profile" is set to False, a stage profile is written to the output directory.
+    """
+    profiler = GenerationProfiler() if profiler is None else profiler
+    if args.get('profile_cprofile'):
+        profiler.enable_cprofile()
+    try:
+        dirs = run_generation(args, profiler)
+    finally:
+        profiler.disable_cprofile()
+    if args.get('profile') is not False:
+        profiler.write(dirs["output_dir"], name=args['name'])
+    return dirs
+
+def run_generation(args, profiler):
+    #Output reuse: compare against the fingerprints of the previous run in the same output_dir
+    if args.get('reuse_output'):
+        output_dir = reuse.get_output_dir(args)
+        with profiler.stage("reuse_check"):
+            fingerprint = reuse.fingerprint_config(args)
+            previous = reuse.read_manifest(output_dir)
+            report = reuse.compare(previous, fingerprint)
+        reuse.print_report(report, hierarchical=args.get('hierarchical', False))
+        if reuse.can_reuse(previous, report):
+            dirs = previous["dirs"]
+            reuse.write_manifest(output_dir, fingerprint, dirs)
+            print(f"Output reuse: previous output in {dirs['output_dir']} is still valid")
+            return dirs
+
+    #Generation cache (only if cache_dir is set): on a hit, skip elaboration entirely
+    cache = GenerationCache.from_config(args)
+    if cache is not None:
+        with profiler.stage("cache_lookup"):
+            cache_key = cache.key(args)
+            dirs = cache.restore(cache_key, optional_outputs=OPTIONAL_REPORTS)
+        if dirs is not None:
+            print(f"Generation cache hit ({cache_key[:12]}), restored {dirs['output_dir']}")
+            if args.get('reuse_output'):
+                reuse.write_manifest(output_dir, fingerprint, dirs)
+            return dirs
+
+    # SoC.
+    with profiler.stage("elaborate"):
+        soc = LiteXSoCGenerator(
+            profiler=profiler,
+            **args
+        )
+    
+    # Build
+    builder = Builder(soc, **builder_arg_filter(**args))
+    if args.get('reuse_output') and soc.hierarchical:
+        #unchanged external_modules wrappers aren't converted again, see generator_aux_hierarchy.py
+        soc.hierarchy_reuse = {"dir": builder.gateware_dir, "fingerprints": reuse.wrapper_fingerprints(fingerprint)}
+    #anything in gateware_dir that the build doesn't touch is left alone by the cleanup below
+    gateware_before = staging.snapshot(builder.gateware_dir)
+    #TODO: Check if this is the best setting here...
+    #builder.build(build_name=args['name'], run=args['build'])
+    with profiler.stage("build"):
+        builder.build(build_name=args['name'], run=False)
+        if builder.csr_json:
+            add_csr_fields(builder.csr_json, soc)
+    if soc.hierarchy_reuse is not None:
+        wrappers = {name: getattr(conv, "reused", False) for name, conv in soc.hierarchy.items()
+            if conv.fingerprint is not None}
+        print(f"Output reuse: {sum(wrappers.values())} of {len(wrappers)} external module wrappers "
+              f"reused, converted: {', '.join(sorted(n for n, r in wrappers.items() if not r)) or '-'}")
+
+    #reports in output_dir, stored in the generation cache with the rest of the output
+    reports = []
+    def write_report(filename, report):
+        path = os.path.join(builder.output_dir, filename)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=1)
+        reports.append(path)
+
+    #width/standard converters between the main bus and everything else, see generator_aux_bus.py
+    converters = converter_report(soc)
+    print(format_converter_report(converters))
+    write_report("bus_converters.json", converters)
+
+    #flip-flops, memory bits, multiplexers and logic depth per submodule, see generator_aux_resources.py
+    if soc.resources is not None:
+        print(resources.format_report(soc.resources))
+        write_report("resources.json", soc.resources)
+
+    #auto_pll: the PLL configuration was searched (or looked up) while finalizing the SoC
+    pll_cache = getattr(soc, "pll_cache", None)
+    if pll_cache is not None:
+        pll_cache.save()
+        pll_report = pll_cache.report()
+        print(format_pll_report(pll_report))
+        write_report("pll_report.json", pll_report)
+
+    #left from an earlier config in the same output_dir
+    for filename in OPTIONAL_REPORTS:
+        path = os.path.join(builder.output_dir, filename)
+        if path not in reports and os.path.exists(path):
+            os.remove(path)
+    
+    #Copy source of e.g. CPU hardware to output directory (concurrently, unchanged files are skipped)
+    with profiler.stage("copy_sources"):
+        staged = staging.stage_sources(
+            [filepath for filepath, language, library, *copy in builder.soc.platform.sources],
+            builder.gateware_dir,
+            allow_hardlink = args.get('staging_hardlinks', False),
+        )
+    print(staging.format_report(staged))
+      
+    """TODO: Think of how to handle the generated gateware build-scripts
+       Litex will auto-generate build scripts if I give the platfrom and toolchain for
+       the automated CRG functionality. These likely will not work properly, as I have
+       done nothing to ensure they do, while using Litex in an unconventional way.
+       
+       The simplest way to deal with this is to just delete them, but that is inelegant
+       and inefficient. Maybe they could be kept as part of some sort of "advanced mode"
+       that can be activated in the GUI.
+    """
+    #For now: Clear build scripts from gateware_dir to avoid confusion 
+    with profiler.stage("cleanup"):
+        staging.remove_generated(builder.gateware_dir, gateware_before, keep=staged["files"] +
+            [os.path.join(builder.gateware_dir, f) for f in getattr(soc.platform, "output_files", [])])
+
+    dirs = {
+        "output_dir"    : builder.output_dir,
+        "gateware_dir"  : builder.gateware_dir,
+        "software_dir"  : builder.software_dir,
+        "include_dir"   : builder.include_dir,
+        "generated_dir" : builder.generated_dir,
+    }
+    if cache is not None:
+        #everything that was written for this SoC: gateware, exports and software headers
+        files = [os.path.join(builder.gateware_dir, f) for f in os.listdir(builder.gateware_dir)]
+        files += [f for f in [builder.csr_json, builder.csr_csv, builder.csr_svd, builder.memory_x] if f]
+        files += reports
+        if os.path.isdir(builder.generated_dir):
+            files += [os.path.join(builder.generated_dir, f) for f in os.listdir(builder.generated_dir)]
+        with profiler.stage("cache_store"):
+            cache.store(cache_key, dirs, files)
+        stats = cache.stats()
+        print(f"Generation cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} entries ({stats['size']} bytes)")
+    if args.get('reuse_output'):
+        reuse.write_manifest(output_dir, fingerprint, dirs)
+    return dirs
+
+def main():
+    #TODO: Implement option for arbitrary file name? 'configFile_output.yaml'
+    profiler = GenerationProfiler()
+    with profiler.stage("read_config"):
+        try:
+            args = read_config_file('configFile_demo_soc.yaml')
+            #args = read_config_file('soc_test_new.yaml')
+        except ConfigError as e:
+            print(e)
+            sys.exit(1)
+    generate(args, profiler)
+            
+#Auxiliary Methods ------------------------------------------------------------------------------
+def read_config_file(filename):     
+    #validation and conversion of YAML elements to Python/LiteX live in generator_aux_config.py
+    return normalize_config(load_config_file(filename))
+
+def builder_arg_filter(**kwargs):
+    #Set of arguments must be reduced to relevant options for builder
+    valid_keys = [
+        #Directories
+        "output_dir", "gateware_dir", "software_dir", "include_dir",
+        "generated_dir",
+        #Compilation
+        "compile_software", "compile_gateware", "build_backend",
+        #Exports
+        "csr_json", "csr_csv", "csr_svd", "memory_x",
+        #BIOS
+        "bios_lto", "bios_format", "bios_console",
+        #Documentation
+        "generate_doc"
+    ]
+    valid_args = {}
+    for arg_key in kwargs.keys():
+        for v_key in valid_keys:
+            if v_key == arg_key:
+                valid_args.update({v_key: kwargs[v_key]})
+    #TODO: Add option for compile software?
+    #valid_args.update({"compile_software" : True})
+    valid_args.update({"compile_gateware" : False})
+    
+    return valid_args     
+
+  
+    
+if __name__ == "__main__":
+    main()